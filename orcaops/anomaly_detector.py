@@ -22,6 +22,13 @@ from orcaops.schemas import (
 )
 
 
+def _z_score(value: float, mean: float, stddev: float) -> float:
+    """Calculate z-score. Returns 0.0 if stddev is 0."""
+    if stddev <= 0:
+        return 0.0
+    return (value - mean) / stddev
+
+
 class AnomalyDetector:
     """Detects anomalies by comparing job results against baselines."""
 
@@ -67,7 +74,7 @@ class AnomalyDetector:
             return None
 
         duration = (record.finished_at - record.started_at).total_seconds()
-        z = self._z_score(duration, baseline.duration_mean, baseline.duration_stddev)
+        z = _z_score(duration, baseline.duration_mean, baseline.duration_stddev)
 
         if abs(z) <= 2:
             return None
@@ -174,12 +181,7 @@ class AnomalyDetector:
             actual=f"{baseline.success_rate * 100:.0f}%",
         )
 
-    @staticmethod
-    def _z_score(value: float, mean: float, stddev: float) -> float:
-        """Calculate z-score. Returns 0.0 if stddev is 0."""
-        if stddev <= 0:
-            return 0.0
-        return (value - mean) / stddev
+    _z_score = staticmethod(_z_score)
 
 
 class AnomalyStore:
@@ -190,6 +192,9 @@ class AnomalyStore:
             "~/.orcaops/anomalies"
         )
         self._lock = threading.Lock()
+        # path -> ((mtime_ns, size), records parsed from that file)
+        self._file_cache: Dict[str, Tuple[Tuple[int, int], List[AnomalyRecord]]] = {}
+        self._cache_lock = threading.Lock()
 
     def store(self, anomaly: AnomalyRecord) -> None:
         """Append anomaly to date-based JSONL file."""
@@ -229,58 +234,78 @@ class AnomalyStore:
     def acknowledge(self, anomaly_id: str) -> bool:
         """Mark an anomaly as acknowledged by rewriting its JSONL file."""
         with self._lock:
-            if not os.path.isdir(self.anomalies_dir):
+            self._scan_all()
+            with self._cache_lock:
+                fpath = next(
+                    (
+                        path for path, (_, records) in self._file_cache.items()
+                        if any(r.anomaly_id == anomaly_id for r in records)
+                    ),
+                    None,
+                )
+            if fpath is None:
                 return False
 
-            for fname in os.listdir(self.anomalies_dir):
-                if not fname.endswith(".jsonl"):
-                    continue
-                fpath = os.path.join(self.anomalies_dir, fname)
-                lines = []
-                found = False
-                with open(fpath, "r") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            record = AnomalyRecord.model_validate_json(line)
-                            if record.anomaly_id == anomaly_id:
-                                record.acknowledged = True
-                                found = True
-                            lines.append(record.model_dump_json())
-                        except Exception:
-                            lines.append(line)
-
-                if found:
-                    with open(fpath, "w") as f:
-                        for ln in lines:
-                            f.write(ln + "\n")
-                    return True
-
-            return False
+            lines = []
+            found = False
+            with open(fpath, "r") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = AnomalyRecord.model_validate_json(line)
+                        if record.anomaly_id == anomaly_id:
+                            record.acknowledged = True
+                            found = True
+                        lines.append(record.model_dump_json())
+                    except Exception:
+                        lines.append(line)
+
+            if found:
+                with open(fpath, "w") as f:
+                    for ln in lines:
+                        f.write(ln + "\n")
+            return found
 
     def _scan_all(self) -> List[AnomalyRecord]:
-        """Scan all JSONL files for anomalies."""
+        """Return all stored anomalies, re-parsing only JSONL files that changed."""
+        try:
+            with os.scandir(self.anomalies_dir) as it:
+                entries = [
+                    (entry.path, entry.stat())
+                    for entry in it
+                    if entry.name.endswith(".jsonl") and entry.is_file()
+                ]
+        except OSError:
+            return []
+
         records: List[AnomalyRecord] = []
-        if not os.path.isdir(self.anomalies_dir):
-            return records
-
-        for fname in sorted(os.listdir(self.anomalies_dir), reverse=True):
-            if not fname.endswith(".jsonl"):
-                continue
-            fpath = os.path.join(self.anomalies_dir, fname)
-            try:
-                with open(fpath, "r") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            records.append(AnomalyRecord.model_validate_json(line))
-                        except Exception:
-                            continue
-            except OSError:
-                continue
+        with self._cache_lock:
+            for path, st in sorted(entries, reverse=True):
+                version = (st.st_mtime_ns, st.st_size)
+                cached = self._file_cache.get(path)
+                if cached is None or cached[0] != version:
+                    cached = (version, self._parse_file(path))
+                    self._file_cache[path] = cached
+                records.extend(cached[1])
+            for stale in self._file_cache.keys() - {path for path, _ in entries}:
+                del self._file_cache[stale]
+        return records
 
+    @staticmethod
+    def _parse_file(path: str) -> List[AnomalyRecord]:
+        records: List[AnomalyRecord] = []
+        try:
+            with open(path, "r") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        records.append(AnomalyRecord.model_validate_json(line))
+                    except Exception:
+                        continue
+        except OSError:
+            pass
         return records
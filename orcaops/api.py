@@ -76,7 +76,7 @@ from orcaops.metrics import MetricsAggregator, BaselineTracker
 from orcaops.workflow_manager import WorkflowManager
 from orcaops.workflow_store import WorkflowStore
 from orcaops.workflow_schema import WorkflowValidationError
-from orcaops.workspace import WorkspaceRegistry
+from orcaops.workspace import WorkspaceRegistry, WorkspaceRegistryIOError
 from orcaops.auth import KeyManager
 from orcaops.auth_middleware import set_key_manager
 from orcaops.session_manager import SessionManager
@@ -959,6 +959,8 @@ async def create_workspace(req: WorkspaceCreateRequest):
         return WorkspaceResponse(workspace=ws, message="Workspace created.")
     except ValueError as e:
         raise HTTPException(status_code=409, detail=str(e))
+    except WorkspaceRegistryIOError as e:
+        raise HTTPException(status_code=503, detail=str(e))
 
 
 @router.get("/workspaces", response_model=WorkspaceListResponse, summary="List workspaces")
@@ -992,12 +994,18 @@ async def update_workspace(workspace_id: str, req: WorkspaceUpdateRequest):
         return WorkspaceResponse(workspace=ws, message="Workspace updated.")
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except WorkspaceRegistryIOError as e:
+        raise HTTPException(status_code=503, detail=str(e))
 
 
 @router.delete("/workspaces/{workspace_id}", summary="Archive workspace")
 async def archive_workspace(workspace_id: str):
     """Archive (soft-delete) a workspace."""
-    if not workspace_registry.archive_workspace(workspace_id):
+    try:
+        archived = workspace_registry.archive_workspace(workspace_id)
+    except WorkspaceRegistryIOError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    if not archived:
         raise HTTPException(status_code=404, detail=f"Workspace '{workspace_id}' not found.")
     return {"workspace_id": workspace_id, "status": "archived", "message": "Workspace archived."}
 
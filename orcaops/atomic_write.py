@@ -0,0 +1,59 @@
+"""Atomic file replacement for small state files (sessions, workflows, workspaces)."""
+
+import os
+import tempfile
+
+# Linux-only: an unnamed inode in the target directory that can be linked
+# into place once fully written, so a crash mid-write leaves nothing behind.
+# linkat cannot overwrite, so it is only used to create new files.
+_O_TMPFILE = getattr(os, "O_TMPFILE", None)
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """Atomically replace ``path`` with ``data``. Raises OSError on failure."""
+    if _O_TMPFILE is not None and not os.path.lexists(path):
+        try:
+            fd = os.open(os.path.dirname(path) or ".", _O_TMPFILE | os.O_WRONLY, 0o600)
+        except OSError:
+            pass  # Filesystem without O_TMPFILE support
+        else:
+            try:
+                _write_all(fd, data)
+                if _link_into_place(fd, path):
+                    return
+            finally:
+                os.close(fd)
+
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        try:
+            _write_all(fd, data)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _link_into_place(fd: int, path: str) -> bool:
+    """Link an O_TMPFILE inode at ``path``.
+
+    Returns False if /proc is unusable or ``path`` was created meanwhile.
+    """
+    try:
+        os.link(f"/proc/self/fd/{fd}", path)
+        return True
+    except OSError:
+        return False
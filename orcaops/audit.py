@@ -1,11 +1,10 @@
 """Audit logging — thread-safe JSONL-based event logging with date-based files."""
 
-import json
 import os
 import threading
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, TextIO, Tuple
 
 from orcaops.schemas import AuditAction, AuditEvent, AuditOutcome
 
@@ -17,17 +16,44 @@ class AuditLogger:
         self._dir = audit_dir or os.path.expanduser("~/.orcaops/audit")
         os.makedirs(self._dir, exist_ok=True)
         self._lock = threading.Lock()
+        # Append handle for the most recently written day's file
+        self._file: Optional[TextIO] = None
+        self._file_path: Optional[str] = None
 
     def log(self, event: AuditEvent) -> None:
         """Append an audit event to the date-based JSONL file."""
         date_str = event.timestamp.strftime("%Y-%m-%d")
         path = os.path.join(self._dir, f"{date_str}.jsonl")
+        line = event.model_dump_json() + "\n"
         with self._lock:
             try:
-                with open(path, "a", encoding="utf-8") as f:
-                    f.write(event.model_dump_json() + "\n")
+                # Reopen for a new day, or if the file was removed under us
+                if path != self._file_path or os.fstat(self._file.fileno()).st_nlink == 0:
+                    self._close_file()
+                    self._file = open(path, "a", encoding="utf-8")
+                    self._file_path = path
+                self._file.write(line)
+                # Flushed per event so AuditStore readers see it immediately
+                self._file.flush()
+            except OSError:
+                self._close_file()
+
+    def close(self) -> None:
+        """Close the open log file, if any."""
+        with self._lock:
+            self._close_file()
+
+    def __del__(self) -> None:
+        self._close_file()
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
             except OSError:
                 pass
+        self._file = None
+        self._file_path = None
 
     def log_action(
         self,
@@ -63,6 +89,9 @@ class AuditStore:
 
     def __init__(self, audit_dir: Optional[str] = None):
         self._dir = audit_dir or os.path.expanduser("~/.orcaops/audit")
+        # path -> ((mtime_ns, size), events parsed from that file)
+        self._file_cache: Dict[str, Tuple[Tuple[int, int], List[AuditEvent]]] = {}
+        self._cache_lock = threading.Lock()
 
     def query(
         self,
@@ -117,34 +146,60 @@ class AuditStore:
         after: Optional[datetime] = None,
         before: Optional[datetime] = None,
     ) -> List[AuditEvent]:
-        """Load events from JSONL files, optionally filtering by date range."""
-        if not os.path.isdir(self._dir):
+        """Load events from JSONL files, optionally filtering by date range.
+
+        Parsed files are cached by ``(mtime_ns, size)``, so only files that
+        were appended to or replaced since the last query are re-read.
+        """
+        try:
+            with os.scandir(self._dir) as it:
+                entries = sorted(
+                    (entry.name, entry.path, entry.stat())
+                    for entry in it
+                    if entry.name.endswith(".jsonl") and entry.is_file()
+                )
+        except OSError:
             return []
 
+        after_str = after.strftime("%Y-%m-%d") if after else None
+        before_str = before.strftime("%Y-%m-%d") if before else None
+
         events: List[AuditEvent] = []
-        for filename in sorted(os.listdir(self._dir)):
-            if not filename.endswith(".jsonl"):
-                continue
-            # Date-based filtering on filenames
-            date_part = filename.replace(".jsonl", "")
-            if after and date_part < after.strftime("%Y-%m-%d"):
-                continue
-            if before and date_part > before.strftime("%Y-%m-%d"):
-                continue
+        with self._cache_lock:
+            for filename, path, st in entries:
+                # Date-based filtering on filenames
+                date_part = filename.replace(".jsonl", "")
+                if after_str and date_part < after_str:
+                    continue
+                if before_str and date_part > before_str:
+                    continue
+
+                version = (st.st_mtime_ns, st.st_size)
+                cached = self._file_cache.get(path)
+                if cached is None or cached[0] != version:
+                    cached = (version, self._parse_file(path))
+                    self._file_cache[path] = cached
+                events.extend(cached[1])
+            for stale in self._file_cache.keys() - {path for _, path, _ in entries}:
+                del self._file_cache[stale]
 
-            path = os.path.join(self._dir, filename)
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            data = json.loads(line)
-                            events.append(AuditEvent.model_validate(data))
-                        except (json.JSONDecodeError, ValueError):
-                            pass
-            except OSError:
-                pass
+        return events
 
+    @staticmethod
+    def _parse_file(path: str) -> List[AuditEvent]:
+        events: List[AuditEvent] = []
+        try:
+            with open(path, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    # Parsed straight from bytes by pydantic-core; a bad
+                    # line raises ValidationError (a ValueError)
+                    try:
+                        events.append(AuditEvent.model_validate_json(line))
+                    except ValueError:
+                        pass
+        except OSError:
+            pass
         return events
@@ -1,13 +1,14 @@
 """API key management — generation, hashing, validation, and role templates."""
 
-import json
+import hashlib
+import hmac
 import os
 import re
 import secrets
 import tempfile
 import threading
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Collection, Dict, FrozenSet, List, Optional, Tuple
 
 import bcrypt
 
@@ -44,19 +45,48 @@ ROLE_TEMPLATES: Dict[str, List[Permission]] = {
 }
 
 
-def has_permission(permissions: List[Permission], required: Permission) -> bool:
-    """Check whether *permissions* satisfy *required*, respecting inheritance."""
+def has_permission(permissions: Collection[Permission], required: Permission) -> bool:
+    """Check whether *permissions* satisfy *required*, respecting inheritance.
+
+    Accepts any collection, so callers holding a frozenset get O(1) lookups
+    and callers holding a model's list need not copy it first.
+    """
     if Permission.WORKSPACE_ADMIN in permissions:
         return True
     return required in permissions
 
 
+# New keys are stored as a SHA-256 digest of the 128-bit random key; older
+# key files still carry bcrypt hashes and keep validating.
+_SHA256_PREFIX = "sha256:"
+
+
+def _hash_key(plain_key: str) -> str:
+    return _SHA256_PREFIX + hashlib.sha256(plain_key.encode()).hexdigest()
+
+
+def _verify_key(plain_key: str, key_hash: str) -> bool:
+    if key_hash.startswith(_SHA256_PREFIX):
+        return hmac.compare_digest(_hash_key(plain_key), key_hash)
+    try:
+        return bcrypt.checkpw(plain_key.encode(), key_hash.encode())
+    except ValueError:
+        return False
+
+
 class KeyManager:
     """Thread-safe API key manager backed by JSON files."""
 
     def __init__(self, keys_base_dir: Optional[str] = None):
         self._base = keys_base_dir or os.path.expanduser("~/.orcaops/workspaces")
         self._lock = threading.Lock()
+        # sha256 key_hash -> key_id.  A key's hash never changes, so entries
+        # only go stale when a key file is deleted, which falls back to a scan.
+        self._hash_index: Dict[str, str] = {}
+        # workspace_id -> (key file names, has bcrypt keys) as of the last
+        # full scan.  While no key file was added and none holds a bcrypt
+        # hash, a hash missing from the index cannot match any key.
+        self._scanned: Dict[str, Tuple[FrozenSet[str], bool]] = {}
 
     # --- public API ---
 
@@ -80,7 +110,7 @@ class KeyManager:
         raw_secret = secrets.token_hex(16)
         plain_key = f"orcaops_{workspace_id}_{raw_secret}"
 
-        key_hash = bcrypt.hashpw(plain_key.encode(), bcrypt.gensalt()).decode()
+        key_hash = _hash_key(plain_key)
 
         expires_at: Optional[datetime] = None
         if expires_in_days:
@@ -96,6 +126,8 @@ class KeyManager:
         )
 
         self._persist_key(api_key)
+        with self._lock:
+            self._hash_index[key_hash] = key_id
         return plain_key, api_key
 
     def validate_key(self, plain_key: str) -> Optional[Tuple[APIKey, str]]:
@@ -107,20 +139,56 @@ class KeyManager:
             return None
 
         workspace_id = m.group(1)
+        key_hash = _hash_key(plain_key)
+
+        # Fast path: read only the key file this hash was last seen in.  The
+        # file is re-read so revocation from another process is honoured.
+        with self._lock:
+            key_id = self._hash_index.get(key_hash)
+            scanned = self._scanned.get(workspace_id)
+        if key_id is not None:
+            api_key = self._load_key(workspace_id, key_id)
+            if api_key is not None and hmac.compare_digest(api_key.key_hash, key_hash):
+                return self._accept_key(api_key, workspace_id) if self._is_usable(api_key) else None
+
+        # Not indexed: reject without parsing any key file if none was added
+        # since the last scan and the workspace has no bcrypt keys to try.
+        try:
+            names = frozenset(
+                e for e in os.listdir(self._keys_path(workspace_id)) if e.endswith(".json")
+            )
+        except OSError:
+            return None  # No keys directory, so no keys
+        if scanned == (names, False):
+            return None
+
         keys = self._load_keys(workspace_id)
+        has_legacy = any(not k.key_hash.startswith(_SHA256_PREFIX) for k in keys)
+        with self._lock:
+            for api_key in keys:
+                if api_key.key_hash.startswith(_SHA256_PREFIX):
+                    self._hash_index[api_key.key_hash] = api_key.key_id
+            self._scanned[workspace_id] = (names, has_legacy)
 
         for api_key in keys:
-            if api_key.revoked:
-                continue
-            if api_key.expires_at and api_key.expires_at < datetime.now(timezone.utc):
+            if not self._is_usable(api_key):
                 continue
-            if bcrypt.checkpw(plain_key.encode(), api_key.key_hash.encode()):
-                api_key.last_used = datetime.now(timezone.utc)
-                self._persist_key(api_key)
-                return api_key, workspace_id
+            if _verify_key(plain_key, api_key.key_hash):
+                return self._accept_key(api_key, workspace_id)
 
         return None
 
+    @staticmethod
+    def _is_usable(api_key: APIKey) -> bool:
+        if api_key.revoked:
+            return False
+        return not (api_key.expires_at and api_key.expires_at < datetime.now(timezone.utc))
+
+    def _accept_key(self, api_key: APIKey, workspace_id: str) -> Tuple[APIKey, str]:
+        api_key.last_used = datetime.now(timezone.utc)
+        self._persist_key(api_key)
+        return api_key, workspace_id
+
     def revoke_key(self, workspace_id: str, key_id: str) -> bool:
         keys = self._load_keys(workspace_id)
         for api_key in keys:
@@ -168,8 +236,11 @@ class KeyManager:
 
     # --- persistence ---
 
+    def _keys_path(self, workspace_id: str) -> str:
+        return os.path.join(self._base, workspace_id, "keys")
+
     def _keys_dir(self, workspace_id: str) -> str:
-        d = os.path.join(self._base, workspace_id, "keys")
+        d = self._keys_path(workspace_id)
         os.makedirs(d, exist_ok=True)
         return d
 
@@ -191,18 +262,29 @@ class KeyManager:
         except OSError:
             pass
 
+    def _load_key(self, workspace_id: str, key_id: str) -> Optional[APIKey]:
+        path = os.path.join(self._keys_path(workspace_id), f"{key_id}.json")
+        try:
+            with open(path, "rb") as f:
+                return APIKey.model_validate_json(f.read())
+        except (OSError, ValueError):
+            return None
+
     def _load_keys(self, workspace_id: str) -> List[APIKey]:
-        d = self._keys_dir(workspace_id)
+        # Reads never create the directory: validate_key passes in whatever
+        # workspace id the presented key claims.
+        d = self._keys_path(workspace_id)
         keys: List[APIKey] = []
-        if not os.path.isdir(d):
+        try:
+            entries = os.listdir(d)
+        except OSError:
             return keys
-        for entry in os.listdir(d):
+        for entry in entries:
             if not entry.endswith(".json"):
                 continue
             try:
-                with open(os.path.join(d, entry), "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                keys.append(APIKey.model_validate(data))
-            except (OSError, json.JSONDecodeError, ValueError):
+                with open(os.path.join(d, entry), "rb") as f:
+                    keys.append(APIKey.model_validate_json(f.read()))
+            except (OSError, ValueError):
                 pass
         return keys
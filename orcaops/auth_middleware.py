@@ -64,7 +64,7 @@ def require_auth(
 def require_permission(permission: Permission):
     """Factory returning a dependency that checks a specific permission."""
     def _checker(auth: AuthContext = Depends(require_auth)) -> AuthContext:
-        if not has_permission(list(auth.permissions), permission):
+        if not has_permission(auth.permissions, permission):
             raise HTTPException(
                 status_code=403,
                 detail=f"Permission '{permission.value}' required",
@@ -12,7 +12,7 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
-from orcaops.workspace import WorkspaceRegistry
+from orcaops.workspace import WorkspaceRegistry, WorkspaceRegistryIOError
 from orcaops.auth import KeyManager, ROLE_TEMPLATES
 from orcaops.audit import AuditLogger, AuditStore
 from orcaops.session_manager import SessionManager
@@ -98,7 +98,7 @@ class WorkspaceCLI:
                     title="Workspace",
                     border_style="green",
                 ))
-            except ValueError as e:
+            except (ValueError, WorkspaceRegistryIOError) as e:
                 console.print(f"[red]Error: {e}[/red]")
                 raise typer.Exit(code=1)
 
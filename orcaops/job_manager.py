@@ -1,5 +1,4 @@
 import os
-import json
 import tempfile
 import threading
 from dataclasses import dataclass, field
@@ -9,6 +8,7 @@ from typing import Dict, List, Optional, Tuple
 from orcaops.docker_manager import DockerManager
 from orcaops.job_runner import JobRunner
 from orcaops.schemas import JobSpec, RunRecord, JobStatus, Anomaly, AuditAction, AuditOutcome
+from orcaops.signal_event import SignalEvent
 
 _TERMINAL_STATUSES = {JobStatus.SUCCESS, JobStatus.FAILED, JobStatus.TIMED_OUT, JobStatus.CANCELLED}
 _MAX_COMPLETED_JOBS = 200
@@ -21,6 +21,8 @@ class JobEntry:
     thread: threading.Thread
     cancel_event: threading.Event
     lock: threading.Lock = field(default_factory=threading.Lock)
+    # Set once the record reaches a terminal status
+    done_event: threading.Event = field(default_factory=SignalEvent)
 
 
 class JobManager:
@@ -182,6 +184,7 @@ class JobManager:
 
             # Persist final state atomically
             self._overwrite_run_record(entry.record)
+            entry.done_event.set()
 
         # Release quota
         if self._quota_tracker and spec.workspace_id:
@@ -247,6 +250,20 @@ class JobManager:
                 return entry.record.model_copy()
         return self._load_job_from_disk(job_id)
 
+    def job_done_event(self, job_id: str) -> threading.Event:
+        """Return an event that is set once the job reaches a terminal status.
+
+        Jobs no longer held in memory (finished and evicted, or unknown) get an
+        already-set event; callers should confirm the outcome with get_job().
+        """
+        with self._lock:
+            entry = self._jobs.get(job_id)
+        if entry:
+            return entry.done_event
+        done = threading.Event()
+        done.set()
+        return done
+
     def list_jobs(self, status: Optional[JobStatus] = None) -> List[RunRecord]:
         with self._lock:
             entries = list(self._jobs.values())
@@ -273,6 +290,7 @@ class JobManager:
                 entry.record.status = JobStatus.CANCELLED
                 entry.record.finished_at = datetime.now(timezone.utc)
                 entry.record.error = "Job cancelled by user."
+                entry.done_event.set()
             container_id = entry.record.sandbox_id
             record_snapshot = entry.record.model_copy()
 
@@ -322,8 +340,7 @@ class JobManager:
         if not os.path.exists(run_path):
             return None
         try:
-            with open(run_path, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
-            return RunRecord.model_validate(data)
-        except (OSError, json.JSONDecodeError, ValueError):
+            with open(run_path, "rb") as handle:
+                return RunRecord.model_validate_json(handle.read())
+        except (OSError, ValueError):
             return None
@@ -1305,6 +1305,7 @@ def orcaops_create_workspace(
     owner_id: str = "default",
 ) -> str:
     """Create a new workspace for resource isolation."""
+    from orcaops.workspace import WorkspaceRegistryIOError
     try:
         from orcaops.schemas import OwnerType
         ot = OwnerType(owner_type)
@@ -1318,6 +1319,8 @@ def orcaops_create_workspace(
         )
     except ValueError as e:
         return _error("VALIDATION_ERROR", str(e))
+    except WorkspaceRegistryIOError as e:
+        return _error("IO_ERROR", str(e))
     except Exception as exc:
         return _error("CREATE_WORKSPACE_ERROR", str(exc))
 
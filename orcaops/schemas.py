@@ -2,7 +2,7 @@ import re
 from typing import List, Dict, Optional, Any
 from enum import Enum
 from datetime import datetime, timezone
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 class JobStatus(str, Enum):
     QUEUED = "queued"
@@ -443,6 +443,12 @@ class WorkflowRecord(BaseModel):
     error: Optional[str] = None
     triggered_by: Optional[str] = None
 
+    # job name -> status mirror of job_statuses for cheap aggregation (not serialized)
+    _status_index: Dict[str, JobStatus] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._status_index = {name: js.status for name, js in self.job_statuses.items()}
+
 
 class WorkflowSubmitRequest(BaseModel):
     """Request body for submitting a workflow via API."""
@@ -496,6 +502,8 @@ class OwnerType(str, Enum):
 
 class ResourceLimits(BaseModel):
     """Per-workspace resource constraints."""
+    model_config = {"frozen": True}
+
     max_concurrent_jobs: int = 10
     max_concurrent_sandboxes: int = 5
     max_job_duration_seconds: int = 3600
@@ -508,6 +516,8 @@ class ResourceLimits(BaseModel):
 
 class WorkspaceSettings(BaseModel):
     """Workspace-level configuration."""
+    model_config = {"frozen": True}
+
     default_cleanup_policy: str = "remove_on_completion"
     allowed_images: List[str] = Field(default_factory=list)
     blocked_images: List[str] = Field(default_factory=list)
@@ -517,6 +527,8 @@ class WorkspaceSettings(BaseModel):
 
 class Workspace(BaseModel):
     """A workspace providing resource isolation."""
+    model_config = {"frozen": True}
+
     id: str
     name: str
     owner_type: OwnerType
@@ -761,6 +773,9 @@ class SessionStatus(str, Enum):
 
 class AgentSession(BaseModel):
     """An active MCP agent session with resource tracking."""
+    # SessionManager mutates sessions in place on hot paths; keep that unvalidated.
+    model_config = {"validate_assignment": False}
+
     session_id: str
     agent_type: str
     workspace_id: str
@@ -770,6 +785,12 @@ class AgentSession(BaseModel):
     resources_created: List[str] = Field(default_factory=list)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
+    # Epoch-seconds mirror of last_activity for cheap idle checks (not serialized)
+    _last_activity_ts: float = PrivateAttr(default=0.0)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._last_activity_ts = self.last_activity.timestamp()
+
 
 class SessionResponse(BaseModel):
     """Single session response."""
@@ -1,16 +1,40 @@
 """Agent session management — track MCP sessions with lifecycle and resource attribution."""
 
-import json
 import os
-import tempfile
 import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from pydantic import TypeAdapter
+
+from orcaops.atomic_write import atomic_write
 from orcaops.schemas import AgentSession, SessionStatus
 
 
+_LOAD_WORKERS = 8
+_DATETIME_JSON = TypeAdapter(datetime)
+_ACTIVE_JSON = b'"active"'
+
+
+def _read_session(path: str) -> Optional[AgentSession]:
+    """Read one session file, returning None if unreadable or invalid."""
+    try:
+        with open(path, "rb") as f:
+            return AgentSession.model_validate_json(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _mark_activity(session: AgentSession) -> None:
+    """Stamp last_activity and its cached epoch mirror together."""
+    now = datetime.now(timezone.utc)
+    session.last_activity = now
+    session._last_activity_ts = now.timestamp()
+
+
 class SessionManager:
     """Thread-safe manager for agent session lifecycle."""
 
@@ -24,23 +48,26 @@ class SessionManager:
         self._idle_timeout = idle_timeout_seconds
         self._lock = threading.Lock()
         self._sessions: Dict[str, AgentSession] = {}
+        # session_id -> (last touch payload, its last_activity JSON, its status JSON)
+        self._touch_cache: Dict[str, Tuple[bytes, bytes, bytes]] = {}
         self._load_all()
 
     def _load_all(self) -> None:
-        """Load existing sessions from disk."""
-        if not os.path.isdir(self._dir):
+        """Load existing sessions from disk, reading files in parallel."""
+        try:
+            paths = [
+                entry.path for entry in os.scandir(self._dir)
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+        except OSError:
             return
-        for filename in os.listdir(self._dir):
-            if not filename.endswith(".json"):
-                continue
-            path = os.path.join(self._dir, filename)
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                session = AgentSession.model_validate(data)
+        if not paths:
+            return
+        with ThreadPoolExecutor(max_workers=min(_LOAD_WORKERS, len(paths))) as pool:
+            loaded = [s for s in pool.map(_read_session, paths) if s is not None]
+        with self._lock:
+            for session in loaded:
                 self._sessions[session.session_id] = session
-            except (OSError, json.JSONDecodeError, ValueError):
-                pass
 
     def create_session(
         self,
@@ -69,9 +96,10 @@ class SessionManager:
                 return None
             if session.status == SessionStatus.EXPIRED:
                 return None
-            session.last_activity = datetime.now(timezone.utc)
+            _mark_activity(session)
             session.status = SessionStatus.ACTIVE
-        self._persist(session)
+            payload = self._touch_payload(session)
+        self._write(session_id, payload)
         return session
 
     def track_resource(self, session_id: str, resource_id: str) -> bool:
@@ -81,6 +109,7 @@ class SessionManager:
             if not session:
                 return False
             session.resources_created.append(resource_id)
+            self._touch_cache.pop(session_id, None)
         self._persist(session)
         return True
 
@@ -115,19 +144,20 @@ class SessionManager:
             if not session:
                 return None
             session.status = SessionStatus.EXPIRED
-            session.last_activity = datetime.now(timezone.utc)
+            _mark_activity(session)
+            self._touch_cache.pop(session_id, None)
         self._persist(session)
         return session.model_copy(deep=True)
 
     def expire_idle_sessions(self) -> int:
         """Expire sessions that have been idle longer than the timeout."""
-        now = datetime.now(timezone.utc)
+        now_ts = time.time()
         expired_count = 0
         with self._lock:
             for session in self._sessions.values():
                 if session.status == SessionStatus.EXPIRED:
                     continue
-                idle_seconds = (now - session.last_activity).total_seconds()
+                idle_seconds = now_ts - session._last_activity_ts
                 if idle_seconds > self._idle_timeout:
                     session.status = SessionStatus.EXPIRED
                     expired_count += 1
@@ -143,21 +173,36 @@ class SessionManager:
 
         return expired_count
 
+    def _touch_payload(self, session: AgentSession) -> bytes:
+        """Serialize a just-touched session. Caller must hold the lock.
+
+        Only last_activity and status change on touch, so after the first
+        full dump the cached JSON is patched in place instead of re-dumped.
+        Both fields precede resources_created/metadata in the output, so the
+        first match is always the top-level key.
+        """
+        activity = _DATETIME_JSON.dump_json(session.last_activity)
+        cached = self._touch_cache.get(session.session_id)
+        if cached is None:
+            payload = session.model_dump_json(indent=2).encode("utf-8")
+        else:
+            payload, old_activity, old_status = cached
+            payload = payload.replace(
+                b'"last_activity": ' + old_activity, b'"last_activity": ' + activity, 1,
+            ).replace(
+                b'"status": ' + old_status, b'"status": ' + _ACTIVE_JSON, 1,
+            )
+        self._touch_cache[session.session_id] = (payload, activity, _ACTIVE_JSON)
+        return payload
+
     def _persist(self, session: AgentSession) -> None:
         """Write session to disk atomically."""
-        path = os.path.join(self._dir, f"{session.session_id}.json")
+        self._write(session.session_id, session.model_dump_json(indent=2).encode("utf-8"))
+
+    def _write(self, session_id: str, payload: bytes) -> None:
+        path = os.path.join(self._dir, f"{session_id}.json")
         try:
-            fd, tmp_path = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
-            try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    f.write(session.model_dump_json(indent=2))
-                os.replace(tmp_path, path)
-            except BaseException:
-                try:
-                    os.unlink(tmp_path)
-                except OSError:
-                    pass
-                raise
+            atomic_write(path, payload)
         except OSError:
             pass
 
@@ -167,6 +212,7 @@ class SessionManager:
             if session_id not in self._sessions:
                 return False
             del self._sessions[session_id]
+            self._touch_cache.pop(session_id, None)
         path = os.path.join(self._dir, f"{session_id}.json")
         try:
             os.unlink(path)
@@ -0,0 +1,31 @@
+"""Events that can wake a single waiter blocked on several of them."""
+
+import threading
+from typing import Set
+
+
+class SignalEvent(threading.Event):
+    """threading.Event that also sets any events linked to it."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._links_lock = threading.Lock()
+        self._links: Set[threading.Event] = set()
+
+    def set(self) -> None:
+        super().set()
+        with self._links_lock:
+            links = list(self._links)
+        for event in links:
+            event.set()
+
+    def link(self, event: threading.Event) -> None:
+        with self._links_lock:
+            self._links.add(event)
+        if self.is_set():
+            event.set()  # Set before linking; don't miss it
+
+    def unlink(self, event: threading.Event) -> None:
+        with self._links_lock:
+            self._links.discard(event)
+
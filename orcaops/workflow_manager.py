@@ -5,18 +5,20 @@ Analogous to JobManager, but for workflows. Submits workflow execution
 in background threads via WorkflowRunner.
 """
 
-import json
 import os
-import tempfile
 import threading
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 
+from orcaops.atomic_write import atomic_write
 from orcaops.job_manager import JobManager
 from orcaops.schemas import WorkflowSpec, WorkflowRecord, WorkflowStatus
+from orcaops.signal_event import SignalEvent
 from orcaops.workflow_runner import WorkflowRunner
+from orcaops.workflow_store import WorkflowStore
 
 
 _TERMINAL_STATUSES = {
@@ -29,6 +31,13 @@ _MAX_COMPLETED = 100
 
 @dataclass
 class WorkflowEntry:
+    """In-memory workflow state.
+
+    ``record`` is treated as an immutable snapshot: writers replace it
+    wholesale (under ``lock``) and never mutate it, so readers can take a
+    plain attribute read without locking or copying.
+    """
+
     record: WorkflowRecord
     thread: threading.Thread
     cancel_event: threading.Event
@@ -47,9 +56,14 @@ class WorkflowManager:
         self.jm = job_manager or JobManager()
         self.workflows_dir = workflows_dir or os.path.expanduser("~/.orcaops/workflows")
         os.makedirs(self.workflows_dir, exist_ok=True)
-        self.runner = WorkflowRunner(self.jm, max_parallel=max_parallel)
+        self.runner = WorkflowRunner(
+            self.jm, max_parallel=max_parallel,
+            workflow_store=WorkflowStore(self.workflows_dir),
+        )
         self._lock = threading.Lock()
         self._workflows: Dict[str, WorkflowEntry] = {}
+        # Finished workflow IDs, oldest first, for O(1) LRU eviction
+        self._terminal_order: "OrderedDict[str, None]" = OrderedDict()
 
     def submit_workflow(
         self,
@@ -74,7 +88,7 @@ class WorkflowManager:
                 triggered_by=triggered_by,
             )
 
-            cancel_event = threading.Event()
+            cancel_event = SignalEvent()
             thread = threading.Thread(
                 target=self._run_workflow,
                 args=(spec, wf_id, cancel_event, triggered_by),
@@ -116,8 +130,7 @@ class WorkflowManager:
         with self._lock:
             entry = self._workflows.get(workflow_id)
         if entry:
-            with entry.lock:
-                return entry.record.model_copy(deep=True)
+            return entry.record
         return self._load_from_disk(workflow_id)
 
     def list_workflows(
@@ -128,10 +141,7 @@ class WorkflowManager:
         with self._lock:
             entries = list(self._workflows.values())
 
-        records = []
-        for entry in entries:
-            with entry.lock:
-                records.append(entry.record.model_copy(deep=True))
+        records = [entry.record for entry in entries]
 
         if status:
             records = [r for r in records if r.status == status]
@@ -148,10 +158,12 @@ class WorkflowManager:
         with entry.lock:
             entry.cancel_event.set()
             if entry.record.status in {WorkflowStatus.PENDING, WorkflowStatus.RUNNING}:
-                entry.record.status = WorkflowStatus.CANCELLED
-                entry.record.finished_at = datetime.now(timezone.utc)
-                entry.record.error = "Workflow cancelled by user."
-            snapshot = entry.record.model_copy(deep=True)
+                entry.record = entry.record.model_copy(update={
+                    "status": WorkflowStatus.CANCELLED,
+                    "finished_at": datetime.now(timezone.utc),
+                    "error": "Workflow cancelled by user.",
+                })
+            snapshot = entry.record
 
         self._persist_record(snapshot)
         return True, snapshot
@@ -171,17 +183,7 @@ class WorkflowManager:
         wf_path = os.path.join(wf_dir, "workflow.json")
         try:
             os.makedirs(wf_dir, exist_ok=True)
-            fd, tmp_path = tempfile.mkstemp(dir=wf_dir, suffix=".tmp")
-            try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    f.write(record.model_dump_json(indent=2))
-                os.replace(tmp_path, wf_path)
-            except BaseException:
-                try:
-                    os.unlink(tmp_path)
-                except OSError:
-                    pass
-                raise
+            atomic_write(wf_path, record.model_dump_json(indent=2).encode("utf-8"))
         except OSError:
             pass
 
@@ -191,22 +193,18 @@ class WorkflowManager:
         if not os.path.isfile(wf_path):
             return None
         try:
-            with open(wf_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return WorkflowRecord.model_validate(data)
-        except (OSError, json.JSONDecodeError, ValueError):
+            with open(wf_path, "rb") as f:
+                return WorkflowRecord.model_validate_json(f.read())
+        except (OSError, ValueError):
             return None
 
     def _evict_if_terminal(self, workflow_id: str) -> None:
-        """Remove completed workflows from in-memory cache."""
+        """Keep at most _MAX_COMPLETED finished workflows in memory (LRU)."""
         with self._lock:
             entry = self._workflows.get(workflow_id)
             if entry and entry.record.status in _TERMINAL_STATUSES:
-                del self._workflows[workflow_id]
-            if len(self._workflows) > _MAX_COMPLETED:
-                to_evict = [
-                    wid for wid, e in self._workflows.items()
-                    if e.record.status in _TERMINAL_STATUSES
-                ]
-                for wid in to_evict:
-                    del self._workflows[wid]
+                self._terminal_order[workflow_id] = None
+                self._terminal_order.move_to_end(workflow_id)
+            while len(self._terminal_order) > _MAX_COMPLETED:
+                wid, _ = self._terminal_order.popitem(last=False)
+                self._workflows.pop(wid, None)
@@ -1,17 +1,21 @@
 """
 Workflow execution engine.
 
-Executes a workflow DAG level-by-level using threads for parallelism.
-Individual jobs are submitted through JobManager.
+Executes a workflow DAG using threads for parallelism, dispatching each job
+as soon as its dependencies finish. Individual jobs are submitted through
+JobManager.
 """
 
 import logging
 import re
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import ChainMap, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from graphlib import TopologicalSorter
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
 from orcaops.job_manager import JobManager
 from orcaops.schemas import (
@@ -19,24 +23,101 @@ from orcaops.schemas import (
     WorkflowSpec, WorkflowJob, WorkflowRecord, WorkflowStatus,
     WorkflowJobStatus,
 )
+from orcaops.signal_event import SignalEvent
 from orcaops.workflow_schema import (
     get_execution_order, expand_matrix, matrix_key,
-    ConditionEvaluator,
+    compile_condition, interpolate_matrix,
 )
+from orcaops.workflow_store import WorkflowStore
 
 logger = logging.getLogger("orcaops")
 
 _TERMINAL_JOB_STATUSES = {
     JobStatus.SUCCESS, JobStatus.FAILED, JobStatus.TIMED_OUT, JobStatus.CANCELLED,
 }
+_FAIL_STATUSES = frozenset({JobStatus.FAILED, JobStatus.TIMED_OUT})
+
+# Pause before re-reading a job that signalled done without a terminal record;
+# also how often plain (non-Signal) events are re-checked
+_RECORD_RETRY_INTERVAL = 0.5
+
+_JOB_REF_RE = re.compile(r"jobs\.(\w+)\.status")
+_SANITIZE_RE = re.compile(r"[^a-zA-Z0-9_\-]")
+
+# Past runs consulted, and smoothing factor, for job duration estimates
+_HISTORY_RUNS = 50
+_ESTIMATE_ALPHA = 0.2
+
+
+def _scheduling_graph(spec: WorkflowSpec) -> Dict[str, Set[str]]:
+    """Dependency graph used to dispatch jobs as soon as they are ready.
+
+    Besides ``requires``, a job whose ``if`` condition reads the status of a
+    job from an earlier level also waits for that job, so the condition sees
+    the same finished status it would have under level-by-level execution.
+    """
+    level_of = {
+        name: idx
+        for idx, level in enumerate(get_execution_order(spec))
+        for name in level
+    }
+    graph: Dict[str, Set[str]] = {}
+    for name, job in spec.jobs.items():
+        deps = set(job.requires)
+        if job.if_condition:
+            for ref in _JOB_REF_RE.findall(job.if_condition):
+                if ref in level_of and level_of[ref] < level_of[name]:
+                    deps.add(ref)
+        graph[name] = deps
+    return graph
+
+
+def _descendant_map(
+    graph: Dict[str, Set[str]], children: Dict[str, List[str]],
+) -> Dict[str, Set[str]]:
+    """Every job's transitive successors, built in one reverse-topological pass."""
+    descendants: Dict[str, Set[str]] = {}
+    for name in reversed(list(TopologicalSorter(graph).static_order())):
+        below: Set[str] = set()
+        for child in children[name]:
+            below.add(child)
+            below |= descendants[child]
+        descendants[name] = below
+    return descendants
+
+
+@dataclass
+class _RunningJob:
+    """A submitted job variant, watched by the run loop until it finishes."""
+    job_name: str
+    job_id: str
+    timeout: int
+    deadline: float
+    done_event: threading.Event
+    retry_at: float = 0.0
+    svc_mgr: Optional[Any] = None
+    service_container_ids: Dict[str, str] = field(default_factory=dict)
+    network_name: Optional[str] = None
+
+
+def _set_status(record: WorkflowRecord, job_name: str, status: JobStatus) -> None:
+    """Set a job's status, keeping the record's status index in step."""
+    record.job_statuses[job_name].status = status
+    record._status_index[job_name] = status
 
 
 class WorkflowRunner:
     """Executes a workflow DAG, delegating individual jobs to JobManager."""
 
-    def __init__(self, job_manager: JobManager, max_parallel: int = 4):
+    def __init__(
+        self,
+        job_manager: JobManager,
+        max_parallel: int = 4,
+        workflow_store: Optional[WorkflowStore] = None,
+    ):
         self.jm = job_manager
         self.max_parallel = max_parallel
+        self.store = workflow_store
 
     def run(
         self,
@@ -64,146 +145,331 @@ class WorkflowRunner:
                 job_name=job_name,
                 status=JobStatus.QUEUED,
             )
+            record._status_index[job_name] = JobStatus.QUEUED
+
+        graph = _scheduling_graph(spec)
+        children: Dict[str, List[str]] = {name: [] for name in graph}
+        for name, deps in graph.items():
+            for dep in deps:
+                children[dep].append(name)
+
+        sorter = TopologicalSorter(graph)
+        sorter.prepare()
+        estimates = self._estimate_durations(spec)
+        # Variant setup and service cleanup tasks on the pool
+        in_flight: Dict[Future, str] = {}
+        finalizing: Dict[Future, str] = {}
+        # Submitted variants, by JobManager job_id, waited on by this thread
+        running: Dict[str, _RunningJob] = {}
+        # Variants of ready jobs not yet started, in dispatch order
+        backlog: Deque[Tuple[str, Optional[Dict[str, str]]]] = deque()
+        variants_left: Dict[str, int] = {}
+        # One pool per workflow run, shared by every job as it becomes ready
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_parallel, thread_name_prefix=f"wf-{workflow_id}",
+        )
+        # Set by finished pool tasks, job completion and cancellation
+        wake = threading.Event()
+        if isinstance(cancel_event, SignalEvent):
+            cancel_event.link(wake)
 
-        levels = get_execution_order(spec)
+        # Transitive successors, built on the first failure that needs them
+        descendants: Dict[str, Set[str]] = {}
 
-        try:
-            for level_idx, level in enumerate(levels):
-                if cancel_event.is_set():
-                    record.status = WorkflowStatus.CANCELLED
-                    record.error = "Workflow cancelled by user."
-                    # Mark remaining queued jobs as cancelled
-                    for jn in level:
-                        if record.job_statuses[jn].status == JobStatus.QUEUED:
-                            record.job_statuses[jn].status = JobStatus.CANCELLED
-                            record.job_statuses[jn].error = "Workflow cancelled"
-                    for remaining in levels[level_idx + 1:]:
-                        for jn in remaining:
-                            if record.job_statuses[jn].status == JobStatus.QUEUED:
-                                record.job_statuses[jn].status = JobStatus.CANCELLED
-                                record.job_statuses[jn].error = "Workflow cancelled"
-                    break
-
-                # Filter jobs by conditions and on_complete rules
-                jobs_to_run = []
-                for job_name in level:
-                    job_def = spec.jobs[job_name]
-                    if self._should_run_job(job_def, record):
-                        jobs_to_run.append(job_name)
-                    else:
-                        record.job_statuses[job_name].status = JobStatus.CANCELLED
-                        record.job_statuses[job_name].error = "Skipped: condition not met"
+        def finish_variant(job_name: str) -> None:
+            variants_left[job_name] -= 1
+            if variants_left[job_name]:
+                return
+            if (
+                spec.jobs[job_name].on_complete == "success"
+                and record._status_index[job_name] in _FAIL_STATUSES
+            ):
+                if not descendants:
+                    descendants.update(_descendant_map(graph, children))
+                self._skip_descendants(descendants[job_name], spec, record)
+            sorter.done(job_name)
+
+        def release(job: _RunningJob) -> None:
+            """Stop watching a finished job; clean up its services off-thread."""
+            del running[job.job_id]
+            if isinstance(job.done_event, SignalEvent):
+                job.done_event.unlink(wake)
+            if job.svc_mgr and job.service_container_ids:
+                future = pool.submit(self._finalize_job, job)
+                future.add_done_callback(lambda _: wake.set())
+                finalizing[future] = job.job_name
+            else:
+                finish_variant(job.job_name)
 
-                if not jobs_to_run:
-                    continue
+        def fill_window() -> None:
+            # At most max_parallel variants are set up, running or cleaning up
+            while backlog and len(in_flight) + len(running) + len(finalizing) < self.max_parallel:
+                job_name, params = backlog.popleft()
+                future = pool.submit(
+                    self._start_job,
+                    spec, spec.jobs[job_name], record, workflow_id, cancel_event, params,
+                )
+                future.add_done_callback(lambda _: wake.set())
+                in_flight[future] = job_name
 
-                # Run jobs in this level in parallel
-                self._run_level(spec, jobs_to_run, record, workflow_id, cancel_event)
+        try:
+            self._dispatch_ready(
+                spec, sorter, record, cancel_event, backlog, variants_left, estimates,
+            )
+            fill_window()
+            while in_flight or running or finalizing:
+                self._wait_for_activity(wake, cancel_event, running)
+                wake.clear()
+
+                for future in [f for f in finalizing if f.done()]:
+                    finish_variant(finalizing.pop(future))
+                for future in [f for f in in_flight if f.done()]:
+                    job_name = in_flight.pop(future)
+                    job = self._collect_result(future, job_name, record)
+                    if job is None:
+                        finish_variant(job_name)
+                        continue
+                    running[job.job_id] = job
+                    if isinstance(job.done_event, SignalEvent):
+                        job.done_event.link(wake)
 
-                # Check if any non-"always" job failure should halt the workflow
-                has_failure = any(
-                    record.job_statuses[jn].status in {JobStatus.FAILED, JobStatus.TIMED_OUT}
-                    for jn in jobs_to_run
-                    if spec.jobs[jn].on_complete == "success"
+                if cancel_event.is_set():
+                    # Drop setup tasks still waiting for a worker, and unstarted variants
+                    for pending in in_flight:
+                        pending.cancel()
+                    while backlog:
+                        job_name, _ = backlog.popleft()
+                        _set_status(record, job_name, JobStatus.CANCELLED)
+                        record.job_statuses[job_name].error = "Workflow cancelled"
+                        finish_variant(job_name)
+
+                now = time.time()
+                for job in list(running.values()):
+                    if self._check_running_job(job, record, cancel_event, now):
+                        release(job)
+
+                self._dispatch_ready(
+                    spec, sorter, record, cancel_event, backlog, variants_left, estimates,
                 )
-                if has_failure:
-                    # Cancel remaining downstream jobs that require success
-                    # but keep "always" and "failure" jobs eligible
-                    has_remaining = False
-                    for remaining in levels[level_idx + 1:]:
-                        for jn in remaining:
-                            if record.job_statuses[jn].status == JobStatus.QUEUED:
-                                job_on_complete = spec.jobs[jn].on_complete
-                                if job_on_complete == "success":
-                                    record.job_statuses[jn].status = JobStatus.CANCELLED
-                                    record.job_statuses[jn].error = "Skipped: upstream failure"
-                                else:
-                                    has_remaining = True
-                    if not has_remaining:
-                        break
+                fill_window()
+
+            if cancel_event.is_set():
+                record.status = WorkflowStatus.CANCELLED
+                record.error = "Workflow cancelled by user."
 
         except Exception as e:
             logger.error(f"Workflow {workflow_id} failed: {e}", exc_info=True)
             record.error = str(e)
+        finally:
+            if isinstance(cancel_event, SignalEvent):
+                cancel_event.unlink(wake)
+            pool.shutdown(wait=True, cancel_futures=True)
 
         # Determine final status
         record.finished_at = datetime.now(timezone.utc)
         record.status = self._compute_final_status(record)
         return record
 
+    def _dispatch_ready(
+        self,
+        spec: WorkflowSpec,
+        sorter: TopologicalSorter,
+        record: WorkflowRecord,
+        cancel_event: threading.Event,
+        backlog: Deque[Tuple[str, Optional[Dict[str, str]]]],
+        variants_left: Dict[str, int],
+        estimates: Dict[str, float],
+    ) -> None:
+        """Queue every job whose dependencies have finished onto the backlog.
+
+        Ready jobs are queued longest-estimated first, so a slow job does
+        not start last and stretch the run when the pool is saturated.
+        Jobs that are skipped (cancelled, condition not met, upstream failure)
+        are marked done immediately, which may unblock further jobs, so this
+        loops until the sorter has nothing more ready.
+        """
+        def by_estimate(names):
+            return sorted(names, key=lambda n: (-estimates.get(n, 0.0), n))
+
+        ready = by_estimate(sorter.get_ready())
+        while ready:
+            for job_name in ready:
+                status_entry = record.job_statuses[job_name]
+                if record._status_index[job_name] != JobStatus.QUEUED:
+                    pass  # Already skipped by an upstream failure
+                elif cancel_event.is_set():
+                    _set_status(record, job_name, JobStatus.CANCELLED)
+                    status_entry.error = "Workflow cancelled"
+                elif not self._should_run_job(spec.jobs[job_name], record):
+                    _set_status(record, job_name, JobStatus.CANCELLED)
+                    status_entry.error = "Skipped: condition not met"
+                else:
+                    job_def = spec.jobs[job_name]
+                    variants = expand_matrix(job_def.matrix) if job_def.matrix else [None]
+                    variants_left[job_name] = len(variants)
+                    backlog.extend((job_name, params) for params in variants)
+                    continue
+                sorter.done(job_name)
+            ready = by_estimate(sorter.get_ready())
+
+    def _estimate_durations(self, spec: WorkflowSpec) -> Dict[str, float]:
+        """EWMA of each job's past successful durations, in seconds.
+
+        Built once per run from recent records of the same workflow; jobs
+        without history are absent and sort after estimated ones.
+        """
+        if self.store is None:
+            return {}
+        try:
+            recent, _ = self.store.list_workflows(limit=_HISTORY_RUNS)
+        except Exception as e:
+            logger.warning(f"Could not load workflow history for {spec.name}: {e}")
+            return {}
+
+        estimates: Dict[str, float] = {}
+        # Oldest first so the newest run carries the most weight
+        for past in sorted(recent, key=lambda r: r.created_at):
+            if past.spec_name != spec.name:
+                continue
+            for name, js in past.job_statuses.items():
+                if (
+                    name not in spec.jobs
+                    or js.status != JobStatus.SUCCESS
+                    or not js.started_at
+                    or not js.finished_at
+                ):
+                    continue
+                duration = (js.finished_at - js.started_at).total_seconds()
+                if name in estimates:
+                    estimates[name] += _ESTIMATE_ALPHA * (duration - estimates[name])
+                else:
+                    estimates[name] = duration
+        return estimates
+
+    def _wait_for_activity(
+        self,
+        wake: threading.Event,
+        cancel_event: threading.Event,
+        running: Dict[str, _RunningJob],
+    ) -> None:
+        """Block the run loop until something may need handling.
+
+        SignalEvents and finished pool tasks set ``wake``; plain events cannot,
+        so while any are pending the wait is capped at _RECORD_RETRY_INTERVAL.
+        Deadlines and record re-reads bound the wait as well.
+        """
+        now = time.time()
+        timeout: Optional[float] = None
+        events = [] if cancel_event.is_set() else [cancel_event]
+        for job in running.values():
+            if job.done_event.is_set():
+                if job.retry_at <= now:
+                    return
+                wake_at = job.retry_at
+            else:
+                events.append(job.done_event)
+                wake_at = job.deadline
+            timeout = wake_at - now if timeout is None else min(timeout, wake_at - now)
+        if any(not isinstance(event, SignalEvent) for event in events):
+            timeout = _RECORD_RETRY_INTERVAL if timeout is None else min(
+                timeout, _RECORD_RETRY_INTERVAL,
+            )
+        wake.wait(None if timeout is None else max(timeout, 0))
+
+    def _check_running_job(
+        self,
+        job: _RunningJob,
+        record: WorkflowRecord,
+        cancel_event: threading.Event,
+        now: float,
+    ) -> bool:
+        """Update a submitted job's status. Returns True once it has finished."""
+        status_entry = record.job_statuses[job.job_name]
+        if cancel_event.is_set():
+            self.jm.cancel_job(job.job_id)
+            _set_status(record, job.job_name, JobStatus.CANCELLED)
+            status_entry.error = "Workflow cancelled"
+            status_entry.finished_at = datetime.now(timezone.utc)
+            return True
+        if now >= job.deadline:
+            self.jm.cancel_job(job.job_id)
+            _set_status(record, job.job_name, JobStatus.TIMED_OUT)
+            status_entry.error = f"Job did not complete within {job.timeout}s"
+            status_entry.finished_at = datetime.now(timezone.utc)
+            return True
+        if not job.done_event.is_set() or now < job.retry_at:
+            return False
+
+        run_record = self.jm.get_job(job.job_id)
+        if run_record and run_record.status in _TERMINAL_JOB_STATUSES:
+            _set_status(record, job.job_name, run_record.status)
+            status_entry.finished_at = run_record.finished_at
+            if run_record.error:
+                status_entry.error = run_record.error
+            return True
+        # Signalled but no terminal record visible (e.g. not yet on disk)
+        job.retry_at = now + _RECORD_RETRY_INTERVAL
+        return False
+
+    def _collect_result(
+        self, future: Future, job_name: str, record: WorkflowRecord,
+    ) -> Optional[_RunningJob]:
+        """Return the job a setup task submitted, or None if it ended there."""
+        if future.cancelled():
+            status_entry = record.job_statuses[job_name]
+            _set_status(record, job_name, JobStatus.CANCELLED)
+            status_entry.error = "Workflow cancelled"
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"Job {job_name} raised exception: {e}")
+            return None
+
+    def _skip_descendants(
+        self,
+        downstream: Set[str],
+        spec: WorkflowSpec,
+        record: WorkflowRecord,
+    ) -> None:
+        """Cancel queued downstream jobs that require success.
+
+        "always" and "failure" jobs stay eligible, but anything requiring
+        success below them is still skipped.
+        """
+        statuses = record._status_index
+        for jn in downstream:
+            if statuses[jn] == JobStatus.QUEUED and spec.jobs[jn].on_complete == "success":
+                _set_status(record, jn, JobStatus.CANCELLED)
+                record.job_statuses[jn].error = "Skipped: upstream failure"
+
     def _should_run_job(self, job_def: WorkflowJob, record: WorkflowRecord) -> bool:
         """Check if a job should run based on conditions and on_complete."""
+        statuses = record._status_index
         if job_def.on_complete == "always":
             pass  # Always run, but still check if_condition
         elif job_def.on_complete == "failure":
             # Only run if at least one required job failed
-            has_failure = any(
-                record.job_statuses[dep].status in {JobStatus.FAILED, JobStatus.TIMED_OUT}
-                for dep in job_def.requires
-                if dep in record.job_statuses
-            )
-            if not has_failure:
+            for dep in job_def.requires:
+                if statuses.get(dep) in _FAIL_STATUSES:
+                    break
+            else:
                 return False
         else:
             # "success" (default): all requires must have succeeded
-            all_success = all(
-                record.job_statuses[dep].status == JobStatus.SUCCESS
-                for dep in job_def.requires
-                if dep in record.job_statuses
-            )
-            if not all_success:
-                return False
+            for dep in job_def.requires:
+                if statuses.get(dep, JobStatus.SUCCESS) is not JobStatus.SUCCESS:
+                    return False
 
         # Evaluate if_condition
         if job_def.if_condition:
-            job_status_map = {
-                name: js.status.value
-                for name, js in record.job_statuses.items()
-            }
-            evaluator = ConditionEvaluator(job_status_map, record.env)
-            if not evaluator.evaluate(job_def.if_condition):
+            job_status_map = {name: st.value for name, st in statuses.items()}
+            if not compile_condition(job_def.if_condition)(job_status_map, record.env):
                 return False
 
         return True
 
-    def _run_level(
-        self,
-        spec: WorkflowSpec,
-        job_names: List[str],
-        record: WorkflowRecord,
-        workflow_id: str,
-        cancel_event: threading.Event,
-    ) -> None:
-        """Run all jobs in a level in parallel using ThreadPoolExecutor."""
-        # Expand matrix jobs into individual tasks
-        tasks: List[tuple] = []  # (job_name, matrix_params_or_None)
-        for job_name in job_names:
-            job_def = spec.jobs[job_name]
-            if job_def.matrix:
-                variants = expand_matrix(job_def.matrix)
-                for params in variants:
-                    tasks.append((job_name, params))
-            else:
-                tasks.append((job_name, None))
-
-        with ThreadPoolExecutor(max_workers=min(self.max_parallel, len(tasks))) as pool:
-            futures = {}
-            for job_name, params in tasks:
-                job_def = spec.jobs[job_name]
-                future = pool.submit(
-                    self._execute_single_job,
-                    spec, job_def, record, workflow_id, cancel_event, params,
-                )
-                futures[future] = (job_name, params)
-
-            for future in as_completed(futures):
-                job_name, params = futures[future]
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"Job {job_name} raised exception: {e}")
-
-    def _execute_single_job(
+    def _start_job(
         self,
         spec: WorkflowSpec,
         job_def: WorkflowJob,
@@ -211,28 +477,36 @@ class WorkflowRunner:
         workflow_id: str,
         cancel_event: threading.Event,
         matrix_params: Optional[Dict[str, str]] = None,
-    ) -> None:
-        """Submit a single job to JobManager, poll until completion."""
+    ) -> Optional[_RunningJob]:
+        """Start services and submit one job variant to JobManager.
+
+        Returns the submitted job for the run loop to wait on, or None if
+        the variant already finished (cancelled, or failed to start).
+        """
         job_name = job_def.name
+        if cancel_event.is_set():
+            status_entry = record.job_statuses[job_name]
+            _set_status(record, job_name, JobStatus.CANCELLED)
+            status_entry.error = "Workflow cancelled"
+            return None
         mk = matrix_key(matrix_params) if matrix_params else None
 
         # Generate unique job_id
         suffix = f"-{mk.replace(',', '-').replace('=', '')}" if mk else ""
         job_id = f"wf-{workflow_id}-{job_name}{suffix}"
-        job_id = re.sub(r'[^a-zA-Z0-9_\-]', '-', job_id)[:128]
+        job_id = _SANITIZE_RE.sub('-', job_id)[:128]
 
         # Merge environment: workflow env -> job env -> matrix params
-        merged_env = dict(spec.env)
-        merged_env.update(job_def.env)
-        if matrix_params:
-            for k, v in matrix_params.items():
-                merged_env[f"MATRIX_{k.upper()}"] = v
+        matrix_env = (
+            {f"MATRIX_{k.upper()}": v for k, v in matrix_params.items()}
+            if matrix_params else {}
+        )
+        merged_env = dict(ChainMap(matrix_env, job_def.env, spec.env))
 
         # Interpolate ${{ matrix.xxx }} in image name
         image = job_def.image
         if matrix_params:
-            for k, v in matrix_params.items():
-                image = image.replace(f"${{{{ matrix.{k} }}}}", v)
+            image = interpolate_matrix(image, matrix_params)
 
         # Start service containers if defined
         network_name = None
@@ -251,11 +525,21 @@ class WorkflowRunner:
             except Exception as e:
                 logger.error(f"Failed to start services for {job_name}: {e}")
                 status_entry = record.job_statuses[job_name]
-                status_entry.status = JobStatus.FAILED
+                _set_status(record, job_name, JobStatus.FAILED)
                 status_entry.error = f"Service startup failed: {e}"
                 status_entry.finished_at = datetime.now(timezone.utc)
-                return
-
+                return None
+
+        job = _RunningJob(
+            job_name=job_name,
+            job_id=job_id,
+            timeout=job_def.timeout,
+            deadline=0.0,
+            done_event=threading.Event(),
+            svc_mgr=svc_mgr,
+            service_container_ids=service_container_ids,
+            network_name=network_name,
+        )
         try:
             # Build JobSpec
             commands = [
@@ -281,7 +565,7 @@ class WorkflowRunner:
             # Update record
             status_entry = record.job_statuses[job_name]
             status_entry.job_id = job_id
-            status_entry.status = JobStatus.RUNNING
+            _set_status(record, job_name, JobStatus.RUNNING)
             status_entry.started_at = datetime.now(timezone.utc)
             if mk:
                 status_entry.matrix_key = mk
@@ -289,52 +573,37 @@ class WorkflowRunner:
             try:
                 self.jm.submit_job(job_spec)
             except ValueError as e:
-                status_entry.status = JobStatus.FAILED
+                _set_status(record, job_name, JobStatus.FAILED)
                 status_entry.error = str(e)
                 status_entry.finished_at = datetime.now(timezone.utc)
-                return
-
-            # Poll for completion
-            deadline = time.time() + job_def.timeout + 30
-            while time.time() < deadline:
-                if cancel_event.is_set():
-                    self.jm.cancel_job(job_id)
-                    status_entry.status = JobStatus.CANCELLED
-                    status_entry.error = "Workflow cancelled"
-                    status_entry.finished_at = datetime.now(timezone.utc)
-                    return
-                run_record = self.jm.get_job(job_id)
-                if run_record and run_record.status in _TERMINAL_JOB_STATUSES:
-                    status_entry.status = run_record.status
-                    status_entry.finished_at = run_record.finished_at
-                    if run_record.error:
-                        status_entry.error = run_record.error
-                    return
-                time.sleep(0.5)
-
-            # Timed out waiting
-            self.jm.cancel_job(job_id)
-            status_entry.status = JobStatus.TIMED_OUT
-            status_entry.error = f"Job did not complete within {job_def.timeout}s"
-            status_entry.finished_at = datetime.now(timezone.utc)
-        finally:
-            # Cleanup service containers
-            if svc_mgr and service_container_ids:
-                try:
-                    svc_mgr.stop_services(service_container_ids, network_name)
-                except Exception as e:
-                    logger.warning(f"Failed to cleanup services for {job_name}: {e}")
+                self._finalize_job(job)
+                return None
+        except Exception:
+            self._finalize_job(job)
+            raise
+
+        job.done_event = self.jm.job_done_event(job_id)
+        job.deadline = time.time() + job_def.timeout + 30
+        return job
+
+    def _finalize_job(self, job: _RunningJob) -> None:
+        """Clean up a finished job's service containers."""
+        if job.svc_mgr and job.service_container_ids:
+            try:
+                job.svc_mgr.stop_services(job.service_container_ids, job.network_name)
+            except Exception as e:
+                logger.warning(f"Failed to cleanup services for {job.job_name}: {e}")
 
     def _compute_final_status(self, record: WorkflowRecord) -> WorkflowStatus:
         """Determine overall workflow status from individual job statuses."""
-        statuses = {js.status for js in record.job_statuses.values()}
+        statuses = set(record._status_index.values())
 
         if all(s == JobStatus.SUCCESS for s in statuses):
             return WorkflowStatus.SUCCESS
         if all(s == JobStatus.CANCELLED for s in statuses):
             return WorkflowStatus.CANCELLED
         if any(s == JobStatus.CANCELLED for s in statuses) and not any(
-            s in {JobStatus.FAILED, JobStatus.TIMED_OUT} for s in statuses
+            s in _FAIL_STATUSES for s in statuses
         ):
             return WorkflowStatus.CANCELLED
         if any(s == JobStatus.SUCCESS for s in statuses) and any(
@@ -5,10 +5,11 @@ Handles YAML parsing, DAG cycle detection, condition expression parsing,
 and matrix expansion.
 """
 
+import functools
 import itertools
 import re
 from graphlib import TopologicalSorter, CycleError
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import yaml
 
@@ -89,6 +90,16 @@ def validate_workflow(spec: WorkflowSpec) -> None:
     for name, job in spec.jobs.items():
         if job.if_condition:
             _validate_condition_syntax(job.if_condition, name)
+        if job.matrix:
+            _template_tokens(job.image)  # Tokenize once, reused per variant
+
+
+_CONDITION_RE = re.compile(
+    r"^(jobs\.\w+\.status|env\.\w+)\s*(==|!=)\s*'[^']*'"
+    r"(\s+(and|or)\s+(jobs\.\w+\.status|env\.\w+)\s*(==|!=)\s*'[^']*')*$"
+)
+# One token of a condition expression: a quoted value, == / !=, or a word
+_TOKEN_RE = re.compile(r"\s*(?:'([^']*)'|(==|!=)|([\w.]+))")
 
 
 def _validate_condition_syntax(condition: str, job_name: str) -> None:
@@ -99,14 +110,11 @@ def _validate_condition_syntax(condition: str, job_name: str) -> None:
             f"Job '{job_name}' condition must be wrapped in ${{{{ ... }}}}, got: {condition}"
         )
     inner = stripped[3:-2].strip()
-    allowed_pattern = (
-        r"^(jobs\.\w+\.status|env\.\w+)\s*(==|!=)\s*'[^']*'"
-        r"(\s+(and|or)\s+(jobs\.\w+\.status|env\.\w+)\s*(==|!=)\s*'[^']*')*$"
-    )
-    if not re.match(allowed_pattern, inner):
+    if not _CONDITION_RE.match(inner):
         raise WorkflowValidationError(
             f"Job '{job_name}' condition has unsupported syntax: {inner}"
         )
+    compile_condition(condition)
 
 
 def get_execution_order(spec: WorkflowSpec) -> List[List[str]]:
@@ -131,6 +139,10 @@ def get_execution_order(spec: WorkflowSpec) -> List[List[str]]:
     return levels
 
 
+# A matrix combination as sorted (key, value) pairs, hashable for caching
+_Combo = Tuple[Tuple[str, str], ...]
+
+
 def expand_matrix(matrix: MatrixConfig) -> List[Dict[str, str]]:
     """
     Expand a matrix configuration into a list of parameter combinations.
@@ -139,27 +151,34 @@ def expand_matrix(matrix: MatrixConfig) -> List[Dict[str, str]]:
     if not matrix.parameters:
         return [{}]
 
-    keys = sorted(matrix.parameters.keys())
-    values = [matrix.parameters[k] for k in keys]
-    combinations = [dict(zip(keys, combo)) for combo in itertools.product(*values)]
-
-    # Apply excludes
-    filtered = []
-    for combo in combinations:
-        excluded = False
-        for exc in matrix.exclude:
-            if all(combo.get(k) == v for k, v in exc.items()):
-                excluded = True
-                break
-        if not excluded:
+    key = (
+        tuple((k, tuple(v)) for k, v in sorted(matrix.parameters.items())),
+        tuple(frozenset(exc.items()) for exc in matrix.exclude),
+        tuple(tuple(inc.items()) for inc in matrix.include),
+    )
+    return [dict(combo) for combo in _expand_matrix_cached(key)]
+
+
+@functools.lru_cache(maxsize=256)
+def _expand_matrix_cached(key) -> Tuple[_Combo, ...]:
+    parameters, excludes, includes = key
+    keys = [k for k, _ in parameters]
+
+    filtered: List[_Combo] = []
+    for values in itertools.product(*(v for _, v in parameters)):
+        combo = tuple(zip(keys, values))
+        items = set(combo)
+        if not any(exc <= items for exc in excludes):
             filtered.append(combo)
 
     # Apply includes (add additional combinations)
-    for inc in matrix.include:
-        if inc not in filtered:
+    seen = {frozenset(c) for c in filtered}
+    for inc in includes:
+        if frozenset(inc) not in seen:
+            seen.add(frozenset(inc))
             filtered.append(inc)
 
-    return filtered
+    return tuple(filtered)
 
 
 def matrix_key(params: Dict[str, str]) -> str:
@@ -167,6 +186,139 @@ def matrix_key(params: Dict[str, str]) -> str:
     return ",".join(f"{k}={v}" for k, v in sorted(params.items()))
 
 
+# Splits into [literal, placeholder, key, literal, placeholder, key, ..., literal]
+_MATRIX_REF_RE = re.compile(r"(\$\{\{\s*matrix\.([^\s}]+)\s*\}\})")
+
+
+@functools.lru_cache(maxsize=256)
+def _template_tokens(template: str) -> Tuple[str, ...]:
+    return tuple(_MATRIX_REF_RE.split(template))
+
+
+def interpolate_matrix(template: str, params: Dict[str, str]) -> str:
+    """Substitute ${{ matrix.xxx }} placeholders; unknown keys are left as-is."""
+    tokens = _template_tokens(template)
+    if len(tokens) == 1:
+        return template
+    parts = list(tokens)
+    for i in range(1, len(parts), 3):
+        key = parts[i + 1]
+        if key in params:
+            parts[i] = params[key]
+        parts[i + 1] = ""
+    return "".join(parts)
+
+
+# (job_statuses, env) -> should the job run
+ConditionFn = Callable[[Dict[str, str], Dict[str, str]], bool]
+
+
+def _always_true(job_statuses: Dict[str, str], env: Dict[str, str]) -> bool:
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def compile_condition(condition: str) -> ConditionFn:
+    """
+    Compile a ${{ ... }} condition into a reusable predicate.
+
+    Parsing happens once per distinct condition string; evaluating the
+    returned function is just dict lookups and comparisons.
+    """
+    stripped = condition.strip()
+    if not (stripped.startswith("${{") and stripped.endswith("}}")):
+        return _always_true
+    return _compile_expr(stripped[3:-2].strip())
+
+
+# Binding strength of the boolean operators; higher binds tighter
+_BOOL_OPS = {"or": 1, "and": 2}
+
+
+def _tokenize(expr: str) -> Optional[List[Tuple[str, str]]]:
+    """Split an expression into (kind, text) tokens; None if it has stray text."""
+    tokens = []
+    pos, end = 0, len(expr.rstrip())
+    while pos < end:
+        match = _TOKEN_RE.match(expr, pos)
+        if not match:
+            return None
+        literal, cmp_op, word = match.groups()
+        if literal is not None:
+            tokens.append(("str", literal))
+        elif cmp_op:
+            tokens.append(("cmp", cmp_op))
+        elif word in _BOOL_OPS:
+            tokens.append(("bool", word))
+        else:
+            tokens.append(("ref", word))
+        pos = match.end()
+    return tokens
+
+
+def _compile_expr(expr: str) -> ConditionFn:
+    """Compile a boolean expression with 'and'/'or' operators.
+
+    Tokens are ordered into postfix with the shunting-yard algorithm, so
+    'and' binds tighter than 'or' and quoted values may contain either
+    word; the postfix is then folded into nested predicates.
+    """
+    tokens = _tokenize(expr)
+    if not tokens:
+        return _always_true
+
+    postfix: List[object] = []
+    pending_ops: List[str] = []
+    for i in range(0, len(tokens), 4):
+        comparison = tokens[i:i + 3]
+        kinds = [kind for kind, _ in comparison]
+        if kinds != ["ref", "cmp", "str"]:
+            return _always_true
+        postfix.append(_compile_comparison(*(text for _, text in comparison)))
+        if i + 3 == len(tokens):
+            break
+        kind, op = tokens[i + 3]
+        if kind != "bool":
+            return _always_true
+        while pending_ops and _BOOL_OPS[pending_ops[-1]] >= _BOOL_OPS[op]:
+            postfix.append(pending_ops.pop())
+        pending_ops.append(op)
+    else:
+        return _always_true  # Trailing operator with no operand
+    postfix.extend(reversed(pending_ops))
+
+    stack: List[ConditionFn] = []
+    for item in postfix:
+        if callable(item):
+            stack.append(item)
+            continue
+        right, left = stack.pop(), stack.pop()
+        if item == "or":
+            stack.append(lambda s, e, a=left, b=right: a(s, e) or b(s, e))
+        else:
+            stack.append(lambda s, e, a=left, b=right: a(s, e) and b(s, e))
+    return stack[0]
+
+
+def _compile_comparison(ref: str, op: str, value: str) -> ConditionFn:
+    resolve = _compile_ref(ref)
+    if op == "==":
+        return lambda s, e: resolve(s, e) == value
+    return lambda s, e: resolve(s, e) != value
+
+
+def _compile_ref(ref: str) -> Callable[[Dict[str, str], Dict[str, str]], str]:
+    """Compile jobs.build.status or env.VAR into a lookup."""
+    parts = ref.split(".")
+    if len(parts) == 3 and parts[0] == "jobs" and parts[2] == "status":
+        job = parts[1]
+        return lambda s, e: s.get(job, "unknown")
+    elif len(parts) == 2 and parts[0] == "env":
+        var = parts[1]
+        return lambda s, e: e.get(var, "")
+    return lambda s, e: ""
+
+
 class ConditionEvaluator:
     """
     Evaluates ${{ ... }} condition expressions safely.
@@ -187,43 +339,4 @@ class ConditionEvaluator:
 
     def evaluate(self, condition: str) -> bool:
         """Evaluate a condition expression, return True if job should run."""
-        stripped = condition.strip()
-        if not (stripped.startswith("${{") and stripped.endswith("}}")):
-            return True
-        inner = stripped[3:-2].strip()
-        return self._eval_expr(inner)
-
-    def _eval_expr(self, expr: str) -> bool:
-        """Evaluate a boolean expression with 'and'/'or' operators."""
-        # Split on ' or ' first (lower precedence)
-        or_parts = re.split(r'\s+or\s+', expr)
-        if len(or_parts) > 1:
-            return any(self._eval_expr(part) for part in or_parts)
-
-        # Split on ' and '
-        and_parts = re.split(r'\s+and\s+', expr)
-        if len(and_parts) > 1:
-            return all(self._eval_expr(part) for part in and_parts)
-
-        # Single comparison
-        match = re.match(r"^([\w.]+)\s*(==|!=)\s*'([^']*)'$", expr.strip())
-        if not match:
-            return True
-
-        ref, op, value = match.group(1), match.group(2), match.group(3)
-        actual = self._resolve_ref(ref)
-
-        if op == "==":
-            return actual == value
-        elif op == "!=":
-            return actual != value
-        return True
-
-    def _resolve_ref(self, ref: str) -> str:
-        """Resolve jobs.build.status or env.VAR to its value."""
-        parts = ref.split(".")
-        if len(parts) == 3 and parts[0] == "jobs" and parts[2] == "status":
-            return self.job_statuses.get(parts[1], "unknown")
-        elif len(parts) == 2 and parts[0] == "env":
-            return self.env.get(parts[1], "")
-        return ""
+        return compile_condition(condition)(self.job_statuses, self.env)
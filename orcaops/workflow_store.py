@@ -3,19 +3,26 @@ Disk-backed persistence for historical workflow records.
 Scans ~/.orcaops/workflows/*/workflow.json.
 """
 
-import json
 import os
 import shutil
-from typing import List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 from orcaops.schemas import WorkflowRecord, WorkflowStatus
 
 
+_LOAD_WORKERS = 8
+
+
 class WorkflowStore:
     """Disk-backed store for historical WorkflowRecords."""
 
     def __init__(self, workflows_dir: Optional[str] = None):
         self.workflows_dir = workflows_dir or os.path.expanduser("~/.orcaops/workflows")
+        # path -> ((st_mtime_ns, st_size), record); unchanged files skip parsing
+        self._cache: Dict[str, Tuple[Tuple[int, int], WorkflowRecord]] = {}
+        self._cache_lock = threading.Lock()
 
     def list_workflows(
         self,
@@ -24,6 +31,16 @@ class WorkflowStore:
         offset: int = 0,
     ) -> Tuple[List[WorkflowRecord], int]:
         """List workflow records with optional filtering and pagination."""
+        if status is None:
+            entries = self._scan_entries()
+            # mtime tracks created_at closely enough to pick the page without
+            # parsing every record; filesystems without mtimes fall through.
+            if all(st.st_mtime_ns for _, st in entries):
+                entries.sort(key=lambda e: e[1].st_mtime_ns, reverse=True)
+                page = self._load_many(entries[offset:offset + limit])
+                page.sort(key=lambda r: r.created_at, reverse=True)
+                return page, len(entries)
+
         records = self._scan_all()
         if status:
             records = [r for r in records if r.status == status]
@@ -42,27 +59,66 @@ class WorkflowStore:
         if not os.path.isdir(wf_dir):
             return False
         shutil.rmtree(wf_dir)
+        with self._cache_lock:
+            self._cache.pop(os.path.join(wf_dir, "workflow.json"), None)
         return True
 
     def _scan_all(self) -> List[WorkflowRecord]:
         """Scan all workflow.json files from disk."""
-        records = []
-        if not os.path.isdir(self.workflows_dir):
-            return records
-        for entry in os.listdir(self.workflows_dir):
-            path = os.path.join(self.workflows_dir, entry, "workflow.json")
-            rec = self._load(path)
-            if rec:
-                records.append(rec)
-        return records
+        return self._load_many(self._scan_entries())
 
-    def _load(self, path: str) -> Optional[WorkflowRecord]:
-        """Load and validate a single WorkflowRecord from JSON."""
-        if not os.path.isfile(path):
-            return None
+    def _load_many(self, entries: List[Tuple[str, os.stat_result]]) -> List[WorkflowRecord]:
+        """Load records in order, parsing cache misses on a thread pool."""
+        with self._cache_lock:
+            misses = sum(
+                1 for path, st in entries
+                if self._cache.get(path, (None,))[0] != (st.st_mtime_ns, st.st_size)
+            )
+        if misses > 1:
+            with ThreadPoolExecutor(max_workers=min(_LOAD_WORKERS, misses)) as pool:
+                loaded = list(pool.map(lambda e: self._load(*e), entries))
+        else:
+            loaded = [self._load(path, st) for path, st in entries]
+        return [rec for rec in loaded if rec]
+
+    def _scan_entries(self) -> List[Tuple[str, os.stat_result]]:
+        """Stat every workflow.json in a single directory pass."""
+        entries = []
+        try:
+            with os.scandir(self.workflows_dir) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    path = os.path.join(entry.path, "workflow.json")
+                    try:
+                        entries.append((path, os.stat(path)))
+                    except OSError:
+                        continue
+        except OSError:
+            return entries
+        seen = {path for path, _ in entries}
+        with self._cache_lock:
+            for stale in self._cache.keys() - seen:
+                del self._cache[stale]
+        return entries
+
+    def _load(self, path: str, st: Optional[os.stat_result] = None) -> Optional[WorkflowRecord]:
+        """Load and validate a single WorkflowRecord, reusing it while the file is unchanged."""
+        if st is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+        version = (st.st_mtime_ns, st.st_size)
+        with self._cache_lock:
+            cached = self._cache.get(path)
+        if cached and cached[0] == version:
+            return cached[1]
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return WorkflowRecord.model_validate(data)
-        except (OSError, json.JSONDecodeError, ValueError):
+            with open(path, "rb") as f:
+                record = WorkflowRecord.model_validate_json(f.read())
+        except (OSError, ValueError):
             return None
+        with self._cache_lock:
+            self._cache[path] = (version, record)
+        return record
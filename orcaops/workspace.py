@@ -1,12 +1,16 @@
 """Workspace registry — CRUD for workspace records with thread-safe disk persistence."""
 
-import json
+import bisect
+import logging
 import os
 import secrets
-import tempfile
 import threading
-from typing import Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple
 
+from orcaops.atomic_write import atomic_write
 from orcaops.schemas import (
     Workspace,
     WorkspaceSettings,
@@ -15,18 +19,83 @@ from orcaops.schemas import (
     ResourceLimits,
 )
 
+logger = logging.getLogger("orcaops")
+
+_DEFAULT_DIR = os.path.expanduser("~/.orcaops/workspaces")
 _DEFAULT_WORKSPACE_ID = "ws_default"
+# Parse workspace files concurrently when many are loaded at once
+_LOAD_WORKERS = 8
+# Seconds a cached record is served as-is before a read triggers a
+# background re-read, picking up writes from other processes
+_CACHE_TTL = 5.0
+# Both models are frozen, so every workspace created with defaults shares these
+_DEFAULT_SETTINGS = WorkspaceSettings()
+_DEFAULT_LIMITS = ResourceLimits()
+
+
+class WorkspaceRegistryIOError(OSError):
+    """Raised when a workspace record could not be written to disk."""
+    pass
+
+
+class _IdPool:
+    """Hands out random hex ids sliced from one batched urandom read."""
+
+    def __init__(self, pool_bytes: int = 512):
+        self._pool_bytes = pool_bytes
+        self._reset()
+
+    def _reset(self) -> None:
+        # Also run in forked children, which must not hand out the parent's
+        # buffered ids; the lock is replaced in case the fork caught it held.
+        self._lock = threading.Lock()
+        self._hex = ""
+        self._pos = 0
+
+    def next_hex(self, nbytes: int) -> str:
+        with self._lock:
+            end = self._pos + nbytes * 2
+            if end > len(self._hex):
+                self._hex = secrets.token_hex(max(self._pool_bytes, nbytes))
+                self._pos, end = 0, nbytes * 2
+            ident = self._hex[self._pos:end]
+            self._pos = end
+        return ident
+
+
+_ID_POOL = _IdPool()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_ID_POOL._reset)
 
 
 class WorkspaceRegistry:
     """Thread-safe workspace registry backed by JSON files."""
 
     def __init__(self, workspaces_dir: Optional[str] = None):
-        self._dir = workspaces_dir or os.path.expanduser("~/.orcaops/workspaces")
+        self._dir = workspaces_dir or _DEFAULT_DIR
         os.makedirs(self._dir, exist_ok=True)
         self._lock = threading.Lock()
         self._cache: Dict[str, Workspace] = {}
-        self._load_all()
+        # Workspace ids seen on disk; their records are parsed on first access
+        self._known_ids: Set[str] = set()
+        # Last payload written per workspace, to skip identical rewrites
+        self._written: Dict[str, bytes] = {}
+        # Held per workspace from serialization through the rename, so
+        # concurrent updates reach disk in the order they were applied
+        self._write_locks: Dict[str, threading.Lock] = {}
+        # mtime_ns of each workspace file this process last wrote; a refresh
+        # ignores files that are not newer
+        self._local_mtimes: Dict[str, int] = {}
+        # name -> id of every loaded workspace that is not archived
+        self._name_index: Dict[str, str] = {}
+        # (-created_at, id) of every cached workspace, i.e. newest first
+        self._by_created: List[Tuple[float, str]] = []
+        # Monotonic time each cached record was last read or written
+        self._loaded_at: Dict[str, float] = {}
+        # (mtime_ns, size) of each cached record's file when it was last read
+        self._versions: Dict[str, Tuple[int, int]] = {}
+        self._refreshing: Set[str] = set()
+        self._index_ids()
 
     # --- public API ---
 
@@ -39,33 +108,32 @@ class WorkspaceRegistry:
         limits: Optional[ResourceLimits] = None,
         workspace_id: Optional[str] = None,
     ) -> Workspace:
-        ws_id = workspace_id or f"ws_{secrets.token_hex(8)}"
+        ws_id = workspace_id or f"ws_{_ID_POOL.next_hex(8)}"
         ws = Workspace(
             id=ws_id,
             name=name,
             owner_type=owner_type,
             owner_id=owner_id,
-            settings=settings or WorkspaceSettings(),
-            limits=limits or ResourceLimits(),
+            settings=settings or _DEFAULT_SETTINGS,
+            limits=limits or _DEFAULT_LIMITS,
         )
+        self._load_pending()  # Name check needs every record
         with self._lock:
             if ws_id in self._cache:
                 raise ValueError(f"Workspace '{ws_id}' already exists")
-            # Check for duplicate names
-            for existing in self._cache.values():
-                if existing.name == name and existing.status != WorkspaceStatus.ARCHIVED:
-                    raise ValueError(f"Workspace name '{name}' already in use")
+            if name in self._name_index:
+                raise ValueError(f"Workspace name '{name}' already in use")
             self._cache[ws_id] = ws
+            # Fresh for a TTL, so no refresh races the write below
+            self._loaded_at[ws_id] = time.monotonic()
+            self._name_index[name] = ws_id
+            self._index_created(ws)
+            self._known_ids.add(ws_id)
         self._persist(ws)
         return ws
 
     def get_workspace(self, workspace_id: str) -> Optional[Workspace]:
-        with self._lock:
-            ws = self._cache.get(workspace_id)
-        if ws is not None:
-            return ws.model_copy()
-        # Fallback to disk
-        return self._load_from_disk(workspace_id)
+        return self._get_cached(workspace_id)
 
     def get_default_workspace(self) -> Workspace:
         """Return the default workspace, creating it if needed."""
@@ -82,11 +150,15 @@ class WorkspaceRegistry:
     def list_workspaces(
         self, status: Optional[WorkspaceStatus] = None,
     ) -> List[Workspace]:
-        with self._lock:
-            workspaces = list(self._cache.values())
+        self._load_pending()
+        # Copying the list and each dict.get are atomic, so no lock is needed;
+        # an entry evicted after a failed write in between is just skipped.
+        order = list(self._by_created)
+        cached = (self._cache.get(ws_id) for _, ws_id in order)
+        workspaces = [ws for ws in cached if ws is not None]
         if status is not None:
             workspaces = [w for w in workspaces if w.status == status]
-        return sorted(workspaces, key=lambda w: w.created_at, reverse=True)
+        return workspaces
 
     def update_workspace(
         self,
@@ -95,20 +167,29 @@ class WorkspaceRegistry:
         limits: Optional[ResourceLimits] = None,
         status: Optional[WorkspaceStatus] = None,
     ) -> Workspace:
-        with self._lock:
-            ws = self._cache.get(workspace_id)
-            if ws is None:
+        while True:
+            if self._get_cached(workspace_id) is None:
                 raise ValueError(f"Workspace '{workspace_id}' not found")
-            from datetime import datetime, timezone
-            ws.updated_at = datetime.now(timezone.utc)
-            if settings is not None:
-                ws.settings = settings
-            if limits is not None:
-                ws.limits = limits
-            if status is not None:
-                ws.status = status
-        self._persist(ws)
-        return ws.model_copy()
+            with self._lock:
+                ws = self._cache.get(workspace_id)
+                if ws is None:
+                    # Evicted after a concurrent write failed; reload from disk
+                    continue
+                changes: Dict[str, object] = {}
+                if settings is not None and settings != ws.settings:
+                    changes["settings"] = settings
+                if limits is not None and limits != ws.limits:
+                    changes["limits"] = limits
+                if status is not None and status != ws.status:
+                    self._reindex_name(ws, status)
+                    changes["status"] = status
+                if not changes:
+                    return ws
+                changes["updated_at"] = datetime.now(timezone.utc)
+                ws = self._cache[workspace_id] = ws.model_copy(update=changes)
+                self._loaded_at[workspace_id] = time.monotonic()
+            self._persist(ws)
+            return ws
 
     def archive_workspace(self, workspace_id: str) -> bool:
         try:
@@ -120,49 +201,183 @@ class WorkspaceRegistry:
     # --- persistence ---
 
     def _persist(self, ws: Workspace) -> None:
-        ws_dir = os.path.join(self._dir, ws.id)
-        ws_path = os.path.join(ws_dir, "workspace.json")
-        try:
-            os.makedirs(ws_dir, exist_ok=True)
-            fd, tmp_path = tempfile.mkstemp(dir=ws_dir, suffix=".tmp")
+        with self._lock:
+            write_lock = self._write_locks.setdefault(ws.id, threading.Lock())
+        with write_lock:
+            with self._lock:
+                if self._cache.get(ws.id) is not ws:
+                    return  # Superseded; the newer record is written by its own call
+                payload = ws.model_dump_json().encode("utf-8")
+                if self._written.get(ws.id) == payload:
+                    return  # Unchanged since the last write
+                self._written[ws.id] = payload
+            ws_dir = os.path.join(self._dir, ws.id)
+            ws_path = self._path(ws.id)
             try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    f.write(ws.model_dump_json(indent=2))
-                os.replace(tmp_path, ws_path)
-            except BaseException:
                 try:
-                    os.unlink(tmp_path)
-                except OSError:
-                    pass
-                raise
-        except OSError:
-            pass
+                    atomic_write(ws_path, payload)
+                except FileNotFoundError:
+                    # First write for this workspace; only then create its directory
+                    os.makedirs(ws_dir, exist_ok=True)
+                    atomic_write(ws_path, payload)
+            except OSError as e:
+                logger.error(f"Failed to persist workspace {ws.id}: {e}")
+                with self._lock:
+                    self._written.pop(ws.id, None)
+                    self._evict(ws)
+                raise WorkspaceRegistryIOError(
+                    f"Could not write workspace '{ws.id}': {e}"
+                ) from e
+            try:
+                st = os.stat(ws_path)
+            except OSError:
+                return
+            with self._lock:
+                # Disk now holds our write, so a refresh need not re-read it
+                self._versions[ws.id] = (st.st_mtime_ns, st.st_size)
+                self._local_mtimes[ws.id] = st.st_mtime_ns
 
-    def _load_from_disk(self, workspace_id: str) -> Optional[Workspace]:
-        ws_path = os.path.join(self._dir, workspace_id, "workspace.json")
-        if not os.path.exists(ws_path):
-            return None
+    def _evict(self, ws: Workspace) -> None:
+        """Drop a cached workspace whose write failed, so the cache matches disk.
+
+        The next access reloads whatever is on disk. Caller must hold the lock.
+        """
+        if self._cache.get(ws.id) is not ws:
+            return  # Already replaced by a later update
+        del self._cache[ws.id]
+        self._loaded_at.pop(ws.id, None)
+        self._versions.pop(ws.id, None)
+        self._by_created.remove((-ws.created_at.timestamp(), ws.id))
+        if self._name_index.get(ws.name) == ws.id:
+            del self._name_index[ws.name]
+
+    def _get_cached(self, workspace_id: str) -> Optional[Workspace]:
+        """Return the cached workspace, loading it from disk on first access.
+
+        A record older than _CACHE_TTL is still returned immediately; a
+        background thread re-reads it for later callers.
+        """
+        # A single dict lookup is atomic and cached workspaces are immutable,
+        # so readers need not queue behind writers on the lock.
+        ws = self._cache.get(workspace_id)
+        if ws is None:
+            return self._load_from_disk(workspace_id)
+        if time.monotonic() - self._loaded_at.get(workspace_id, 0.0) > _CACHE_TTL:
+            self._schedule_refresh(workspace_id)
+        return ws
+
+    def _schedule_refresh(self, workspace_id: str) -> None:
+        with self._lock:
+            if workspace_id in self._refreshing:
+                return
+            self._refreshing.add(workspace_id)
+        threading.Thread(
+            target=self._refresh, args=(workspace_id,),
+            name=f"workspace-refresh-{workspace_id}", daemon=True,
+        ).start()
+
+    def _refresh(self, workspace_id: str) -> None:
+        """Swap in the on-disk record unless a local update replaced it first.
+
+        The file is only re-read when its (mtime_ns, size) has changed and
+        it is newer than this process's last write of it, so an older
+        version still on disk while a local write is pending is ignored.
+        """
         try:
-            with open(ws_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            ws = Workspace.model_validate(data)
             with self._lock:
-                self._cache[workspace_id] = ws
-            return ws.model_copy()
-        except (OSError, json.JSONDecodeError, ValueError):
+                stale = self._cache.get(workspace_id)
+                known_version = self._versions.get(workspace_id)
+                local_mtime = self._local_mtimes.get(workspace_id)
+            if stale is None:
+                return
+            try:
+                st = os.stat(self._path(workspace_id))
+                changed = (st.st_mtime_ns, st.st_size) != known_version and (
+                    local_mtime is None or st.st_mtime_ns > local_mtime
+                )
+            except OSError:
+                changed = False
+            loaded = self._read(workspace_id) if changed else None
+            with self._lock:
+                # A missing, corrupt or unchanged file keeps the cached record
+                self._loaded_at[workspace_id] = time.monotonic()
+                if loaded is None or self._cache.get(workspace_id) is not stale:
+                    return
+                raw, fresh, version = loaded
+                self._written[workspace_id] = raw  # What disk holds now
+                self._versions[workspace_id] = version
+                if fresh == stale:
+                    return
+                if fresh.status != stale.status:
+                    self._reindex_name(stale, fresh.status)
+                self._cache[workspace_id] = fresh
+        finally:
+            with self._lock:
+                self._refreshing.discard(workspace_id)
+
+    def _path(self, workspace_id: str) -> str:
+        return os.path.join(self._dir, workspace_id, "workspace.json")
+
+    def _read(
+        self, workspace_id: str,
+    ) -> Optional[Tuple[bytes, Workspace, Tuple[int, int]]]:
+        """Read and validate a workspace file; None if missing or corrupt."""
+        try:
+            with open(self._path(workspace_id), "rb") as f:
+                st = os.fstat(f.fileno())
+                raw = f.read()
+            return raw, Workspace.model_validate_json(raw), (st.st_mtime_ns, st.st_size)
+        except (OSError, ValueError):
             return None
 
-    def _load_all(self) -> None:
-        """Scan disk and populate the in-memory cache."""
-        if not os.path.isdir(self._dir):
+    def _load_from_disk(self, workspace_id: str) -> Optional[Workspace]:
+        loaded = self._read(workspace_id)
+        if loaded is None:
+            with self._lock:
+                self._known_ids.discard(workspace_id)
+            return None
+        _, ws, version = loaded
+        with self._lock:
+            # Keep an instance another thread cached (and maybe updated) first
+            cached = self._cache.setdefault(workspace_id, ws)
+            self._known_ids.add(workspace_id)
+            if cached is ws:
+                self._loaded_at[workspace_id] = time.monotonic()
+                self._versions[workspace_id] = version
+                self._index_created(ws)
+                if ws.status != WorkspaceStatus.ARCHIVED:
+                    self._name_index.setdefault(ws.name, ws.id)
+        return cached
+
+    def _index_created(self, ws: Workspace) -> None:
+        """Record a new cache entry's creation order. Caller must hold the lock."""
+        bisect.insort(self._by_created, (-ws.created_at.timestamp(), ws.id))
+
+    def _reindex_name(self, ws: Workspace, status: WorkspaceStatus) -> None:
+        """Track a status change in _name_index. Caller must hold the lock."""
+        if status == WorkspaceStatus.ARCHIVED:
+            if self._name_index.get(ws.name) == ws.id:
+                del self._name_index[ws.name]
+        elif ws.status == WorkspaceStatus.ARCHIVED:
+            self._name_index.setdefault(ws.name, ws.id)
+
+    def _index_ids(self) -> None:
+        """List workspace directories without reading their records."""
+        try:
+            with os.scandir(self._dir) as entries:
+                ids = {entry.name for entry in entries if entry.is_dir()}
+        except OSError:
             return
-        for entry in os.listdir(self._dir):
-            ws_path = os.path.join(self._dir, entry, "workspace.json")
-            if os.path.isfile(ws_path):
-                try:
-                    with open(ws_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    ws = Workspace.model_validate(data)
-                    self._cache[ws.id] = ws
-                except (OSError, json.JSONDecodeError, ValueError):
-                    pass
+        with self._lock:
+            self._known_ids |= ids
+
+    def _load_pending(self) -> None:
+        """Parse every indexed workspace that is not cached yet."""
+        with self._lock:
+            pending = list(self._known_ids - self._cache.keys())
+        if len(pending) <= 1:
+            for workspace_id in pending:
+                self._load_from_disk(workspace_id)
+            return
+        with ThreadPoolExecutor(max_workers=min(_LOAD_WORKERS, len(pending))) as pool:
+            list(pool.map(self._load_from_disk, pending))
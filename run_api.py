@@ -12,8 +12,14 @@ Usage:
 """
 
 import argparse
+import logging
+import logging.config
 import sys
 import uvicorn
+from uvicorn.config import LOG_LEVELS, LOGGING_CONFIG
+
+# uvicorn's own startup logger, so the banner shares its format and level
+logger = logging.getLogger("uvicorn.error")
 
 
 def main():
@@ -43,10 +49,13 @@ def main():
     
     args = parser.parse_args()
     
-    print(f"🐳 Starting OrcaOps FastAPI Server...")
-    print(f"🌐 Server will be available at: http://{args.host}:{args.port}")
-    print(f"📚 API documentation at: http://{args.host}:{args.port}/docs")
-    print(f"🔧 Interactive API explorer at: http://{args.host}:{args.port}/redoc")
+    logging.config.dictConfig(LOGGING_CONFIG)
+    logger.setLevel(LOG_LEVELS[args.log_level])
+    base_url = f"http://{args.host}:{args.port}"
+    logger.info(
+        f"🐳 Starting OrcaOps FastAPI Server at {base_url} "
+        f"(docs: {base_url}/docs, explorer: {base_url}/redoc)"
+    )
     
     try:
         uvicorn.run(
@@ -57,10 +66,10 @@ def main():
             log_level=args.log_level
         )
     except KeyboardInterrupt:
-        print("\n🛑 Server stopped by user")
+        logger.info("🛑 Server stopped by user")
         sys.exit(0)
     except Exception as e:
-        print(f"❌ Failed to start server: {e}")
+        logger.error(f"❌ Failed to start server: {e}")
         sys.exit(1)
 
 
@@ -11,6 +11,21 @@ import subprocess
 import signal
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _wait_ready(session, url, process, timeout=10.0):
+    """Poll url until the server answers, it exits, or timeout elapses."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            session.get(url, timeout=1)
+            return True
+        except requests.ConnectionError:
+            time.sleep(0.05)
+    return False
 
 
 def test_cli_functionality():
@@ -19,8 +34,10 @@ def test_cli_functionality():
     
     try:
         # Test orcaops doctor command
-        result = subprocess.run(["./.venv/bin/orcaops", "doctor"], 
-                              capture_output=True, text=True, timeout=10)
+        # Only the exit code and stderr are inspected, so don't buffer stdout
+        result = subprocess.run(["./.venv/bin/orcaops", "doctor"],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                              text=True, timeout=10)
         if result.returncode == 0:
             print("✅ CLI: orcaops doctor - PASSED")
         else:
@@ -38,6 +55,9 @@ def test_api_functionality():
     """Test FastAPI functionality"""
     print("🌐 Testing API functionality...")
     
+    # One session so every probe reuses the same keep-alive connection
+    session = requests.Session()
+
     # Start API server in background
     try:
         api_process = subprocess.Popen([
@@ -45,14 +65,15 @@ def test_api_functionality():
             "--host", "127.0.0.1", "--port", "8081"
         ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         
-        # Wait for server to start
-        time.sleep(3)
-        
         # Test API endpoints
         base_url = "http://127.0.0.1:8081"
+
+        if not _wait_ready(session, f"{base_url}/", api_process):
+            print("❌ API: server did not become ready")
+            return False
         
         # Test root endpoint
-        response = requests.get(f"{base_url}/", timeout=5)
+        response = session.get(f"{base_url}/", timeout=5)
         if response.status_code == 200:
             print("✅ API: GET / - PASSED")
         else:
@@ -60,7 +81,7 @@ def test_api_functionality():
             return False
             
         # Test containers endpoint
-        response = requests.get(f"{base_url}/orcaops/ps", timeout=5)
+        response = session.get(f"{base_url}/orcaops/ps", timeout=5)
         if response.status_code == 200:
             print("✅ API: GET /orcaops/ps - PASSED")
         else:
@@ -68,7 +89,7 @@ def test_api_functionality():
             return False
             
         # Test templates endpoint  
-        response = requests.get(f"{base_url}/orcaops/templates", timeout=5)
+        response = session.get(f"{base_url}/orcaops/templates", timeout=5)
         if response.status_code == 200:
             print("✅ API: GET /orcaops/templates - PASSED")
         else:
@@ -84,6 +105,7 @@ def test_api_functionality():
         print(f"❌ API test error: {e}")
         return False
     finally:
+        session.close()
         # Clean up API process
         try:
             api_process.terminate()
@@ -102,11 +124,12 @@ def main():
     
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
     
-    # Test CLI
-    cli_passed = test_cli_functionality()
-    
-    # Test API
-    api_passed = test_api_functionality()
+    # The CLI check and the API server boot are independent, so overlap them
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        cli_future = executor.submit(test_cli_functionality)
+        api_future = executor.submit(test_api_functionality)
+        cli_passed = cli_future.result()
+        api_passed = api_future.result()
     
     # Results
     print("\n📊 Test Results:")
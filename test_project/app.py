@@ -6,12 +6,13 @@ Provides system info, health checks, and logging endpoints
 
 import os
 import time
-import json
 import logging
+import itertools
+import threading
 import psutil
 from datetime import datetime
-from flask import Flask, jsonify, request, render_template
-from threading import Thread
+import multiprocessing
+from flask import Flask, g, jsonify, request, render_template
 
 # Configure logging
 logging.basicConfig(
@@ -24,17 +25,55 @@ logging.basicConfig(
 )
 
 app = Flask(__name__)
+# Response key order doesn't matter to clients; skip sorting every dict
+# (including the full environment) on each jsonify
+app.json.sort_keys = False
 logger = logging.getLogger(__name__)
 
 # Global stats
 start_time = time.time()
-request_count = 0
+# next() on a count is atomic under the GIL, unlike a global += 1
+_request_counter = itertools.count(1)
+
+# Fixed for the life of the process; avoids a uname(2) per field per request
+_UNAME = os.uname()
+_CPU_COUNT = os.cpu_count()
+_ENV_SNAPSHOT = {k: v for k, v in os.environ.items() if not k.startswith('_')}
+
+# Prime the CPU counter: a non-blocking cpu_percent() reports usage since
+# the previous call, so the first real request gets a meaningful value
+psutil.cpu_percent(interval=None)
+
+# Scrapers polling /api/system reuse one psutil sample per window
+_SAMPLE_TTL = 0.5
+_sample = {'time': 0.0, 'stats': None}
+
+def _sample_system():
+    """Return CPU/memory/disk stats, re-reading psutil at most every _SAMPLE_TTL"""
+    now = time.monotonic()
+    if _sample['stats'] is None or now - _sample['time'] >= _SAMPLE_TTL:
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        _sample['stats'] = {
+            'cpu_percent': psutil.cpu_percent(interval=None),
+            'memory': {
+                'total': memory.total,
+                'available': memory.available,
+                'percent': memory.percent
+            },
+            'disk': {
+                'total': disk.total,
+                'free': disk.free,
+                'percent': disk.percent
+            },
+        }
+        _sample['time'] = now
+    return _sample['stats']
 
 def log_request_info():
     """Middleware to log request information"""
-    global request_count
-    request_count += 1
-    logger.info(f"Request #{request_count}: {request.method} {request.path} from {request.remote_addr}")
+    g.request_number = next(_request_counter)
+    logger.info(f"Request #{g.request_number}: {request.method} {request.path} from {request.remote_addr}")
 
 @app.before_request
 def before_request():
@@ -46,8 +85,8 @@ def home():
     uptime = time.time() - start_time
     return render_template('index.html', 
                          uptime=round(uptime, 2),
-                         requests=request_count,
-                         hostname=os.uname().nodename)
+                         requests=g.request_number,
+                         hostname=_UNAME.nodename)
 
 @app.route('/health')
 def health_check():
@@ -63,44 +102,40 @@ def system_info():
     """Return detailed system information"""
     try:
         return jsonify({
-            'hostname': os.uname().nodename,
-            'platform': os.uname().sysname,
-            'architecture': os.uname().machine,
-            'cpu_count': os.cpu_count(),
-            'cpu_percent': psutil.cpu_percent(interval=1),
-            'memory': {
-                'total': psutil.virtual_memory().total,
-                'available': psutil.virtual_memory().available,
-                'percent': psutil.virtual_memory().percent
-            },
-            'disk': {
-                'total': psutil.disk_usage('/').total,
-                'free': psutil.disk_usage('/').free,
-                'percent': psutil.disk_usage('/').percent
-            },
+            'hostname': _UNAME.nodename,
+            'platform': _UNAME.sysname,
+            'architecture': _UNAME.machine,
+            'cpu_count': _CPU_COUNT,
+            **_sample_system(),
             'uptime_seconds': round(time.time() - start_time, 2),
-            'request_count': request_count,
-            'environment_vars': {k: v for k, v in os.environ.items() if not k.startswith('_')},
+            'request_count': g.request_number,
+            'environment_vars': _ENV_SNAPSHOT,
             'timestamp': datetime.now().isoformat()
         })
     except Exception as e:
         logger.error(f"Error getting system info: {e}")
         return jsonify({'error': 'Failed to get system info'}), 500
 
+def _cpu_stress(duration):
+    """Spin one core for duration seconds, checking the clock every 100k iterations"""
+    end_time = time.monotonic() + duration
+    n = 0
+    while time.monotonic() < end_time:
+        for _ in range(100_000):
+            n += 1
+
 @app.route('/api/stress/<int:duration>')
 def stress_test(duration):
     """CPU stress test endpoint"""
     if duration > 30:
         return jsonify({'error': 'Duration too long, max 30 seconds'}), 400
     
-    def cpu_stress():
-        end_time = time.time() + duration
-        while time.time() < end_time:
-            pass
-    
+    # Burn CPU in a separate process so it doesn't hold this interpreter's GIL
+    # and slow down every other endpoint; also reaps finished earlier runs
+    multiprocessing.active_children()
     logger.info(f"Starting {duration}s CPU stress test")
-    thread = Thread(target=cpu_stress)
-    thread.start()
+    worker = multiprocessing.Process(target=_cpu_stress, args=(duration,), daemon=True)
+    worker.start()
     
     return jsonify({
         'message': f'CPU stress test started for {duration} seconds',
@@ -108,19 +143,53 @@ def stress_test(duration):
         'timestamp': datetime.now().isoformat()
     })
 
+LOG_PATH = '/app/logs/app.log'
+_TAIL_BLOCK = 16384
+
+# One read-only descriptor shared by every /api/logs request
+_log_fd = None
+_log_fd_lock = threading.Lock()
+
+def _open_log():
+    """Return the cached descriptor for LOG_PATH, reopening it after rotation"""
+    global _log_fd
+    with _log_fd_lock:
+        # Raises FileNotFoundError if the log is gone, like open() did
+        st = os.stat(LOG_PATH)
+        if _log_fd is not None and os.fstat(_log_fd).st_ino != st.st_ino:
+            os.close(_log_fd)
+            _log_fd = None
+        if _log_fd is None:
+            _log_fd = os.open(LOG_PATH, os.O_RDONLY)
+        return _log_fd
+
+def _tail_lines(n):
+    """Return the last n log lines, pread-ing backwards in fixed blocks"""
+    fd = _open_log()
+    pos = os.fstat(fd).st_size
+    data = b''
+    # One extra newline so the first kept line is known to be complete
+    while pos > 0 and data.count(b'\n') <= n:
+        step = min(_TAIL_BLOCK, pos)
+        pos -= step
+        data = os.pread(fd, step, pos) + data
+    return [line.decode('utf-8', errors='replace') for line in data.splitlines()[-n:]]
+
+def _count_lines(path):
+    """Count lines by streaming the file, without holding it in memory"""
+    with open(path, 'rb') as f:
+        return sum(block.count(b'\n') for block in iter(lambda: f.read(65536), b''))
+
 @app.route('/api/logs')
 def get_logs():
-    """Return recent application logs"""
+    """Return recent application logs (?count=1 also counts every line)"""
     try:
-        with open('/app/logs/app.log', 'r') as f:
-            logs = f.readlines()
-        
-        # Return last 50 lines
-        recent_logs = logs[-50:] if len(logs) > 50 else logs
-        
+        recent_logs = _tail_lines(50)
+        total_lines = _count_lines(LOG_PATH) if request.args.get('count') else None
+
         return jsonify({
             'logs': [log.strip() for log in recent_logs],
-            'total_lines': len(logs),
+            'total_lines': total_lines,
             'showing_lines': len(recent_logs)
         })
     except FileNotFoundError:
@@ -134,5 +203,23 @@ if __name__ == '__main__':
     logger.info(f"Process ID: {os.getpid()}")
     logger.info(f"User ID: {os.getuid()}")
     
-    # Run the Flask development server
-    app.run(host='0.0.0.0', port=8080, debug=False)
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        # Fall back to the Flask development server
+        app.run(host='0.0.0.0', port=8080, debug=False)
+    else:
+        class _Server(BaseApplication):
+            """Serve the app from gunicorn without a separate config file"""
+            def load_config(self):
+                # One process keeps the request counter meaningful; threads serve
+                # concurrent requests
+                self.cfg.set('bind', '0.0.0.0:8080')
+                self.cfg.set('worker_class', 'gthread')
+                self.cfg.set('workers', 1)
+                self.cfg.set('threads', 8)
+
+            def load(self):
+                return app
+
+        _Server().run()
@@ -0,0 +1,75 @@
+"""Shared fixtures for the API test modules."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def pytest_collection_modifyitems(config, items):
+    # Group the endpoint tests so they can be selected (-m api) or split out
+    # as a unit; they share the session-scoped client below
+    for item in items:
+        if item.path.name.startswith("test_api_"):
+            item.add_marker(pytest.mark.api)
+
+
+@pytest.fixture(scope="session")
+def app():
+    # Imported lazily: importing main builds the Docker client, so only the
+    # tests that need the app should pay for (or fail on) it
+    from main import app
+    return app
+
+
+@pytest.fixture(scope="session")
+def test_client(app):
+    # Entered once so every request reuses one portal and event loop rather
+    # than starting a fresh one each time; the lifespan's manager shutdown
+    # then runs only at session end
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def shared_output_dir(tmp_path_factory):
+    """An empty job output directory for tests that mock the job manager."""
+    return str(tmp_path_factory.mktemp("orcaops_out"))
+
+
+@pytest.fixture
+def mock_api(monkeypatch):
+    """Replace ``orcaops.api`` globals with fresh MagicMocks for one test.
+
+    ``mock_api("run_store", "job_manager")`` returns the mocks in the order
+    the names were given; monkeypatch restores the originals on teardown.
+    """
+    def _mock(*names):
+        # Set on the module object: a dotted-string target would be
+        # re-resolved through the import system for every name
+        import orcaops.api as api
+        # Built fresh each time rather than copied from a cached prototype:
+        # a shallow copy of a MagicMock shares its child mocks, so one
+        # test's return_value setup would leak into the next
+        mocks = []
+        for name in names:
+            mock = MagicMock()
+            monkeypatch.setattr(api, name, mock)
+            mocks.append(mock)
+        return mocks
+    return _mock
+
+
+@pytest.fixture
+def orcaops_mocks(mock_api, shared_output_dir):
+    """Mock the core orcaops.api singletons for one test."""
+    dm, jm, rs, wm, ws = mock_api(
+        "docker_manager", "job_manager", "run_store",
+        "workflow_manager", "workflow_store",
+    )
+    jm.output_dir = shared_output_dir
+    return SimpleNamespace(
+        docker_manager=dm, job_manager=jm, run_store=rs,
+        workflow_manager=wm, workflow_store=ws,
+    )
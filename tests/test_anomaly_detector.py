@@ -2,7 +2,6 @@
 
 import json
 import os
-import tempfile
 import threading
 from datetime import datetime, timezone, timedelta
 from unittest.mock import patch, MagicMock
@@ -45,8 +44,13 @@ def _make_baseline(**overrides):
     return PerformanceBaseline(**defaults)
 
 
-def _make_record(**overrides):
-    now = datetime.now(timezone.utc)
+@pytest.fixture
+def now():
+    return datetime.now(timezone.utc)
+
+
+def _make_record(now=None, **overrides):
+    now = now or datetime.now(timezone.utc)
     defaults = dict(
         job_id="test-job-1",
         status=JobStatus.SUCCESS,
@@ -68,18 +72,18 @@ def _make_record(**overrides):
 
 
 class TestDurationAnomaly:
-    def test_no_anomaly_within_threshold(self):
+    def test_no_anomaly_within_threshold(self, now):
         detector = AnomalyDetector()
-        record = _make_record()  # 15s, mean=15, stddev=2 -> z=0
+        record = _make_record(now=now)  # 15s, mean=15, stddev=2 -> z=0
         baseline = _make_baseline()
         anomalies = detector.detect(record, baseline)
         assert len(anomalies) == 0
 
-    def test_warning_z_score_above_2(self):
+    def test_warning_z_score_above_2(self, now):
         detector = AnomalyDetector()
         # duration=20s, mean=15, stddev=2 -> z=2.5 -> WARNING
-        now = datetime.now(timezone.utc)
         record = _make_record(
+            now=now,
             started_at=now - timedelta(seconds=20),
             finished_at=now,
         )
@@ -89,11 +93,11 @@ class TestDurationAnomaly:
         assert len(duration_anomalies) == 1
         assert duration_anomalies[0].severity == AnomalySeverity.WARNING
 
-    def test_critical_z_score_above_3(self):
+    def test_critical_z_score_above_3(self, now):
         detector = AnomalyDetector()
         # duration=22s, mean=15, stddev=2 -> z=3.5 -> CRITICAL
-        now = datetime.now(timezone.utc)
         record = _make_record(
+            now=now,
             started_at=now - timedelta(seconds=22),
             finished_at=now,
         )
@@ -236,6 +240,11 @@ class TestZScore:
 # ===================================================================
 
 
+@pytest.fixture
+def store(tmp_path):
+    return AnomalyStore(anomalies_dir=str(tmp_path))
+
+
 class TestAnomalyStore:
     def _make_anomaly_record(self, anomaly_id="anom_test1", job_id="job-1"):
         return AnomalyRecord(
@@ -252,97 +261,99 @@ class TestAnomalyStore:
             deviation_percent=66.7,
         )
 
-    def test_store_and_query(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            store = AnomalyStore(anomalies_dir=tmpdir)
-            rec = self._make_anomaly_record()
-            store.store(rec)
-            results, total = store.query()
-            assert total == 1
-            assert results[0].anomaly_id == "anom_test1"
-
-    def test_query_by_type(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            store = AnomalyStore(anomalies_dir=tmpdir)
-            store.store(self._make_anomaly_record("a1"))
-            store.store(AnomalyRecord(
-                anomaly_id="a2",
-                job_id="job-2",
-                baseline_key="python:3.11::pytest",
-                anomaly_type=AnomalyType.MEMORY,
-                severity=AnomalySeverity.CRITICAL,
-                title="Memory anomaly",
-                description="Too much memory",
-                expected="200MB",
-                actual="450MB",
-            ))
-            results, total = store.query(anomaly_type=AnomalyType.DURATION)
-            assert total == 1
-            assert results[0].anomaly_id == "a1"
-
-    def test_query_by_severity(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            store = AnomalyStore(anomalies_dir=tmpdir)
-            store.store(self._make_anomaly_record("a1"))
-            store.store(AnomalyRecord(
-                anomaly_id="a2",
-                job_id="job-2",
-                baseline_key="key",
-                anomaly_type=AnomalyType.MEMORY,
-                severity=AnomalySeverity.CRITICAL,
-                title="Memory",
-                description="desc",
-                expected="200MB",
-                actual="450MB",
-            ))
-            results, total = store.query(severity=AnomalySeverity.CRITICAL)
-            assert total == 1
-            assert results[0].anomaly_id == "a2"
-
-    def test_query_by_job_id(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            store = AnomalyStore(anomalies_dir=tmpdir)
-            store.store(self._make_anomaly_record("a1", job_id="job-1"))
-            store.store(self._make_anomaly_record("a2", job_id="job-2"))
-            results, total = store.query(job_id="job-1")
-            assert total == 1
-            assert results[0].job_id == "job-1"
-
-    def test_acknowledge(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            store = AnomalyStore(anomalies_dir=tmpdir)
-            store.store(self._make_anomaly_record("a1"))
-            assert store.acknowledge("a1") is True
-            results, _ = store.query()
-            assert results[0].acknowledged is True
-
-    def test_acknowledge_not_found(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            store = AnomalyStore(anomalies_dir=tmpdir)
-            assert store.acknowledge("nonexistent") is False
-
-    def test_query_pagination(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            store = AnomalyStore(anomalies_dir=tmpdir)
-            for i in range(5):
-                store.store(self._make_anomaly_record(f"a{i}"))
-            results, total = store.query(limit=2)
-            assert total == 5
-            assert len(results) == 2
-
-    def test_query_acknowledged_filter(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            store = AnomalyStore(anomalies_dir=tmpdir)
-            store.store(self._make_anomaly_record("a1"))
-            store.store(self._make_anomaly_record("a2"))
-            store.acknowledge("a1")
-            results, total = store.query(acknowledged=False)
-            assert total == 1
-            assert results[0].anomaly_id == "a2"
-
-    def test_empty_store_query(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            store = AnomalyStore(anomalies_dir=tmpdir)
+    def test_store_and_query(self, store):
+        rec = self._make_anomaly_record()
+        store.store(rec)
+        results, total = store.query()
+        assert total == 1
+        assert results[0].anomaly_id == "anom_test1"
+
+    def test_query_by_type(self, store):
+        store.store(self._make_anomaly_record("a1"))
+        store.store(AnomalyRecord(
+            anomaly_id="a2",
+            job_id="job-2",
+            baseline_key="python:3.11::pytest",
+            anomaly_type=AnomalyType.MEMORY,
+            severity=AnomalySeverity.CRITICAL,
+            title="Memory anomaly",
+            description="Too much memory",
+            expected="200MB",
+            actual="450MB",
+        ))
+        results, total = store.query(anomaly_type=AnomalyType.DURATION)
+        assert total == 1
+        assert results[0].anomaly_id == "a1"
+
+    def test_query_by_severity(self, store):
+        store.store(self._make_anomaly_record("a1"))
+        store.store(AnomalyRecord(
+            anomaly_id="a2",
+            job_id="job-2",
+            baseline_key="key",
+            anomaly_type=AnomalyType.MEMORY,
+            severity=AnomalySeverity.CRITICAL,
+            title="Memory",
+            description="desc",
+            expected="200MB",
+            actual="450MB",
+        ))
+        results, total = store.query(severity=AnomalySeverity.CRITICAL)
+        assert total == 1
+        assert results[0].anomaly_id == "a2"
+
+    def test_query_by_job_id(self, store):
+        store.store(self._make_anomaly_record("a1", job_id="job-1"))
+        store.store(self._make_anomaly_record("a2", job_id="job-2"))
+        results, total = store.query(job_id="job-1")
+        assert total == 1
+        assert results[0].job_id == "job-1"
+
+    def test_acknowledge(self, store):
+        store.store(self._make_anomaly_record("a1"))
+        assert store.acknowledge("a1") is True
+        results, _ = store.query()
+        assert results[0].acknowledged is True
+
+    def test_acknowledge_not_found(self, store):
+        assert store.acknowledge("nonexistent") is False
+
+    def test_query_pagination(self, store):
+        for i in range(5):
+            store.store(self._make_anomaly_record(f"a{i}"))
+        results, total = store.query(limit=2)
+        assert total == 5
+        assert len(results) == 2
+
+    def test_query_acknowledged_filter(self, store):
+        store.store(self._make_anomaly_record("a1"))
+        store.store(self._make_anomaly_record("a2"))
+        store.acknowledge("a1")
+        results, total = store.query(acknowledged=False)
+        assert total == 1
+        assert results[0].anomaly_id == "a2"
+
+    def test_empty_store_query(self, store):
+        results, total = store.query()
+        assert total == 0
+        assert results == []
+
+    def test_query_reuses_parsed_files_until_they_change(self, store):
+        for i in range(3):
+            store.store(self._make_anomaly_record(f"a{i}"))
+        assert store.query()[1] == 3
+
+        with patch.object(
+            AnomalyRecord, "model_validate_json", side_effect=AssertionError("re-parsed"),
+        ):
             results, total = store.query()
-            assert total == 0
-            assert results == []
+        assert total == 3
+
+        store.store(self._make_anomaly_record("a3"))
+        assert store.query()[1] == 4
+
+    def test_acknowledge_visible_to_next_query(self, store):
+        store.store(self._make_anomaly_record("a1"))
+        assert store.query(acknowledged=False)[1] == 1
+        assert store.acknowledge("a1") is True
+        assert store.query(acknowledged=False)[1] == 0
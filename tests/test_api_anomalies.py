@@ -1,10 +1,6 @@
 """Tests for anomaly API endpoints."""
 
-import json
-from unittest.mock import patch, MagicMock
-from datetime import datetime, timezone
-
-from fastapi.testclient import TestClient
+import pytest
 
 from orcaops.schemas import (
     AnomalyRecord,
@@ -13,6 +9,11 @@ from orcaops.schemas import (
 )
 
 
+@pytest.fixture
+def client(test_client):
+    return test_client
+
+
 def _make_anomaly(anomaly_id="anom_test1", anomaly_type=AnomalyType.DURATION):
     return AnomalyRecord(
         anomaly_id=anomaly_id,
@@ -29,11 +30,8 @@ def _make_anomaly(anomaly_id="anom_test1", anomaly_type=AnomalyType.DURATION):
     )
 
 
-@patch("orcaops.api.anomaly_store")
-@patch("orcaops.api.docker_manager")
-def test_list_anomalies(mock_dm, mock_store):
-    from main import app
-    client = TestClient(app)
+def test_list_anomalies(mock_api, client):
+    mock_store, = mock_api("anomaly_store")
     mock_store.query.return_value = ([_make_anomaly()], 1)
     resp = client.get("/orcaops/anomalies")
     assert resp.status_code == 200
@@ -42,11 +40,8 @@ def test_list_anomalies(mock_dm, mock_store):
     assert data["anomalies"][0]["anomaly_id"] == "anom_test1"
 
 
-@patch("orcaops.api.anomaly_store")
-@patch("orcaops.api.docker_manager")
-def test_list_anomalies_with_filters(mock_dm, mock_store):
-    from main import app
-    client = TestClient(app)
+def test_list_anomalies_with_filters(mock_api, client):
+    mock_store, = mock_api("anomaly_store")
     mock_store.query.return_value = ([], 0)
     resp = client.get("/orcaops/anomalies?anomaly_type=duration&severity=warning")
     assert resp.status_code == 200
@@ -56,31 +51,22 @@ def test_list_anomalies_with_filters(mock_dm, mock_store):
     assert call_kwargs["severity"] == AnomalySeverity.WARNING
 
 
-@patch("orcaops.api.anomaly_store")
-@patch("orcaops.api.docker_manager")
-def test_list_anomalies_invalid_type(mock_dm, mock_store):
-    from main import app
-    client = TestClient(app)
+def test_list_anomalies_invalid_type(mock_api, client):
+    mock_store, = mock_api("anomaly_store")
     resp = client.get("/orcaops/anomalies?anomaly_type=bogus")
     assert resp.status_code == 400
 
 
-@patch("orcaops.api.anomaly_store")
-@patch("orcaops.api.docker_manager")
-def test_acknowledge_anomaly(mock_dm, mock_store):
-    from main import app
-    client = TestClient(app)
+def test_acknowledge_anomaly(mock_api, client):
+    mock_store, = mock_api("anomaly_store")
     mock_store.acknowledge.return_value = True
     resp = client.post("/orcaops/anomalies/anom_test1/acknowledge")
     assert resp.status_code == 200
     assert "acknowledged" in resp.json()["message"]
 
 
-@patch("orcaops.api.anomaly_store")
-@patch("orcaops.api.docker_manager")
-def test_acknowledge_not_found(mock_dm, mock_store):
-    from main import app
-    client = TestClient(app)
+def test_acknowledge_not_found(mock_api, client):
+    mock_store, = mock_api("anomaly_store")
     mock_store.acknowledge.return_value = False
     resp = client.post("/orcaops/anomalies/nonexistent/acknowledge")
     assert resp.status_code == 404
@@ -1,19 +1,16 @@
 """Tests for baseline API endpoints."""
 
-import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from datetime import datetime, timezone
 
 import pytest
-from fastapi.testclient import TestClient
 
 from orcaops.schemas import PerformanceBaseline
 
 
 @pytest.fixture
-def client():
-    from main import app
-    return TestClient(app)
+def client(test_client):
+    return test_client
 
 
 def _make_baseline(key="python:3.11::pytest", sample_count=10):
@@ -1,36 +1,25 @@
 """Tests for Sprint 03 API observability endpoints."""
 
-import json
-import os
-import tempfile
 from datetime import datetime, timezone, timedelta
-from unittest.mock import MagicMock, patch
 
 import pytest
-from fastapi.testclient import TestClient
 
-from orcaops.schemas import (
-    RunRecord, JobStatus, StepResult, JobSpec, SandboxSpec, JobCommand,
-)
+from orcaops.schemas import RunRecord, JobStatus, StepResult
 
 
-@pytest.fixture
-def client():
-    """Create a test client with mocked dependencies."""
-    with patch("orcaops.api.docker_manager"), \
-         patch("orcaops.api.job_manager") as mock_jm, \
-         patch("orcaops.api.run_store") as mock_rs:
+# The endpoints never compare against the wall clock, so records use a
+# fixed timestamp instead of reading it per build
+_FIXED_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
-        mock_jm.output_dir = tempfile.mkdtemp()
-        mock_rs.list_runs.return_value = ([], 0)
 
-        from main import app
-        yield TestClient(app), mock_jm, mock_rs
+@pytest.fixture
+def client(test_client, orcaops_mocks):
+    """Create a test client with mocked dependencies."""
+    return test_client, orcaops_mocks.job_manager, orcaops_mocks.run_store
 
 
-def _record(job_id="test-1", status=JobStatus.SUCCESS, duration_secs=30.0,
-            image="python:3.11", commands=None):
-    now = datetime.now(timezone.utc)
+def _build_record(duration_secs=30.0, commands=None):
+    now = _FIXED_NOW
     steps = []
     if commands:
         for cmd in commands:
@@ -44,9 +33,9 @@ def _record(job_id="test-1", status=JobStatus.SUCCESS, duration_secs=30.0,
             duration_seconds=duration_secs,
         ))
     return RunRecord(
-        job_id=job_id,
-        status=status,
-        image_ref=image,
+        job_id="test-1",
+        status=JobStatus.SUCCESS,
+        image_ref="python:3.11",
         created_at=now,
         started_at=now - timedelta(seconds=duration_secs),
         finished_at=now,
@@ -54,6 +43,19 @@ def _record(job_id="test-1", status=JobStatus.SUCCESS, duration_secs=30.0,
     )
 
 
+# Validated once; the default-shaped records below are copies of it
+_DEFAULT_RECORD = _build_record()
+
+
+def _record(job_id="test-1", status=JobStatus.SUCCESS, duration_secs=30.0,
+            image="python:3.11", commands=None):
+    if duration_secs == 30.0 and commands is None:
+        base = _DEFAULT_RECORD
+    else:
+        base = _build_record(duration_secs, commands)
+    return base.model_copy(update={"job_id": job_id, "status": status, "image_ref": image})
+
+
 class TestSummaryEndpoint:
     def test_summary_success(self, client):
         tc, mock_jm, mock_rs = client
@@ -88,6 +90,7 @@ class TestSummaryEndpoint:
 class TestMetricsEndpoint:
     def test_metrics_empty(self, client):
         tc, mock_jm, mock_rs = client
+        mock_rs.list_runs.return_value = ([], 0)
 
         resp = tc.get("/orcaops/metrics/jobs")
         assert resp.status_code == 200
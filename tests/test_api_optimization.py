@@ -1,8 +1,6 @@
 """Tests for optimization/debug API endpoints."""
 
-from unittest.mock import patch, MagicMock
-
-from fastapi.testclient import TestClient
+from datetime import datetime, timezone
 
 from orcaops.schemas import (
     DebugAnalysis,
@@ -11,19 +9,18 @@ from orcaops.schemas import (
 )
 
 
-def _job_payload():
-    return {
-        "job_id": "opt-test",
-        "sandbox": {"image": "python:3.11"},
-        "commands": [{"command": "pytest"}],
-    }
+_FIXED_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+_JOB_PAYLOAD = {
+    "job_id": "opt-test",
+    "sandbox": {"image": "python:3.11"},
+    "commands": [{"command": "pytest"}],
+}
 
 
-@patch("orcaops.api.auto_optimizer")
-@patch("orcaops.api.docker_manager")
-def test_optimize_endpoint(mock_dm, mock_ao):
-    from main import app
-    client = TestClient(app)
+def test_optimize_endpoint(mock_api, test_client):
+    mock_ao, = mock_api("auto_optimizer")
     mock_ao.suggest_optimizations.return_value = [
         OptimizationSuggestion(
             suggestion_type="timeout",
@@ -34,23 +31,18 @@ def test_optimize_endpoint(mock_dm, mock_ao):
             baseline_key="python:3.11::pytest",
         )
     ]
-    resp = client.post("/orcaops/optimize", json=_job_payload())
+    resp = test_client.post("/orcaops/optimize", json=_JOB_PAYLOAD)
     assert resp.status_code == 200
     data = resp.json()
     assert data["count"] == 1
 
 
-@patch("orcaops.api.knowledge_base")
-@patch("orcaops.api.run_store")
-@patch("orcaops.api.docker_manager")
-def test_debug_endpoint(mock_dm, mock_rs, mock_kb):
-    from main import app
+def test_debug_endpoint(mock_api, test_client):
+    mock_rs, mock_kb = mock_api("run_store", "knowledge_base")
     from orcaops.schemas import RunRecord, JobStatus
-    from datetime import datetime, timezone
-    client = TestClient(app)
     mock_rs.get_run.return_value = RunRecord(
         job_id="fail-1", status=JobStatus.FAILED,
-        created_at=datetime.now(timezone.utc),
+        created_at=_FIXED_NOW,
     )
     mock_kb.analyze_failure.return_value = DebugAnalysis(
         job_id="fail-1",
@@ -59,27 +51,21 @@ def test_debug_endpoint(mock_dm, mock_rs, mock_kb):
         suggested_fixes=["Fix it"],
         next_steps=["Check logs"],
     )
-    resp = client.post("/orcaops/debug/fail-1")
+    resp = test_client.post("/orcaops/debug/fail-1")
     assert resp.status_code == 200
     data = resp.json()
     assert data["job_id"] == "fail-1"
 
 
-@patch("orcaops.api.run_store")
-@patch("orcaops.api.docker_manager")
-def test_debug_not_found(mock_dm, mock_rs):
-    from main import app
-    client = TestClient(app)
+def test_debug_not_found(mock_api, test_client):
+    mock_rs, = mock_api("run_store")
     mock_rs.get_run.return_value = None
-    resp = client.post("/orcaops/debug/nonexistent")
+    resp = test_client.post("/orcaops/debug/nonexistent")
     assert resp.status_code == 404
 
 
-@patch("orcaops.api.knowledge_base")
-@patch("orcaops.api.docker_manager")
-def test_list_patterns(mock_dm, mock_kb):
-    from main import app
-    client = TestClient(app)
+def test_list_patterns(mock_api, test_client):
+    mock_kb, = mock_api("knowledge_base")
     mock_kb.list_patterns.return_value = [
         FailurePattern(
             pattern_id="test",
@@ -89,7 +75,7 @@ def test_list_patterns(mock_dm, mock_kb):
             description="desc",
         )
     ]
-    resp = client.get("/orcaops/knowledge-base/patterns")
+    resp = test_client.get("/orcaops/knowledge-base/patterns")
     assert resp.status_code == 200
     data = resp.json()
     assert data["count"] == 1
@@ -1,26 +1,17 @@
 """Tests for prediction API endpoints."""
 
-from unittest.mock import patch, MagicMock
-
-from fastapi.testclient import TestClient
-
 from orcaops.schemas import DurationPrediction, FailureRiskAssessment
 
 
-def _job_payload():
-    return {
-        "job_id": "pred-test",
-        "sandbox": {"image": "python:3.11"},
-        "commands": [{"command": "pytest"}],
-    }
+_JOB_PAYLOAD = {
+    "job_id": "pred-test",
+    "sandbox": {"image": "python:3.11"},
+    "commands": [{"command": "pytest"}],
+}
 
 
-@patch("orcaops.api.failure_predictor")
-@patch("orcaops.api.duration_predictor")
-@patch("orcaops.api.docker_manager")
-def test_predict_endpoint(mock_dm, mock_dp, mock_fp):
-    from main import app
-    client = TestClient(app)
+def test_predict_endpoint(mock_api, test_client):
+    mock_dp, mock_fp = mock_api("duration_predictor", "failure_predictor")
     mock_dp.predict.return_value = DurationPrediction(
         estimated_seconds=15.0,
         confidence=0.5,
@@ -35,19 +26,15 @@ def test_predict_endpoint(mock_dm, mock_dp, mock_fp):
         factors=["Stable execution."],
         sample_count=10,
     )
-    resp = client.post("/orcaops/predict", json=_job_payload())
+    resp = test_client.post("/orcaops/predict", json=_JOB_PAYLOAD)
     assert resp.status_code == 200
     data = resp.json()
     assert data["duration"]["estimated_seconds"] == 15.0
     assert data["failure_risk"]["risk_level"] == "low"
 
 
-@patch("orcaops.api.failure_predictor")
-@patch("orcaops.api.duration_predictor")
-@patch("orcaops.api.docker_manager")
-def test_predict_no_baseline(mock_dm, mock_dp, mock_fp):
-    from main import app
-    client = TestClient(app)
+def test_predict_no_baseline(mock_api, test_client):
+    mock_dp, mock_fp = mock_api("duration_predictor", "failure_predictor")
     mock_dp.predict.return_value = DurationPrediction(
         estimated_seconds=300.0,
         confidence=0.05,
@@ -61,7 +48,7 @@ def test_predict_no_baseline(mock_dm, mock_dp, mock_fp):
         factors=["No data."],
         sample_count=0,
     )
-    resp = client.post("/orcaops/predict", json=_job_payload())
+    resp = test_client.post("/orcaops/predict", json=_JOB_PAYLOAD)
     assert resp.status_code == 200
     data = resp.json()
     assert data["duration"]["sample_count"] == 0
@@ -1,32 +1,29 @@
 import pytest
-from unittest.mock import patch, MagicMock
-from fastapi.testclient import TestClient
 from datetime import datetime, timezone
 
 from orcaops.schemas import RunRecord, JobStatus
 
 
+_FIXED_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+_DEFAULT_RECORD = RunRecord(
+    job_id="test-job",
+    status=JobStatus.SUCCESS,
+    created_at=_FIXED_NOW,
+    steps=[],
+    artifacts=[],
+)
+
+
 def _make_record(job_id="test-job", status=JobStatus.SUCCESS):
-    return RunRecord(
-        job_id=job_id,
-        status=status,
-        created_at=datetime.now(timezone.utc),
-        steps=[],
-        artifacts=[],
-    )
+    return _DEFAULT_RECORD.model_copy(update={"job_id": job_id, "status": status})
 
 
 @pytest.fixture
-def client():
+def client(test_client, orcaops_mocks):
     """Create test client with mocked dependencies."""
-    with patch("orcaops.api.DockerManager"), \
-         patch("orcaops.api.JobManager"), \
-         patch("orcaops.api.RunStore") as MockRunStore:
-        store = MockRunStore.return_value
-        import orcaops.api
-        orcaops.api.run_store = store
-        from main import app
-        yield TestClient(app), store
+    return test_client, orcaops_mocks.run_store
 
 
 def test_list_runs_empty(client):
@@ -1,36 +1,33 @@
 import pytest
-from unittest.mock import patch, MagicMock
-from fastapi.testclient import TestClient
 from datetime import datetime, timezone
 
 from orcaops.schemas import RunRecord, JobStatus
 
 
+_FIXED_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+_DEFAULT_RECORD = RunRecord(
+    job_id="test-job",
+    status=JobStatus.RUNNING,
+    sandbox_id="container-123",
+    created_at=_FIXED_NOW,
+    started_at=_FIXED_NOW,
+    steps=[],
+    artifacts=[],
+)
+
+
 def _make_record(job_id="test-job", status=JobStatus.RUNNING, sandbox_id="container-123"):
-    return RunRecord(
-        job_id=job_id,
-        status=status,
-        sandbox_id=sandbox_id,
-        created_at=datetime.now(timezone.utc),
-        started_at=datetime.now(timezone.utc),
-        steps=[],
-        artifacts=[],
+    return _DEFAULT_RECORD.model_copy(
+        update={"job_id": job_id, "status": status, "sandbox_id": sandbox_id},
     )
 
 
 @pytest.fixture
-def client():
+def client(test_client, orcaops_mocks):
     """Create test client with mocked dependencies."""
-    with patch("orcaops.api.DockerManager") as MockDM, \
-         patch("orcaops.api.JobManager") as MockJM, \
-         patch("orcaops.api.RunStore"):
-        jm = MockJM.return_value
-        dm = MockDM.return_value
-        import orcaops.api
-        orcaops.api.job_manager = jm
-        orcaops.api.docker_manager = dm
-        from main import app
-        yield TestClient(app), jm, dm
+    return test_client, orcaops_mocks.job_manager, orcaops_mocks.docker_manager
 
 
 def test_stream_logs_job_not_found(client):
@@ -48,25 +45,12 @@ def test_stream_logs_no_container(client):
     assert resp.status_code == 400
 
 
-def test_stream_logs_completed_job(client):
-    test_client, jm, dm = client
-    record = _make_record(status=JobStatus.SUCCESS)
-    jm.get_job.return_value = record
-    resp = test_client.get("/orcaops/jobs/test-job/logs/stream")
-    assert resp.status_code == 410
-
-
-def test_stream_logs_failed_job(client):
-    test_client, jm, dm = client
-    record = _make_record(status=JobStatus.FAILED)
-    jm.get_job.return_value = record
-    resp = test_client.get("/orcaops/jobs/test-job/logs/stream")
-    assert resp.status_code == 410
-
-
-def test_stream_logs_cancelled_job(client):
+@pytest.mark.parametrize(
+    "status", [JobStatus.SUCCESS, JobStatus.FAILED, JobStatus.CANCELLED],
+)
+def test_stream_logs_finished_job(client, status):
     test_client, jm, dm = client
-    record = _make_record(status=JobStatus.CANCELLED)
+    record = _make_record(status=status)
     jm.get_job.return_value = record
     resp = test_client.get("/orcaops/jobs/test-job/logs/stream")
     assert resp.status_code == 410
@@ -1,46 +1,54 @@
 """Tests for workflow API endpoints."""
 
-import tempfile
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
 
 import pytest
-from fastapi.testclient import TestClient
 
 from orcaops.schemas import (
     WorkflowRecord, WorkflowStatus, WorkflowJobStatus, JobStatus,
 )
 
 
+_FIXED_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+_DEFAULT_WF_RECORD = WorkflowRecord(
+    workflow_id="wf-1",
+    spec_name="test-wf",
+    status=WorkflowStatus.SUCCESS,
+    created_at=_FIXED_NOW,
+    job_statuses={
+        "build": WorkflowJobStatus(
+            job_name="build", status=JobStatus.SUCCESS,
+        ),
+    },
+)
+
+
 def _wf_record(workflow_id="wf-1", status=WorkflowStatus.SUCCESS):
-    return WorkflowRecord(
-        workflow_id=workflow_id,
-        spec_name="test-wf",
-        status=status,
-        created_at=datetime.now(timezone.utc),
-        job_statuses={
-            "build": WorkflowJobStatus(
-                job_name="build", status=JobStatus.SUCCESS,
-            ),
-        },
+    return _DEFAULT_WF_RECORD.model_copy(
+        update={"workflow_id": workflow_id, "status": status},
     )
 
 
+# Every submit test posts the same minimal spec
+_SUBMIT_BODY = {
+    "spec": {
+        "name": "test-wf",
+        "jobs": {
+            "build": {
+                "image": "python:3.11",
+                "commands": ["echo hello"],
+            },
+        },
+    },
+}
+
+
 @pytest.fixture
-def client():
+def client(test_client, orcaops_mocks):
     """Create a test client with mocked dependencies."""
-    with patch("orcaops.api.docker_manager"), \
-         patch("orcaops.api.job_manager") as mock_jm, \
-         patch("orcaops.api.run_store") as mock_rs, \
-         patch("orcaops.api.workflow_manager") as mock_wm, \
-         patch("orcaops.api.workflow_store") as mock_ws:
-
-        mock_jm.output_dir = tempfile.mkdtemp()
-        mock_rs.list_runs.return_value = ([], 0)
-        mock_ws.list_workflows.return_value = ([], 0)
-
-        from main import app
-        yield TestClient(app), mock_wm, mock_ws
+    return test_client, orcaops_mocks.workflow_manager, orcaops_mocks.workflow_store
 
 
 class TestSubmitWorkflow:
@@ -48,17 +56,7 @@ class TestSubmitWorkflow:
         tc, mock_wm, mock_ws = client
         mock_wm.submit_workflow.return_value = _wf_record(status=WorkflowStatus.PENDING)
 
-        resp = tc.post("/orcaops/workflows", json={
-            "spec": {
-                "name": "test-wf",
-                "jobs": {
-                    "build": {
-                        "image": "python:3.11",
-                        "commands": ["echo hello"],
-                    },
-                },
-            },
-        })
+        resp = tc.post("/orcaops/workflows", json=_SUBMIT_BODY)
         assert resp.status_code == 200
         data = resp.json()
         assert data["workflow_id"] == "wf-1"
@@ -68,12 +66,7 @@ class TestSubmitWorkflow:
         tc, mock_wm, mock_ws = client
         mock_wm.submit_workflow.return_value = _wf_record(status=WorkflowStatus.PENDING)
 
-        tc.post("/orcaops/workflows", json={
-            "spec": {
-                "name": "test-wf",
-                "jobs": {"build": {"image": "alpine", "commands": ["echo"]}},
-            },
-        })
+        tc.post("/orcaops/workflows", json=_SUBMIT_BODY)
         call_kwargs = mock_wm.submit_workflow.call_args[1]
         assert call_kwargs["triggered_by"] == "api"
 
@@ -81,12 +74,7 @@ class TestSubmitWorkflow:
         tc, mock_wm, mock_ws = client
         mock_wm.submit_workflow.side_effect = ValueError("Invalid spec")
 
-        resp = tc.post("/orcaops/workflows", json={
-            "spec": {
-                "name": "test-wf",
-                "jobs": {"build": {"image": "alpine", "commands": ["echo"]}},
-            },
-        })
+        resp = tc.post("/orcaops/workflows", json=_SUBMIT_BODY)
         assert resp.status_code == 400
 
 
@@ -148,21 +136,16 @@ class TestCancelWorkflow:
 
 
 class TestListWorkflows:
-    def test_list_empty(self, client):
-        tc, mock_wm, mock_ws = client
-        mock_wm.list_workflows.return_value = []
-
-        resp = tc.get("/orcaops/workflows")
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["count"] == 0
-
-    def test_list_with_records(self, client):
+    @pytest.mark.parametrize("workflows, expected", [
+        ([], 0),
+        ([_wf_record("wf-1"), _wf_record("wf-2")], 2),
+    ])
+    def test_list(self, client, workflows, expected):
         tc, mock_wm, mock_ws = client
-        mock_wm.list_workflows.return_value = [_wf_record("wf-1"), _wf_record("wf-2")]
+        mock_wm.list_workflows.return_value = workflows
         mock_ws.list_workflows.return_value = ([], 0)
 
         resp = tc.get("/orcaops/workflows")
         assert resp.status_code == 200
         data = resp.json()
-        assert data["count"] == 2
+        assert data["count"] == expected
@@ -1,21 +1,16 @@
 """Tests for workspace and API key management endpoints."""
 
-import tempfile
-from datetime import datetime, timezone
-from unittest.mock import patch, MagicMock
-
 import pytest
-from fastapi.testclient import TestClient
 
 from orcaops.schemas import (
     Workspace,
     WorkspaceStatus,
     WorkspaceSettings,
     OwnerType,
-    ResourceLimits,
     APIKey,
     Permission,
 )
+from orcaops.workspace import WorkspaceRegistryIOError
 
 
 def _ws(workspace_id="ws_test1", name="test-ws", status=WorkspaceStatus.ACTIVE):
@@ -29,21 +24,10 @@ def _ws(workspace_id="ws_test1", name="test-ws", status=WorkspaceStatus.ACTIVE):
 
 
 @pytest.fixture
-def client():
-    with patch("orcaops.api.docker_manager"), \
-         patch("orcaops.api.job_manager") as mock_jm, \
-         patch("orcaops.api.run_store") as mock_rs, \
-         patch("orcaops.api.workflow_manager") as mock_wm, \
-         patch("orcaops.api.workflow_store") as mock_ws, \
-         patch("orcaops.api.workspace_registry") as mock_wr, \
-         patch("orcaops.api.key_manager") as mock_km:
-
-        mock_jm.output_dir = tempfile.mkdtemp()
-        mock_rs.list_runs.return_value = ([], 0)
-        mock_ws.list_workflows.return_value = ([], 0)
-
-        from main import app
-        yield TestClient(app), mock_wr, mock_km
+def client(test_client, mock_api):
+    # The workspace and key routes only touch these two singletons
+    mock_wr, mock_km = mock_api("workspace_registry", "key_manager")
+    return test_client, mock_wr, mock_km
 
 
 class TestCreateWorkspace:
@@ -72,6 +56,17 @@ class TestCreateWorkspace:
         })
         assert resp.status_code == 409
 
+    def test_create_write_failure(self, client):
+        tc, mock_wr, _ = client
+        mock_wr.create_workspace.side_effect = WorkspaceRegistryIOError("disk full")
+
+        resp = tc.post("/orcaops/workspaces", json={
+            "name": "ws",
+            "owner_type": "user",
+            "owner_id": "u1",
+        })
+        assert resp.status_code == 503
+
 
 class TestListWorkspaces:
     def test_list_all(self, client):
@@ -111,8 +106,9 @@ class TestGetWorkspace:
 class TestUpdateWorkspace:
     def test_update_settings(self, client):
         tc, mock_wr, _ = client
-        updated = _ws()
-        updated.settings = WorkspaceSettings(retention_days=7)
+        updated = _ws().model_copy(
+            update={"settings": WorkspaceSettings(retention_days=7)},
+        )
         mock_wr.update_workspace.return_value = updated
 
         resp = tc.patch("/orcaops/workspaces/ws_test1", json={
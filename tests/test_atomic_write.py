@@ -0,0 +1,66 @@
+"""Tests for atomic state-file writes."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from orcaops.atomic_write import atomic_write
+
+
+@pytest.fixture(params=["tmpfile", "mkstemp"])
+def write_mode(request):
+    if request.param == "mkstemp":
+        with patch("orcaops.atomic_write._O_TMPFILE", None):
+            yield request.param
+    else:
+        yield request.param
+
+
+class TestAtomicWrite:
+    def test_creates_file(self, tmp_path, write_mode):
+        path = str(tmp_path / "state.json")
+        atomic_write(path, b'{"a": 1}')
+        with open(path, "rb") as f:
+            assert f.read() == b'{"a": 1}'
+
+    def test_replaces_existing(self, tmp_path, write_mode):
+        path = str(tmp_path / "state.json")
+        atomic_write(path, b"old contents that are longer")
+        atomic_write(path, b"new")
+        with open(path, "rb") as f:
+            assert f.read() == b"new"
+
+    def test_leaves_no_temp_files(self, tmp_path, write_mode):
+        path = str(tmp_path / "state.json")
+        for i in range(3):
+            atomic_write(path, str(i).encode())
+        assert os.listdir(tmp_path) == ["state.json"]
+
+    def test_missing_dir_raises(self, tmp_path, write_mode):
+        with pytest.raises(OSError):
+            atomic_write(str(tmp_path / "missing" / "state.json"), b"x")
+
+    def test_falls_back_when_proc_link_fails(self, tmp_path):
+        path = str(tmp_path / "state.json")
+        with patch("orcaops.atomic_write.os.link", side_effect=PermissionError):
+            atomic_write(path, b"fallback")
+        with open(path, "rb") as f:
+            assert f.read() == b"fallback"
+        assert os.listdir(tmp_path) == ["state.json"]
+
+    def test_overwrite_skips_tmpfile(self, tmp_path):
+        path = str(tmp_path / "state.json")
+        atomic_write(path, b"old")
+        with patch("orcaops.atomic_write.os.link") as link:
+            atomic_write(path, b"new")
+        link.assert_not_called()
+        with open(path, "rb") as f:
+            assert f.read() == b"new"
+
+    def test_failed_write_removes_temp_file(self, tmp_path, write_mode):
+        path = str(tmp_path / "state.json")
+        with patch("orcaops.atomic_write._write_all", side_effect=OSError):
+            with pytest.raises(OSError):
+                atomic_write(path, b"x")
+        assert os.listdir(tmp_path) == []
@@ -3,6 +3,7 @@
 import json
 import os
 import threading
+from unittest.mock import patch
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -91,6 +92,42 @@ class TestAuditLogger:
             lines = f.readlines()
         assert len(lines) == 50
 
+    def test_events_visible_to_store_before_close(self, tmp_path):
+        logger = AuditLogger(str(tmp_path))
+        logger.log(_event(resource_id="job-1"))
+        assert AuditStore(str(tmp_path)).query()[1] == 1
+        logger.log(_event(resource_id="job-2"))
+        assert AuditStore(str(tmp_path)).query()[1] == 2
+        logger.close()
+
+    def test_reopens_removed_file(self, tmp_path):
+        logger = AuditLogger(str(tmp_path))
+        event = _event(resource_id="job-1")
+        logger.log(event)
+        path = os.path.join(str(tmp_path), event.timestamp.strftime("%Y-%m-%d") + ".jsonl")
+        os.unlink(path)
+
+        logger.log(_event(resource_id="job-2"))
+        with open(path) as f:
+            lines = f.readlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["resource_id"] == "job-2"
+        logger.close()
+
+    def test_switches_file_per_day(self, tmp_path):
+        logger = AuditLogger(str(tmp_path))
+        today = _event(resource_id="job-1")
+        earlier = today.model_copy(update={"timestamp": today.timestamp - timedelta(days=1)})
+        logger.log(today)
+        logger.log(earlier)
+        logger.log(today)
+        logger.close()
+
+        assert sorted(os.listdir(str(tmp_path))) == sorted(
+            e.timestamp.strftime("%Y-%m-%d") + ".jsonl" for e in (today, earlier)
+        )
+        assert AuditStore(str(tmp_path)).query()[1] == 3
+
 
 class TestAuditStore:
     def _populate(self, audit_dir, events):
@@ -137,6 +174,29 @@ class TestAuditStore:
         assert total == 0
         assert events == []
 
+    def test_query_skips_malformed_lines(self, tmp_path):
+        self._populate(str(tmp_path), [_event(resource_id="j1")])
+        date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        with open(os.path.join(str(tmp_path), f"{date_str}.jsonl"), "a") as f:
+            f.write("not json\n")
+            f.write('{"event_id": "evt_partial"}\n')
+        events, total = AuditStore(str(tmp_path)).query()
+        assert total == 1
+        assert events[0].resource_id == "j1"
+
+    def test_query_reuses_parsed_files_until_they_change(self, tmp_path):
+        self._populate(str(tmp_path), [_event(resource_id=f"j{i}") for i in range(3)])
+        store = AuditStore(str(tmp_path))
+        assert store.query()[1] == 3
+
+        with patch.object(
+            AuditEvent, "model_validate_json", side_effect=AssertionError("re-parsed"),
+        ):
+            assert store.query()[1] == 3
+
+        self._populate(str(tmp_path), [_event(resource_id="j3")])
+        assert store.query()[1] == 4
+
     def test_cleanup_old_files(self, tmp_path):
         # Create a file that looks old
         old_date = (datetime.now(timezone.utc) - timedelta(days=100)).strftime("%Y-%m-%d")
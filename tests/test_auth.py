@@ -2,7 +2,9 @@
 
 import os
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
+import bcrypt
 import pytest
 
 from orcaops.schemas import APIKey, Permission
@@ -28,6 +30,11 @@ class TestPermissions:
     def test_empty_permissions(self):
         assert has_permission([], Permission.JOB_READ) is False
 
+    def test_accepts_frozenset(self):
+        perms = frozenset(ROLE_TEMPLATES["viewer"])
+        assert has_permission(perms, Permission.JOB_READ) is True
+        assert has_permission(perms, Permission.JOB_CREATE) is False
+
 
 class TestRoleTemplates:
     def test_admin_has_all(self):
@@ -93,6 +100,28 @@ class TestKeyManager:
         assert validated.key_id == api_key.key_id
         assert ws_id == "ws_test"
 
+    def test_generate_key_stores_sha256_hash(self, tmp_path):
+        km = KeyManager(str(tmp_path))
+        _, api_key = km.generate_key("ws_test", "test-key", role="admin")
+        assert api_key.key_hash.startswith("sha256:")
+
+    def test_validate_legacy_bcrypt_key(self, tmp_path):
+        km = KeyManager(str(tmp_path))
+        plain = "orcaops_ws_test_" + "ab" * 16
+        legacy = APIKey(
+            key_id="key_legacy",
+            key_hash=bcrypt.hashpw(plain.encode(), bcrypt.gensalt(4)).decode(),
+            name="legacy",
+            workspace_id="ws_test",
+            permissions=[Permission.JOB_READ],
+        )
+        km._persist_key(legacy)
+
+        result = km.validate_key(plain)
+        assert result is not None
+        assert result[0].key_id == "key_legacy"
+        assert km.validate_key("orcaops_ws_test_" + "cd" * 16) is None
+
     def test_validate_key_wrong_key(self, tmp_path):
         km = KeyManager(str(tmp_path))
         km.generate_key("ws_test", "real-key", role="admin")
@@ -161,6 +190,19 @@ class TestKeyManager:
         for k in keys:
             assert k.key_hash == "***"
 
+    def test_list_keys_skips_corrupt_file(self, tmp_path):
+        km = KeyManager(str(tmp_path))
+        km.generate_key("ws_test", "good", role="viewer")
+        (tmp_path / "ws_test" / "keys" / "key_bad.json").write_text("{not json")
+        keys = km.list_keys("ws_test")
+        assert [k.name for k in keys] == ["good"]
+
+    def test_validating_unknown_workspace_creates_nothing(self, tmp_path):
+        km = KeyManager(str(tmp_path))
+        assert km.validate_key("orcaops_ws_nobody_secret") is None
+        assert km.list_keys("ws_nobody") == []
+        assert list(tmp_path.iterdir()) == []
+
     def test_list_keys_empty(self, tmp_path):
         km = KeyManager(str(tmp_path))
         assert km.list_keys("ws_empty") == []
@@ -190,6 +232,43 @@ class TestKeyManager:
         km.generate_key("ws_test", "first", role="admin")
         assert km.has_keys("ws_test") is True
 
+    def test_validate_reads_only_indexed_key_file(self, tmp_path):
+        km = KeyManager(str(tmp_path))
+        for i in range(3):
+            km.generate_key("ws_test", f"other-{i}")
+        plain, api_key = km.generate_key("ws_test", "target")
+
+        with patch.object(km, "_load_keys", side_effect=AssertionError("scanned")):
+            result = km.validate_key(plain)
+        assert result is not None
+        assert result[0].key_id == api_key.key_id
+
+    def test_unknown_key_rejected_without_rescan(self, tmp_path):
+        km = KeyManager(str(tmp_path))
+        km.generate_key("ws_test", "real-key")
+        assert km.validate_key("orcaops_ws_test_" + "00" * 16) is None
+
+        with patch.object(km, "_load_keys", side_effect=AssertionError("scanned")):
+            assert km.validate_key("orcaops_ws_test_" + "11" * 16) is None
+
+    def test_key_added_by_other_instance_after_scan(self, tmp_path):
+        km1 = KeyManager(str(tmp_path))
+        km1.generate_key("ws_test", "first")
+        assert km1.validate_key("orcaops_ws_test_" + "00" * 16) is None
+
+        plain, api_key = KeyManager(str(tmp_path)).generate_key("ws_test", "second")
+        result = km1.validate_key(plain)
+        assert result is not None
+        assert result[0].key_id == api_key.key_id
+
+    def test_indexed_key_revoked_by_other_instance(self, tmp_path):
+        km1 = KeyManager(str(tmp_path))
+        plain, api_key = km1.generate_key("ws_test", "shared")
+        assert km1.validate_key(plain) is not None
+
+        KeyManager(str(tmp_path)).revoke_key("ws_test", api_key.key_id)
+        assert km1.validate_key(plain) is None
+
     def test_persistence_across_instances(self, tmp_path):
         km1 = KeyManager(str(tmp_path))
         plain, api_key = km1.generate_key("ws_test", "persist", role="admin")
@@ -9,6 +9,10 @@ from orcaops.schemas import Permission
 from orcaops.auth_middleware import AuthContext, get_auth_context, require_auth, require_permission
 
 
+class FakeRequest:
+    """get_auth_context never reads the request, so it needs no attributes."""
+
+
 class FakeCredentials:
     def __init__(self, credentials: str):
         self.credentials = credentials
@@ -28,13 +32,11 @@ class TestAuthContext:
 
 class TestGetAuthContext:
     def test_no_credentials(self):
-        from fastapi import Request
-        mock_req = MagicMock(spec=Request)
+        mock_req = FakeRequest()
         result = get_auth_context(mock_req, None)
         assert result is None
 
     def test_valid_key(self):
-        from fastapi import Request
         from orcaops.schemas import APIKey
         import orcaops.auth_middleware as mod
 
@@ -47,7 +49,7 @@ class TestGetAuthContext:
         old_km = mod._key_manager
         mod._key_manager = mock_km
         try:
-            mock_req = MagicMock(spec=Request)
+            mock_req = FakeRequest()
             creds = FakeCredentials("orcaops_ws_abc_secret123")
             result = get_auth_context(mock_req, creds)
             assert result is not None
@@ -57,7 +59,7 @@ class TestGetAuthContext:
             mod._key_manager = old_km
 
     def test_invalid_key_raises_401(self):
-        from fastapi import HTTPException, Request
+        from fastapi import HTTPException
         import orcaops.auth_middleware as mod
 
         mock_km = MagicMock()
@@ -66,7 +68,7 @@ class TestGetAuthContext:
         old_km = mod._key_manager
         mod._key_manager = mock_km
         try:
-            mock_req = MagicMock(spec=Request)
+            mock_req = FakeRequest()
             creds = FakeCredentials("orcaops_ws_abc_badkey")
             with pytest.raises(HTTPException) as exc_info:
                 get_auth_context(mock_req, creds)
@@ -75,13 +77,12 @@ class TestGetAuthContext:
             mod._key_manager = old_km
 
     def test_no_key_manager(self):
-        from fastapi import Request
         import orcaops.auth_middleware as mod
 
         old_km = mod._key_manager
         mod._key_manager = None
         try:
-            mock_req = MagicMock(spec=Request)
+            mock_req = FakeRequest()
             creds = FakeCredentials("orcaops_ws_abc_secret")
             result = get_auth_context(mock_req, creds)
             assert result is None
@@ -19,6 +19,7 @@ from orcaops.schemas import (
     AgentSession,
     SessionStatus,
 )
+from orcaops.workspace import WorkspaceRegistryIOError
 
 runner = CliRunner()
 
@@ -57,6 +58,13 @@ class TestWorkspaceCreate:
         assert result.exit_code == 1
         assert "duplicate" in result.output
 
+    @patch("orcaops.cli_workspaces._workspace_registry")
+    def test_create_write_failure(self, mock_wr, app):
+        mock_wr.return_value.create_workspace.side_effect = WorkspaceRegistryIOError("disk full")
+        result = runner.invoke(app, ["workspace", "create", "test"])
+        assert result.exit_code == 1
+        assert "disk full" in result.output
+
     def test_create_invalid_owner_type(self, app):
         result = runner.invoke(app, ["workspace", "create", "test", "--owner-type", "invalid"])
         assert result.exit_code == 1
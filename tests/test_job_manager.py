@@ -0,0 +1,93 @@
+"""Tests for JobManager lifecycle signalling."""
+
+import threading
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from orcaops.schemas import JobCommand, JobSpec, JobStatus, RunRecord, SandboxSpec
+
+
+def _finished_record(spec):
+    return RunRecord(
+        job_id=spec.job_id,
+        status=JobStatus.SUCCESS,
+        created_at=datetime.now(timezone.utc),
+        finished_at=datetime.now(timezone.utc),
+    )
+
+
+def _make_manager(tmp_path, release):
+    from orcaops.job_manager import JobManager
+
+    tracker = MagicMock()
+    tracker.update.return_value = None
+    tracker.get_baseline.return_value = None
+    jm = JobManager(output_dir=str(tmp_path), baseline_tracker=tracker)
+
+    def run_sandbox_job(spec):
+        release.wait(timeout=5)
+        return _finished_record(spec)
+
+    jm.runner.run_sandbox_job.side_effect = run_sandbox_job
+    return jm
+
+
+def _make_spec(job_id="test-job"):
+    return JobSpec(
+        job_id=job_id,
+        sandbox=SandboxSpec(image="alpine"),
+        commands=[JobCommand(command="echo hello")],
+    )
+
+
+class TestJobDoneEvent:
+    @patch("orcaops.job_manager.DockerManager")
+    @patch("orcaops.job_manager.JobRunner")
+    def test_set_when_job_finishes(self, mock_runner_cls, mock_dm_cls, tmp_path):
+        release = threading.Event()
+        jm = _make_manager(tmp_path, release)
+        jm.submit_job(_make_spec())
+
+        done = jm.job_done_event("test-job")
+        assert not done.is_set()
+        release.set()
+        assert done.wait(timeout=5)
+        assert jm.get_job("test-job").status == JobStatus.SUCCESS
+
+    @patch("orcaops.job_manager.DockerManager")
+    @patch("orcaops.job_manager.JobRunner")
+    def test_set_on_cancel(self, mock_runner_cls, mock_dm_cls, tmp_path):
+        release = threading.Event()
+        jm = _make_manager(tmp_path, release)
+        jm.submit_job(_make_spec())
+
+        done = jm.job_done_event("test-job")
+        jm.cancel_job("test-job")
+        assert done.is_set()
+        release.set()
+        jm.shutdown(timeout=5)
+
+    @patch("orcaops.job_manager.DockerManager")
+    @patch("orcaops.job_manager.JobRunner")
+    def test_unknown_job_is_already_done(self, mock_runner_cls, mock_dm_cls, tmp_path):
+        from orcaops.job_manager import JobManager
+
+        jm = JobManager(output_dir=str(tmp_path))
+        assert jm.job_done_event("missing").is_set()
+
+
+class TestLoadFromDisk:
+    @patch("orcaops.job_manager.DockerManager")
+    @patch("orcaops.job_manager.JobRunner")
+    def test_reads_finished_run(self, mock_runner_cls, mock_dm_cls, tmp_path):
+        from orcaops.job_manager import JobManager
+
+        record = _finished_record(_make_spec("old-job"))
+        (tmp_path / "old-job").mkdir()
+        (tmp_path / "old-job" / "run.json").write_text(record.model_dump_json())
+        (tmp_path / "bad-job").mkdir()
+        (tmp_path / "bad-job" / "run.json").write_text("{truncated")
+
+        jm = JobManager(output_dir=str(tmp_path))
+        assert jm.get_job("old-job") == record
+        assert jm.get_job("bad-job") is None
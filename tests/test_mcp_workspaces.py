@@ -19,6 +19,7 @@ from orcaops.schemas import (
     AgentSession,
     SessionStatus,
 )
+from orcaops.workspace import WorkspaceRegistryIOError
 
 
 def _make_workspace(id="ws_test", name="test"):
@@ -47,6 +48,14 @@ class TestWorkspaceTools:
         assert result["success"] is False
         assert "duplicate" in result["error"]["message"]
 
+    @patch("orcaops.mcp_server._workspace_registry")
+    def test_create_workspace_write_failure(self, mock_wr):
+        from orcaops.mcp_server import orcaops_create_workspace
+        mock_wr.return_value.create_workspace.side_effect = WorkspaceRegistryIOError("disk full")
+        result = json.loads(orcaops_create_workspace("test"))
+        assert result["success"] is False
+        assert result["error"]["code"] == "IO_ERROR"
+
     @patch("orcaops.mcp_server._workspace_registry")
     def test_list_workspaces(self, mock_wr):
         from orcaops.mcp_server import orcaops_list_workspaces
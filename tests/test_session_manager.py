@@ -142,6 +142,23 @@ class TestIdleExpiration:
         expired_count = sm.expire_idle_sessions()
         assert expired_count == 0
 
+    def test_expire_uses_reloaded_activity(self, tmp_path):
+        stale = AgentSession(
+            session_id="sess_stale",
+            agent_type="agent",
+            workspace_id="ws_test",
+            last_activity=datetime.now(timezone.utc) - timedelta(hours=2),
+        )
+        (tmp_path / "sess_stale.json").write_text(stale.model_dump_json())
+
+        sm = SessionManager(str(tmp_path), idle_timeout_seconds=3600)
+        assert sm.expire_idle_sessions() == 1
+
+    def test_activity_timestamp_not_serialized(self):
+        session = AgentSession(session_id="s", agent_type="a", workspace_id="w")
+        assert session._last_activity_ts == session.last_activity.timestamp()
+        assert "_last_activity_ts" not in session.model_dump()
+
 
 class TestPersistence:
     def test_persist_and_reload(self, tmp_path):
@@ -156,6 +173,41 @@ class TestPersistence:
         assert reloaded.workspace_id == "ws_test"
         assert "job-1" in reloaded.resources_created
 
+    def test_touch_writes_full_session(self, tmp_path):
+        sm = SessionManager(str(tmp_path))
+        session = sm.create_session(
+            "agent", "ws_test", metadata={"status": "idle", "last_activity": "x"},
+        )
+        sm.touch_session(session.session_id)
+        sm.track_resource(session.session_id, "job-1")
+        sm._sessions[session.session_id].status = SessionStatus.IDLE
+        for _ in range(2):
+            time.sleep(0.01)
+            touched = sm.touch_session(session.session_id)
+
+        on_disk = (tmp_path / f"{session.session_id}.json").read_text()
+        assert on_disk == touched.model_dump_json(indent=2)
+        reloaded = AgentSession.model_validate_json(on_disk)
+        assert reloaded.status == SessionStatus.ACTIVE
+        assert reloaded.resources_created == ["job-1"]
+        assert reloaded.metadata == {"status": "idle", "last_activity": "x"}
+
+    def test_reload_many_sessions(self, tmp_path):
+        sm1 = SessionManager(str(tmp_path))
+        created = {sm1.create_session("agent", "ws_test").session_id for _ in range(25)}
+
+        sm2 = SessionManager(str(tmp_path))
+        assert {s.session_id for s in sm2.list_sessions()} == created
+
+    def test_reload_skips_corrupt_files(self, tmp_path):
+        sm1 = SessionManager(str(tmp_path))
+        session = sm1.create_session("agent", "ws_test")
+        (tmp_path / "sess_bad.json").write_text("{not json")
+        (tmp_path / "sess_partial.json").write_text('{"session_id": "sess_partial"}')
+
+        sm2 = SessionManager(str(tmp_path))
+        assert [s.session_id for s in sm2.list_sessions()] == [session.session_id]
+
 
 class TestThreadSafety:
     def test_concurrent_create(self, tmp_path):
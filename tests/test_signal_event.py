@@ -0,0 +1,27 @@
+"""Tests for linked events."""
+
+import threading
+
+from orcaops.signal_event import SignalEvent
+
+
+class TestSignalEvent:
+    def test_set_propagates_to_linked(self):
+        source, target = SignalEvent(), threading.Event()
+        source.link(target)
+        source.set()
+        assert target.is_set()
+
+    def test_link_after_set_fires_immediately(self):
+        source, target = SignalEvent(), threading.Event()
+        source.set()
+        source.link(target)
+        assert target.is_set()
+
+    def test_unlinked_not_set(self):
+        source, target = SignalEvent(), threading.Event()
+        source.link(target)
+        source.unlink(target)
+        source.set()
+        assert not target.is_set()
+
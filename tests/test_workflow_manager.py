@@ -185,6 +185,34 @@ class TestWorkflowManager:
         barrier.set()
         wm.shutdown(timeout=5)
 
+    @patch("orcaops.workflow_manager.WorkflowRunner")
+    @patch("orcaops.workflow_manager.JobManager")
+    def test_cancel_replaces_snapshot(self, MockJM, MockRunner, tmp_path):
+        mock_runner = MockRunner.return_value
+        barrier = threading.Event()
+        def slow_run(*args, **kwargs):
+            barrier.wait(timeout=5)
+            return _completed_record(args[1], WorkflowStatus.CANCELLED)
+        mock_runner.run.side_effect = slow_run
+
+        wm = WorkflowManager(
+            job_manager=MockJM.return_value,
+            workflows_dir=str(tmp_path),
+        )
+        wm.submit_workflow(_simple_spec(), workflow_id="wf-snap")
+        time.sleep(0.1)
+
+        before = wm.get_workflow("wf-snap")
+        _, after = wm.cancel_workflow("wf-snap")
+
+        # Earlier readers keep their snapshot; cancel swaps in a new record
+        assert before.status == WorkflowStatus.PENDING
+        assert after is not before
+        assert wm.list_workflows()[0] is after
+
+        barrier.set()
+        wm.shutdown(timeout=5)
+
     @patch("orcaops.workflow_manager.WorkflowRunner")
     @patch("orcaops.workflow_manager.JobManager")
     def test_cancel_not_found(self, MockJM, MockRunner, tmp_path):
@@ -196,6 +224,26 @@ class TestWorkflowManager:
         assert cancelled is False
         assert record is None
 
+    @patch("orcaops.workflow_manager._MAX_COMPLETED", 2)
+    @patch("orcaops.workflow_manager.WorkflowRunner")
+    @patch("orcaops.workflow_manager.JobManager")
+    def test_evicts_oldest_completed(self, MockJM, MockRunner, tmp_path):
+        mock_runner = MockRunner.return_value
+        mock_runner.run.side_effect = lambda *args, **kwargs: _completed_record(args[1])
+
+        wm = WorkflowManager(
+            job_manager=MockJM.return_value,
+            workflows_dir=str(tmp_path),
+        )
+        for i in range(3):
+            wm.submit_workflow(_simple_spec(), workflow_id=f"wf-evict-{i}")
+            wm._workflows[f"wf-evict-{i}"].thread.join(timeout=5)
+
+        in_memory = {r.workflow_id for r in wm.list_workflows()}
+        assert in_memory == {"wf-evict-1", "wf-evict-2"}
+        # Evicted workflow is still reachable from disk
+        assert wm.get_workflow("wf-evict-0") is not None
+
     @patch("orcaops.workflow_manager.WorkflowRunner")
     @patch("orcaops.workflow_manager.JobManager")
     def test_persists_to_disk(self, MockJM, MockRunner, tmp_path):
@@ -282,6 +330,84 @@ class TestWorkflowStore:
         assert total == 5
         assert len(records) == 2
 
+    def test_unchanged_file_served_from_cache(self, tmp_path):
+        wf_dir = os.path.join(str(tmp_path), "wf-cache")
+        os.makedirs(wf_dir)
+        path = os.path.join(wf_dir, "workflow.json")
+        with open(path, "w") as f:
+            f.write(_completed_record("wf-cache").model_dump_json())
+
+        store = WorkflowStore(str(tmp_path))
+        first = store.get_workflow("wf-cache")
+        assert store.get_workflow("wf-cache") is first
+
+        with open(path, "w") as f:
+            f.write(_completed_record("wf-cache", WorkflowStatus.FAILED).model_dump_json())
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+        assert store.get_workflow("wf-cache").status == WorkflowStatus.FAILED
+
+    def test_delete_invalidates_cache(self, tmp_path):
+        wf_dir = os.path.join(str(tmp_path), "wf-gone")
+        os.makedirs(wf_dir)
+        with open(os.path.join(wf_dir, "workflow.json"), "w") as f:
+            f.write(_completed_record("wf-gone").model_dump_json())
+
+        store = WorkflowStore(str(tmp_path))
+        assert store.list_workflows()[1] == 1
+        store.delete_workflow("wf-gone")
+        assert store.get_workflow("wf-gone") is None
+        assert store._cache == {}
+
+    def test_page_parses_only_requested_records(self, tmp_path):
+        for i in range(5):
+            wf_dir = os.path.join(str(tmp_path), f"wf-mt-{i}")
+            os.makedirs(wf_dir)
+            path = os.path.join(wf_dir, "workflow.json")
+            with open(path, "w") as f:
+                f.write(_completed_record(f"wf-mt-{i}").model_dump_json())
+            os.utime(path, ns=(0, (i + 1) * 1_000_000_000))
+
+        store = WorkflowStore(str(tmp_path))
+        records, total = store.list_workflows(limit=2, offset=1)
+        assert total == 5
+        assert {r.workflow_id for r in records} == {"wf-mt-3", "wf-mt-2"}
+        assert len(store._cache) == 2
+
+    def test_scan_ignores_stray_files(self, tmp_path):
+        wf_dir = os.path.join(str(tmp_path), "wf-real")
+        os.makedirs(wf_dir)
+        with open(os.path.join(wf_dir, "workflow.json"), "w") as f:
+            f.write(_completed_record("wf-real").model_dump_json())
+        (tmp_path / "notes.txt").write_text("not a workflow")
+        os.makedirs(os.path.join(str(tmp_path), "wf-empty"))
+
+        records, total = WorkflowStore(str(tmp_path)).list_workflows()
+        assert total == 1
+        assert records[0].workflow_id == "wf-real"
+
+    def test_cold_scan_loads_every_record(self, tmp_path):
+        for i in range(20):
+            wf_dir = os.path.join(str(tmp_path), f"wf-cold-{i}")
+            os.makedirs(wf_dir)
+            status = WorkflowStatus.SUCCESS if i % 2 else WorkflowStatus.FAILED
+            with open(os.path.join(wf_dir, "workflow.json"), "w") as f:
+                f.write(_completed_record(f"wf-cold-{i}", status).model_dump_json())
+
+        store = WorkflowStore(str(tmp_path))
+        records, total = store.list_workflows(status=WorkflowStatus.SUCCESS, limit=100)
+        assert total == 10
+        assert {r.workflow_id for r in records} == {f"wf-cold-{i}" for i in range(1, 20, 2)}
+        assert len(store._cache) == 20
+
+    def test_corrupt_record_skipped(self, tmp_path):
+        for name, body in [("wf-bad", "{not json"), ("wf-partial", '{"workflow_id": "x"}')]:
+            os.makedirs(os.path.join(str(tmp_path), name))
+            (tmp_path / name / "workflow.json").write_text(body)
+
+        store = WorkflowStore(str(tmp_path))
+        assert store.get_workflow("wf-bad") is None
+        assert store.list_workflows(status=WorkflowStatus.SUCCESS) == ([], 0)
+
     def test_nonexistent_dir(self):
         store = WorkflowStore("/nonexistent/path")
         records, total = store.list_workflows()
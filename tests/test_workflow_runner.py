@@ -2,15 +2,18 @@
 
 import threading
 import time
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from orcaops.schemas import (
     JobStatus, RunRecord, WorkflowStatus, WorkflowSpec, WorkflowJob,
+    WorkflowRecord, WorkflowJobStatus,
 )
-from orcaops.workflow_runner import WorkflowRunner
+from orcaops.signal_event import SignalEvent
+from orcaops.workflow_runner import WorkflowRunner, _descendant_map
 from orcaops.workflow_schema import parse_workflow_spec
 
 
@@ -51,6 +54,12 @@ def _mock_job_manager(job_results=None):
     return jm
 
 
+def _set_event():
+    event = threading.Event()
+    event.set()
+    return event
+
+
 def _spec(jobs_dict):
     """Create a WorkflowSpec from a dict of job definitions."""
     return parse_workflow_spec({"name": "test-wf", "jobs": jobs_dict})
@@ -88,6 +97,21 @@ class TestLinearWorkflow:
         assert "a" in calls[0][0][0].job_id
         assert "b" in calls[1][0][0].job_id
 
+    def test_status_index_mirrors_job_statuses(self):
+        spec = _spec({
+            "a": {"image": "alpine", "commands": ["echo a"]},
+            "b": {"image": "alpine", "commands": ["echo b"], "requires": ["a"]},
+        })
+        jm = _mock_job_manager({"-a": JobStatus.FAILED})
+
+        record = WorkflowRunner(jm).run(spec, "wf-idx", threading.Event())
+        expected = {name: js.status for name, js in record.job_statuses.items()}
+        assert record._status_index == expected
+        assert "_status_index" not in record.model_dump()
+
+        reloaded = WorkflowRecord.model_validate_json(record.model_dump_json())
+        assert reloaded._status_index == expected
+
 
 class TestParallelWorkflow:
     def test_parallel_jobs_both_run(self):
@@ -160,6 +184,159 @@ class TestFailurePropagation:
         assert record.status == WorkflowStatus.FAILED
 
 
+class TestPipelining:
+    @pytest.fixture
+    def gated_job_manager(self):
+        """Make mock JobManagers where ``gated`` only finishes once ``release`` is set."""
+        timers = []
+
+        def make(gated, results=None):
+            jm = _mock_job_manager(results)
+            release = threading.Event()
+            # Never hang the suite if the scheduler regresses to level barriers
+            timer = threading.Timer(2.0, release.set)
+            timer.daemon = True
+            timer.start()
+            timers.append(timer)
+            jm.job_done_event.side_effect = lambda job_id: (
+                release if gated in job_id else _set_event()
+            )
+            return jm, release
+
+        yield make
+        for timer in timers:
+            timer.cancel()
+
+    def test_ready_job_does_not_wait_for_slow_sibling(self, gated_job_manager):
+        spec = _spec({
+            "slow": {"image": "alpine", "commands": ["echo"]},
+            "fast": {"image": "alpine", "commands": ["echo"]},
+            "after_fast": {"image": "alpine", "commands": ["echo"], "requires": ["fast"]},
+        })
+        jm, release = gated_job_manager("slow")
+        submit = jm.submit_job.side_effect
+        slow_running = []
+
+        def submit_job(job_spec):
+            if "after_fast" in job_spec.job_id:
+                slow_running.append(not release.is_set())
+                release.set()
+            return submit(job_spec)
+
+        jm.submit_job.side_effect = submit_job
+        record = WorkflowRunner(jm).run(spec, "wf-pipe", threading.Event())
+        assert record.status == WorkflowStatus.SUCCESS
+        assert slow_running == [True]
+
+    def test_condition_waits_for_referenced_earlier_job(self, gated_job_manager):
+        spec = _spec({
+            "slow": {"image": "alpine", "commands": ["echo"]},
+            "fast": {"image": "alpine", "commands": ["echo"]},
+            "gate": {
+                "image": "alpine", "commands": ["echo"],
+                "requires": ["fast"],
+                "if": "${{ jobs.slow.status == 'success' }}",
+            },
+        })
+        jm, release = gated_job_manager("slow")
+        threading.Timer(0.05, release.set).start()
+
+        record = WorkflowRunner(jm).run(spec, "wf-cond", threading.Event())
+        assert record.job_statuses["gate"].status == JobStatus.SUCCESS
+
+    def test_failure_only_skips_its_descendants(self):
+        spec = _spec({
+            "a": {"image": "alpine", "commands": ["echo"]},
+            "a_child": {"image": "alpine", "commands": ["echo"], "requires": ["a"]},
+            "b": {"image": "alpine", "commands": ["echo"]},
+            "b_child": {"image": "alpine", "commands": ["echo"], "requires": ["b"]},
+        })
+        jm = _mock_job_manager({"-a": JobStatus.FAILED})
+
+        record = WorkflowRunner(jm).run(spec, "wf-branch", threading.Event())
+        assert record.job_statuses["a"].status == JobStatus.FAILED
+        assert record.job_statuses["a_child"].error == "Skipped: upstream failure"
+        assert record.job_statuses["b_child"].status == JobStatus.SUCCESS
+        assert record.status == WorkflowStatus.PARTIAL
+
+
+class TestDispatchOrder:
+    def _history(self, durations, spec_name="test-wf"):
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        return WorkflowRecord(
+            workflow_id="wf-old",
+            spec_name=spec_name,
+            status=WorkflowStatus.SUCCESS,
+            job_statuses={
+                name: WorkflowJobStatus(
+                    job_name=name,
+                    status=JobStatus.SUCCESS,
+                    started_at=start,
+                    finished_at=start + timedelta(seconds=secs),
+                )
+                for name, secs in durations.items()
+            },
+        )
+
+    def _spec(self):
+        return _spec({
+            name: {"image": "alpine", "commands": ["echo"]}
+            for name in ("a", "b", "c")
+        })
+
+    def test_longest_estimated_job_submitted_first(self):
+        store = MagicMock()
+        store.list_workflows.return_value = (
+            [self._history({"a": 1, "b": 30, "c": 5})], 1,
+        )
+        jm = _mock_job_manager()
+        runner = WorkflowRunner(jm, max_parallel=1, workflow_store=store)
+
+        runner.run(self._spec(), "wf-lpt", threading.Event())
+        order = [job_id.rsplit("-", 1)[1] for job_id in jm._submitted]
+        assert order == ["b", "c", "a"]
+
+    def test_estimates_smooth_history_of_same_workflow(self):
+        store = MagicMock()
+        store.list_workflows.return_value = ([
+            self._history({"a": 10}),
+            self._history({"a": 20}),
+            self._history({"a": 500}, spec_name="other-wf"),
+        ], 3)
+        runner = WorkflowRunner(MagicMock(), workflow_store=store)
+
+        assert runner._estimate_durations(self._spec()) == {"a": pytest.approx(12.0)}
+
+    def test_no_store_keeps_name_order(self):
+        jm = _mock_job_manager()
+        WorkflowRunner(jm, max_parallel=1).run(self._spec(), "wf-plain", threading.Event())
+        assert [job_id.rsplit("-", 1)[1] for job_id in jm._submitted] == ["a", "b", "c"]
+
+
+class TestDescendantMap:
+    def test_diamond(self):
+        graph = {"a": set(), "b": {"a"}, "c": {"a"}, "d": {"b", "c"}, "e": set()}
+        children = {"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": [], "e": []}
+        assert _descendant_map(graph, children) == {
+            "a": {"b", "c", "d"}, "b": {"d"}, "c": {"d"}, "d": set(), "e": set(),
+        }
+
+    def test_failure_skips_through_always_job(self):
+        spec = _spec({
+            "a": {"image": "alpine", "commands": ["echo"]},
+            "notify": {
+                "image": "alpine", "commands": ["echo"],
+                "requires": ["a"], "on_complete": "always",
+            },
+            "deploy": {"image": "alpine", "commands": ["echo"], "requires": ["notify"]},
+        })
+        jm = _mock_job_manager({"-a": JobStatus.FAILED})
+
+        record = WorkflowRunner(jm).run(spec, "wf-desc", threading.Event())
+        assert record.job_statuses["notify"].status == JobStatus.SUCCESS
+        assert record.job_statuses["deploy"].error == "Skipped: upstream failure"
+
+
 class TestConditions:
     def test_if_condition_false_skips_job(self):
         spec = _spec({
@@ -275,6 +452,96 @@ class TestCancellation:
         record = runner.run(spec, "wf-10", cancel)
         assert record.status == WorkflowStatus.CANCELLED
 
+    def test_cancel_drops_queued_jobs_in_level(self):
+        spec = _spec({
+            name: {"image": "alpine", "commands": ["echo"]} for name in ("a", "b", "c")
+        })
+        jm = _mock_job_manager()
+        cancel = threading.Event()
+        submit = jm.submit_job.side_effect
+
+        def submit_and_cancel(job_spec):
+            cancel.set()
+            return submit(job_spec)
+
+        jm.submit_job.side_effect = submit_and_cancel
+        jm.job_done_event.side_effect = lambda job_id: threading.Event()
+        runner = WorkflowRunner(jm, max_parallel=1)
+
+        record = runner.run(spec, "wf-10b", cancel)
+        assert record.status == WorkflowStatus.CANCELLED
+        # Only the first job reached a worker; the rest were never submitted
+        assert jm.submit_job.call_count == 1
+        assert all(js.status == JobStatus.CANCELLED for js in record.job_statuses.values())
+
+    def test_cancel_wakes_waiting_job_immediately(self):
+        spec = _spec({"a": {"image": "alpine", "commands": ["echo"]}})
+        jm = _mock_job_manager()
+        jm.job_done_event.side_effect = lambda job_id: SignalEvent()
+        cancel = SignalEvent()
+        threading.Timer(0.05, cancel.set).start()
+
+        started = time.monotonic()
+        record = WorkflowRunner(jm).run(spec, "wf-wake", cancel)
+        assert time.monotonic() - started < 0.4
+        assert record.status == WorkflowStatus.CANCELLED
+        jm.cancel_job.assert_called_once()
+
+
+class TestCompletionSignal:
+    def test_waits_on_done_event_instead_of_polling(self):
+        spec = _spec({"a": {"image": "alpine", "commands": ["echo"]}})
+        jm = _mock_job_manager()
+        done = threading.Event()
+        jm.job_done_event.side_effect = lambda job_id: done
+        threading.Timer(0.05, done.set).start()
+
+        record = WorkflowRunner(jm).run(spec, "wf-done", threading.Event())
+        assert record.status == WorkflowStatus.SUCCESS
+        # Status is only fetched once the job signals completion
+        assert jm.get_job.call_count == 1
+
+
+class TestServices:
+    def _spec(self):
+        return _spec({
+            "itest": {
+                "image": "alpine",
+                "commands": ["echo"],
+                "services": {"db": {"image": "postgres:15"}},
+            },
+        })
+
+    @patch("orcaops.service_manager.ServiceManager")
+    def test_services_stopped_after_job_finishes(self, mock_svc_cls):
+        svc = mock_svc_cls.return_value
+        svc.start_services.return_value = ({"db": "cid-1"}, {"DB_HOST": "db"})
+        jm = _mock_job_manager()
+        done = threading.Event()
+        jm.job_done_event.side_effect = lambda job_id: done
+
+        def finish():
+            svc.stop_services.assert_not_called()
+            done.set()
+
+        threading.Timer(0.05, finish).start()
+        record = WorkflowRunner(jm).run(self._spec(), "wf-svc", threading.Event())
+
+        assert record.status == WorkflowStatus.SUCCESS
+        svc.stop_services.assert_called_once_with({"db": "cid-1"}, "orcaops-wf-svc-itest")
+        assert jm.submit_job.call_args[0][0].sandbox.env["DB_HOST"] == "db"
+
+    @patch("orcaops.service_manager.ServiceManager")
+    def test_services_stopped_when_submit_rejected(self, mock_svc_cls):
+        svc = mock_svc_cls.return_value
+        svc.start_services.return_value = ({"db": "cid-1"}, {})
+        jm = _mock_job_manager()
+        jm.submit_job.side_effect = ValueError("Policy violation: no")
+
+        record = WorkflowRunner(jm).run(self._spec(), "wf-svc-rej", threading.Event())
+        assert record.job_statuses["itest"].status == JobStatus.FAILED
+        svc.stop_services.assert_called_once()
+
 
 class TestMatrixExpansion:
     def test_matrix_creates_multiple_jobs(self):
@@ -296,6 +563,56 @@ class TestMatrixExpansion:
         assert jm.submit_job.call_count == 2
         assert record.status == WorkflowStatus.SUCCESS
 
+    def _wide_matrix_spec(self, width):
+        return _spec({
+            "test": {
+                "image": "alpine",
+                "commands": ["echo"],
+                "matrix": {"n": [str(i) for i in range(width)]},
+            },
+        })
+
+    def test_wide_matrix_submitted_in_bounded_window(self):
+        jm = _mock_job_manager()
+        release = threading.Event()
+        jm.job_done_event.return_value = release
+        submitted = []
+
+        def sample_then_release():
+            submitted.append(pool_submit.call_count)
+            release.set()
+
+        threading.Timer(0.2, sample_then_release).start()
+        with patch.object(
+            ThreadPoolExecutor, "submit", autospec=True,
+            side_effect=ThreadPoolExecutor.submit,
+        ) as pool_submit:
+            record = WorkflowRunner(jm, max_parallel=1).run(
+                self._wide_matrix_spec(10), "wf-window", threading.Event(),
+            )
+
+        # Only the running variant was started; the rest wait for its slot
+        assert submitted == [1]
+        assert jm.submit_job.call_count == 10
+        assert record.status == WorkflowStatus.SUCCESS
+
+    def test_cancel_drops_unsubmitted_variants(self):
+        jm = _mock_job_manager()
+        cancel = threading.Event()
+        submit = jm.submit_job.side_effect
+
+        def submit_and_cancel(job_spec):
+            cancel.set()
+            return submit(job_spec)
+
+        jm.submit_job.side_effect = submit_and_cancel
+        record = WorkflowRunner(jm, max_parallel=1).run(
+            self._wide_matrix_spec(10), "wf-window-cancel", cancel,
+        )
+        assert jm.submit_job.call_count == 1
+        assert record.job_statuses["test"].status == JobStatus.CANCELLED
+        assert record.status == WorkflowStatus.CANCELLED
+
 
 class TestContextPropagation:
     def test_job_spec_has_workflow_context(self):
@@ -334,3 +651,22 @@ class TestContextPropagation:
         submitted_spec = jm.submit_job.call_args[0][0]
         assert submitted_spec.sandbox.env["GLOBAL"] == "yes"
         assert submitted_spec.sandbox.env["LOCAL"] == "yes"
+
+    def test_env_precedence_matrix_over_job_over_workflow(self):
+        data = {
+            "name": "test-wf",
+            "env": {"SHARED": "workflow", "MATRIX_PY": "workflow"},
+            "jobs": {
+                "build": {
+                    "image": "alpine",
+                    "commands": ["echo"],
+                    "env": {"SHARED": "job", "MATRIX_PY": "job"},
+                    "matrix": {"parameters": {"py": ["3.12"]}},
+                },
+            },
+        }
+        jm = _mock_job_manager()
+        WorkflowRunner(jm).run(parse_workflow_spec(data), "wf-14", threading.Event())
+
+        env = jm.submit_job.call_args[0][0].sandbox.env
+        assert env == {"SHARED": "job", "MATRIX_PY": "3.12"}
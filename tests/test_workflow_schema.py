@@ -14,8 +14,10 @@ from orcaops.workflow_schema import (
     validate_workflow,
     get_execution_order,
     expand_matrix,
+    interpolate_matrix,
     matrix_key,
     ConditionEvaluator,
+    compile_condition,
 )
 
 
@@ -294,6 +296,39 @@ class TestExpandMatrix:
         result = expand_matrix(matrix)
         assert len(result) == 3
 
+    def test_repeat_expansion_returns_fresh_dicts(self):
+        matrix = MatrixConfig(
+            parameters={"python": ["3.9", "3.10"], "os": ["ubuntu"]},
+            include=[{"python": "3.12", "os": "ubuntu"}],
+        )
+        first = expand_matrix(matrix)
+        first[0]["python"] = "mutated"
+        assert expand_matrix(matrix) == [
+            {"os": "ubuntu", "python": "3.9"},
+            {"os": "ubuntu", "python": "3.10"},
+            {"python": "3.12", "os": "ubuntu"},
+        ]
+
+    def test_include_matching_existing_combo_not_duplicated(self):
+        matrix = MatrixConfig(
+            parameters={"python": ["3.9"], "os": ["ubuntu"]},
+            include=[{"python": "3.9", "os": "ubuntu"}],
+        )
+        assert len(expand_matrix(matrix)) == 1
+
+
+class TestInterpolateMatrix:
+    def test_substitutes_placeholders(self):
+        image = "python:${{ matrix.py }}-${{matrix.os}}"
+        assert interpolate_matrix(image, {"py": "3.12", "os": "slim"}) == "python:3.12-slim"
+
+    def test_unknown_key_left_as_is(self):
+        image = "node:${{ matrix.node-version }}-${{ matrix.os }}"
+        assert interpolate_matrix(image, {"node-version": "20"}) == "node:20-${{ matrix.os }}"
+
+    def test_plain_image_unchanged(self):
+        assert interpolate_matrix("alpine:3.19", {"py": "3.12"}) == "alpine:3.19"
+
 
 class TestMatrixKey:
     def test_deterministic_key(self):
@@ -356,3 +391,41 @@ class TestConditionEvaluator:
     def test_missing_env_defaults_to_empty(self):
         evaluator = ConditionEvaluator({}, {})
         assert evaluator.evaluate("${{ env.MISSING == '' }}") is True
+
+
+class TestCompileCondition:
+    def test_compiled_once_per_condition(self):
+        condition = "${{ jobs.build.status == 'success' and env.TARGET != 'dev' }}"
+        assert compile_condition(condition) is compile_condition(condition)
+
+    def test_compiled_reused_across_inputs(self):
+        check = compile_condition("${{ jobs.build.status == 'success' or env.FORCE == '1' }}")
+        assert check({"build": "success"}, {}) is True
+        assert check({"build": "failed"}, {"FORCE": "1"}) is True
+        assert check({"build": "failed"}, {}) is False
+
+    def test_validation_precompiles(self):
+        condition = "${{ env.PRECOMPILED == 'yes' }}"
+        compile_condition.cache_clear()
+        parse_workflow_spec({
+            "name": "wf",
+            "jobs": {"a": {"image": "alpine", "commands": ["echo"], "if": condition}},
+        })
+        assert compile_condition.cache_info().currsize == 1
+
+    def test_and_binds_tighter_than_or(self):
+        check = compile_condition(
+            "${{ env.A == '1' or env.B == '1' and env.C == '1' }}"
+        )
+        assert check({}, {"A": "1"}) is True
+        assert check({}, {"B": "1"}) is False
+        assert check({}, {"B": "1", "C": "1"}) is True
+
+    def test_quoted_value_may_contain_operators(self):
+        check = compile_condition("${{ env.MSG == 'this or that and more' }}")
+        assert check({}, {"MSG": "this or that and more"}) is True
+        assert check({}, {"MSG": "this"}) is False
+
+    def test_dangling_operator_treated_as_malformed(self):
+        check = compile_condition("${{ env.A == '1' and }}")
+        assert check({}, {}) is True
@@ -2,7 +2,9 @@
 
 import json
 import os
+import time
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 import pytest
 
@@ -14,7 +16,7 @@ from orcaops.schemas import (
     ResourceLimits,
     WorkspaceUsage,
 )
-from orcaops.workspace import WorkspaceRegistry
+from orcaops.workspace import WorkspaceRegistry, WorkspaceRegistryIOError, _ID_POOL, _IdPool
 
 
 class TestWorkspaceModels:
@@ -89,6 +91,34 @@ class TestWorkspaceModels:
         assert OwnerType.AI_AGENT == "ai-agent"
 
 
+class TestIdPool:
+    def test_ids_are_unique_hex_across_refills(self):
+        pool = _IdPool(pool_bytes=16)
+        ids = [pool.next_hex(8) for _ in range(50)]
+        assert len(set(ids)) == 50
+        assert all(len(i) == 16 and int(i, 16) >= 0 for i in ids)
+
+    def test_request_larger_than_pool(self):
+        assert len(_IdPool(pool_bytes=4).next_hex(8)) == 16
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_does_not_reuse_parent_ids(self):
+        _ID_POOL.next_hex(8)  # Make sure the parent has a buffer to copy
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.write(write_fd, _ID_POOL.next_hex(8).encode())
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        child_id = os.read(read_fd, 64).decode()
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        assert len(child_id) == 16
+        assert child_id != _ID_POOL.next_hex(8)
+
+
 class TestWorkspaceRegistry:
     def test_create_workspace(self, tmp_path):
         reg = WorkspaceRegistry(str(tmp_path))
@@ -165,6 +195,19 @@ class TestWorkspaceRegistry:
         result = reg.list_workspaces()
         assert len(result) == 2
 
+    def test_list_workspaces_newest_first_after_reload(self, tmp_path):
+        reg1 = WorkspaceRegistry(str(tmp_path))
+        for i in range(4):
+            reg1.create_workspace(
+                name=f"order{i}", owner_type=OwnerType.USER, owner_id="u1",
+            )
+        expected = [w.name for w in reg1.list_workspaces()]
+        assert expected == ["order3", "order2", "order1", "order0"]
+
+        reg2 = WorkspaceRegistry(str(tmp_path))
+        reg2.get_workspace(reg1.list_workspaces()[2].id)  # Load one out of order
+        assert [w.name for w in reg2.list_workspaces()] == expected
+
     def test_list_workspaces_filter_status(self, tmp_path):
         reg = WorkspaceRegistry(str(tmp_path))
         reg.create_workspace(
@@ -252,6 +295,222 @@ class TestWorkspaceRegistry:
         assert ws is not None
         assert ws.name == "disk-load"
 
+    def test_new_registry_defers_parsing_until_access(self, tmp_path):
+        reg1 = WorkspaceRegistry(str(tmp_path))
+        for i in range(3):
+            reg1.create_workspace(
+                name=f"lazy-{i}",
+                owner_type=OwnerType.USER,
+                owner_id="u1",
+                workspace_id=f"ws_lazy{i}",
+            )
+
+        reg2 = WorkspaceRegistry(str(tmp_path))
+        assert reg2._cache == {}
+        assert reg2.get_workspace("ws_lazy1").name == "lazy-1"
+        assert set(reg2._cache) == {"ws_lazy1"}
+        assert len(reg2.list_workspaces()) == 3
+
+    def test_corrupt_record_is_skipped(self, tmp_path):
+        bad_dir = tmp_path / "ws_corrupt"
+        bad_dir.mkdir()
+        (bad_dir / "workspace.json").write_text("{not json")
+
+        reg = WorkspaceRegistry(str(tmp_path))
+        assert reg.get_workspace("ws_corrupt") is None
+        assert reg.list_workspaces() == []
+
+    def test_update_loads_workspace_from_disk(self, tmp_path):
+        reg1 = WorkspaceRegistry(str(tmp_path))
+        reg1.create_workspace(
+            name="lazy-update",
+            owner_type=OwnerType.USER,
+            owner_id="u1",
+            workspace_id="ws_lazyupd",
+        )
+
+        reg2 = WorkspaceRegistry(str(tmp_path))
+        updated = reg2.update_workspace(
+            "ws_lazyupd", status=WorkspaceStatus.SUSPENDED,
+        )
+        assert updated.status == WorkspaceStatus.SUSPENDED
+
+    def test_noop_update_skips_write(self, tmp_path):
+        reg = WorkspaceRegistry(str(tmp_path))
+        ws = reg.create_workspace(
+            name="noop", owner_type=OwnerType.USER, owner_id="u1",
+        )
+        with patch("orcaops.workspace.atomic_write") as write:
+            same = reg.update_workspace(ws.id, status=WorkspaceStatus.ACTIVE)
+            assert same.updated_at == ws.updated_at
+            write.assert_not_called()
+
+            reg.update_workspace(ws.id, status=WorkspaceStatus.SUSPENDED)
+            assert write.call_count == 1
+
+    def test_duplicate_name_detected_after_reload(self, tmp_path):
+        reg1 = WorkspaceRegistry(str(tmp_path))
+        reg1.create_workspace(
+            name="taken", owner_type=OwnerType.USER, owner_id="u1",
+        )
+
+        reg2 = WorkspaceRegistry(str(tmp_path))
+        with pytest.raises(ValueError, match="already in use"):
+            reg2.create_workspace(
+                name="taken", owner_type=OwnerType.USER, owner_id="u2",
+            )
+
+    def test_reactivated_name_is_reserved_again(self, tmp_path):
+        reg = WorkspaceRegistry(str(tmp_path))
+        reg.create_workspace(
+            name="revived", owner_type=OwnerType.USER, owner_id="u1",
+            workspace_id="ws_revived",
+        )
+        reg.archive_workspace("ws_revived")
+        reg.update_workspace("ws_revived", status=WorkspaceStatus.ACTIVE)
+        with pytest.raises(ValueError, match="already in use"):
+            reg.create_workspace(
+                name="revived", owner_type=OwnerType.USER, owner_id="u2",
+            )
+
+    def test_reads_share_one_immutable_instance(self, tmp_path):
+        reg = WorkspaceRegistry(str(tmp_path))
+        ws = reg.create_workspace(
+            name="frozen", owner_type=OwnerType.USER, owner_id="u1",
+        )
+        assert reg.get_workspace(ws.id) is reg.get_workspace(ws.id)
+        with pytest.raises(ValueError, match="frozen"):
+            ws.status = WorkspaceStatus.ARCHIVED
+
+        updated = reg.update_workspace(ws.id, status=WorkspaceStatus.SUSPENDED)
+        assert ws.status == WorkspaceStatus.ACTIVE
+        assert reg.get_workspace(ws.id) is updated
+
+    def test_failed_create_raises_and_is_not_cached(self, tmp_path):
+        reg = WorkspaceRegistry(str(tmp_path))
+        with patch("orcaops.workspace.atomic_write", side_effect=OSError("disk full")):
+            with pytest.raises(WorkspaceRegistryIOError, match="disk full"):
+                reg.create_workspace(
+                    name="unsaved", owner_type=OwnerType.USER, owner_id="u1",
+                    workspace_id="ws_unsaved",
+                )
+        assert reg.get_workspace("ws_unsaved") is None
+        assert reg.list_workspaces() == []
+        # The name was not left reserved
+        reg.create_workspace(name="unsaved", owner_type=OwnerType.USER, owner_id="u1")
+
+    def test_failed_update_falls_back_to_disk_state(self, tmp_path):
+        reg = WorkspaceRegistry(str(tmp_path))
+        ws = reg.create_workspace(
+            name="kept", owner_type=OwnerType.USER, owner_id="u1",
+        )
+        with patch("orcaops.workspace.atomic_write", side_effect=OSError("read-only")):
+            with pytest.raises(WorkspaceRegistryIOError):
+                reg.archive_workspace(ws.id)
+        assert reg.get_workspace(ws.id).status == WorkspaceStatus.ACTIVE
+        with pytest.raises(ValueError, match="already in use"):
+            reg.create_workspace(name="kept", owner_type=OwnerType.USER, owner_id="u2")
+
+    def test_update_after_concurrent_eviction(self, tmp_path):
+        reg = WorkspaceRegistry(str(tmp_path))
+        ws = reg.create_workspace(
+            name="evicted", owner_type=OwnerType.USER, owner_id="u1",
+        )
+        get_cached = reg._get_cached
+        calls = []
+
+        def check_then_evict(workspace_id):
+            found = get_cached(workspace_id)
+            if not calls:
+                # Another update's failed write evicts the entry right here
+                with reg._lock:
+                    reg._evict(reg._cache[workspace_id])
+            calls.append(workspace_id)
+            return found
+
+        with patch.object(reg, "_get_cached", side_effect=check_then_evict):
+            updated = reg.update_workspace(ws.id, status=WorkspaceStatus.SUSPENDED)
+        assert updated.status == WorkspaceStatus.SUSPENDED
+        assert reg.get_workspace(ws.id).status == WorkspaceStatus.SUSPENDED
+
+    def test_stale_read_refreshes_in_background(self, tmp_path):
+        reg1 = WorkspaceRegistry(str(tmp_path))
+        ws = reg1.create_workspace(
+            name="shared", owner_type=OwnerType.USER, owner_id="u1",
+        )
+        reg2 = WorkspaceRegistry(str(tmp_path))
+        assert reg2.get_workspace(ws.id).status == WorkspaceStatus.ACTIVE
+        reg1.update_workspace(ws.id, status=WorkspaceStatus.SUSPENDED)
+
+        with patch("orcaops.workspace._CACHE_TTL", 0):
+            # The stale record is served while the refresh runs
+            assert reg2.get_workspace(ws.id) is not None
+            deadline = time.monotonic() + 5
+            while reg2.get_workspace(ws.id).status != WorkspaceStatus.SUSPENDED:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+
+    def test_refresh_does_not_clobber_local_update(self, tmp_path):
+        reg = WorkspaceRegistry(str(tmp_path))
+        ws = reg.create_workspace(
+            name="local", owner_type=OwnerType.USER, owner_id="u1",
+        )
+        reg._refresh(ws.id)  # Same content on disk: keeps the instance
+        assert reg.get_workspace(ws.id) is ws
+
+        old = reg._read(ws.id)
+
+        def read_then_update(ws_id):
+            # A local update lands while the refresh holds the old file
+            reg.update_workspace(ws_id, status=WorkspaceStatus.SUSPENDED)
+            return old
+
+        # Force the refresh to re-read
+        reg._versions.pop(ws.id)
+        reg._local_mtimes.pop(ws.id)
+        with patch.object(reg, "_read", side_effect=read_then_update):
+            reg._refresh(ws.id)
+        assert reg.get_workspace(ws.id).status == WorkspaceStatus.SUSPENDED
+
+    def test_superseded_update_is_not_written(self, tmp_path):
+        reg = WorkspaceRegistry(str(tmp_path))
+        ws = reg.create_workspace(
+            name="ordered", owner_type=OwnerType.USER, owner_id="u1",
+        )
+        older = reg.update_workspace(ws.id, status=WorkspaceStatus.SUSPENDED)
+        reg.update_workspace(ws.id, status=WorkspaceStatus.ACTIVE)
+
+        # The older update's write arriving late must not overwrite the newer one
+        reg._persist(older)
+        _, on_disk, _ = reg._read(ws.id)
+        assert on_disk.status == WorkspaceStatus.ACTIVE
+
+    def test_refresh_ignores_file_older_than_local_write(self, tmp_path):
+        reg = WorkspaceRegistry(str(tmp_path))
+        ws = reg.create_workspace(
+            name="mine", owner_type=OwnerType.USER, owner_id="u1",
+        )
+        stale = ws.model_copy(update={"status": WorkspaceStatus.SUSPENDED})
+        path = reg._path(ws.id)
+        mtime_ns = os.stat(path).st_mtime_ns
+        with open(path, "w") as f:
+            f.write(stale.model_dump_json())
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+        reg._refresh(ws.id)
+        assert reg.get_workspace(ws.id) is ws
+
+    def test_refresh_skips_parse_when_file_unchanged(self, tmp_path):
+        WorkspaceRegistry(str(tmp_path)).create_workspace(
+            name="steady", owner_type=OwnerType.USER, owner_id="u1",
+            workspace_id="ws_steady",
+        )
+        reg = WorkspaceRegistry(str(tmp_path))
+        assert reg.get_workspace("ws_steady") is not None
+        with patch.object(reg, "_read") as read:
+            reg._refresh("ws_steady")
+        read.assert_not_called()
+
     def test_default_workspace(self, tmp_path):
         reg = WorkspaceRegistry(str(tmp_path))
         ws = reg.get_default_workspace()